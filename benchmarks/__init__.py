@@ -0,0 +1 @@
+"""Microbenchmarks, run with ``python -m benchmarks.<module>``."""
@@ -0,0 +1,87 @@
+"""
+Benchmark of the RequestType classifier.
+
+Compares the precompiled prefix-dispatch classifier (``get_type`` and
+``classify_many``) with the previous implementation, which built the
+pattern dictionary and tried every pattern in order on each call.
+
+Usage:
+    python -m benchmarks.bench_classifier [--count N] [--repeat R]
+"""
+
+import argparse
+import random
+import timeit
+
+from entities.request_type import RequestType
+from exceptions import InvalidRequestError
+
+NAMES = ["Jose", "Maria", "Antonio", "Silva", "Souza", "Ferreira"]
+
+
+def make_request(rng: random.Random) -> str:
+    """Return a random request of a random type."""
+    digits = "".join(rng.choices("0123456789", k=20))
+    name = " ".join(rng.sample(NAMES, 3))
+    return rng.choice(
+        [
+            f"{digits[:7]}-{digits[7:9]}.{digits[9:13]}.8.14.{digits[16:]}",
+            digits,
+            f"{digits[:3]}.{digits[3:6]}.{digits[6:9]}-{digits[9:11]}",
+            digits[:14],
+            f"OAB:{digits[:5]}PA",
+            f"INQ:2026.{digits[:5]}",
+            name,
+            f'"{name}"',
+            rng.choice(NAMES),
+        ]
+    )
+
+
+def legacy_get_type(request: str) -> RequestType:
+    """The classifier before precompilation and prefix dispatch."""
+    request = request.strip()
+    patterns = RequestType._get_patterns()
+    for request_type in RequestType:
+        if patterns.get(request_type).match(request):
+            return request_type
+    raise InvalidRequestError(request)
+
+
+def classify_each(classify, requests):
+    """Classify every request, ignoring invalid ones."""
+    for request in requests:
+        try:
+            classify(request)
+        except InvalidRequestError:
+            pass
+
+
+def main(argv=None):
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(0)
+    requests = [make_request(rng) for _ in range(args.count)]
+    cases = {
+        "legacy get_type": lambda: classify_each(legacy_get_type, requests),
+        "get_type": lambda: classify_each(RequestType.get_type, requests),
+        "classify_many": lambda: RequestType.classify_many(requests),
+    }
+
+    print(f"Classifying {args.count} requests (best of {args.repeat})")
+    baseline = None
+    for name, case in cases.items():
+        best = min(timeit.repeat(case, number=1, repeat=args.repeat))
+        baseline = baseline or best
+        print(
+            f"{name:>16}: {best * 1000:8.1f} ms "
+            f"{args.count / best:12,.0f} req/s {baseline / best:6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Throughput benchmark of the CSV exporters.
+
+Exports the same processes with a one-row pandas DataFrame per process
+(the previous ``CSVExporter``), with the ``csv`` module ``CSVExporter``
+(one file per process) and with ``ConsolidatedCSVExporter`` (a single
+buffered file).
+
+Usage:
+    python -m benchmarks.bench_csv_export [--count N] [--movements M]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.bench_serialization import make_process
+from services.exporters.csv_exporter import (
+    CSVExporter,
+    ConsolidatedCSVExporter,
+)
+
+
+def export_with_pandas(processes, directory: str) -> None:
+    """The CSV export before the ``csv`` module exporter."""
+    import pandas as pd
+
+    for i, process in enumerate(processes):
+        df = pd.DataFrame([process.to_csv_export()])
+        df.to_csv(
+            os.path.join(directory, f"{i}.csv"),
+            index=False,
+            encoding="utf-8-sig",
+        )
+
+
+def export_per_file(processes, directory: str) -> None:
+    """One file per process with the ``csv`` module."""
+    exporter = CSVExporter(export_path=directory)
+    for i, process in enumerate(processes):
+        exporter.export(process, str(i))
+
+
+def export_consolidated(processes, directory: str) -> None:
+    """A single consolidated file."""
+    path = os.path.join(directory, "processes.csv")
+    with ConsolidatedCSVExporter(path=path) as exporter:
+        for process in processes:
+            exporter.export(process)
+
+
+def main(argv=None):
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--count", type=int, default=2_000)
+    parser.add_argument("--movements", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    processes = [make_process(args.movements) for _ in range(args.count)]
+    for process in processes:
+        process.to_csv_export()  # serialization is not what is measured
+    import pandas  # noqa: F401  (import time is not measured either)
+
+    cases = {
+        "pandas per file": export_with_pandas,
+        "csv per file": export_per_file,
+        "csv consolidated": export_consolidated,
+    }
+    print(f"Exporting {args.count} processes to CSV")
+    baseline = None
+    for name, export in cases.items():
+        with tempfile.TemporaryDirectory() as directory:
+            start = time.perf_counter()
+            export(processes, directory)
+            elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(
+            f"{name:>17}: {elapsed * 1000:8.1f} ms "
+            f"{args.count / elapsed:10,.0f} processes/s "
+            f"{baseline / elapsed:6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
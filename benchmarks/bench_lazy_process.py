@@ -0,0 +1,91 @@
+"""
+Benchmark of LazyProcess against the eager Process.from_dict.
+
+Builds the processes of a simulated party-name search and times three
+workloads for both models: building every process, filtering on the
+process number and exporting every process to a dictionary.
+
+Usage:
+    python -m benchmarks.bench_lazy_process [--count N] [--repeat R]
+"""
+
+import argparse
+import random
+import timeit
+from typing import Any, Dict
+
+from models.lazy_process import LazyProcess
+from models.process import Process
+
+CLASSES = ["Procedimento Comum Cível", "Execução Fiscal", "Inventário"]
+TOPICS = ["Indenização por Dano Moral", "IPTU", "Obrigação de Fazer"]
+COURTS = [f"{n}ª Vara Cível de Belém" for n in range(1, 16)]
+NAMES = ["Jose", "Maria", "Antonio", "Silva", "Souza", "Ferreira"]
+
+
+def make_process(rng: random.Random, i: int) -> Dict[str, Any]:
+    """Return an API-like process dictionary."""
+    number = f"{i:07d}{rng.randrange(100):02d}{rng.randrange(2000, 2027)}"
+    number += f"814{rng.randrange(1, 1000):04d}"
+    return {
+        "numero": number,
+        "numeroFormatado": number,
+        "classe": rng.choice(CLASSES),
+        "assunto": rng.choice(TOPICS),
+        "comarca": "Belém",
+        "competencia": "Cível",
+        "cdDocProcesso": str(i),
+        "instancia": "1º Grau",
+        "cdInstancia": "1",
+        "situacao": "Em andamento",
+        "vara": rng.choice(COURTS),
+        "numeroInqueritoPolicial": "",
+        "valorCausaFormatado": f"R$ {rng.randrange(100000)},00",
+        "dataAutuacaoFormatada": f"{rng.randrange(1, 29):02d}/01/2026",
+        "segredoJustica": "Não",
+        "dataDistribuicaoFormatada": f"{rng.randrange(1, 29):02d}/01/2026",
+        "partes": [
+            {"nome": " ".join(rng.sample(NAMES, 3)), "tipo": tipo}
+            for tipo in ("Autor", "Réu", "Advogado")
+        ],
+    }
+
+
+def main(argv=None):
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(0)
+    results = [make_process(rng, i) for i in range(args.count)]
+    workloads = {
+        "build": lambda build: [build(data) for data in results],
+        "filter number": lambda build: [
+            process
+            for process in map(build, results)
+            if process.number[9:13] == "2026"
+        ],
+        "to_dict": lambda build: [build(data).to_dict() for data in results],
+    }
+
+    print(f"{args.count} processes of a name search (best of {args.repeat})")
+    for name, workload in workloads.items():
+        timings = [
+            min(
+                timeit.repeat(
+                    lambda: workload(build), number=1, repeat=args.repeat
+                )
+            )
+            for build in (Process.from_dict, LazyProcess)
+        ]
+        eager, lazy = timings
+        print(
+            f"{name:>14}: eager {eager * 1000:8.1f} ms, "
+            f"lazy {lazy * 1000:8.1f} ms ({eager / lazy:4.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
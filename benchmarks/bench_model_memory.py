@@ -0,0 +1,119 @@
+"""
+Memory benchmark of the Movement and Process models.
+
+Builds movements and processes from API-like dictionaries and reports the
+bytes allocated per instance for the slotted models and for equivalent
+plain dataclasses (the previous implementation).
+
+Usage:
+    python -m benchmarks.bench_model_memory [--count N]
+"""
+
+import argparse
+import gc
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import List
+
+from models.movement import Movement
+from models.party import Party
+from models.process import Process
+
+
+@dataclass
+class LegacyMovement:
+    """Movement before the slotted model."""
+
+    date: str
+    description: str
+
+
+@dataclass
+class LegacyParty:
+    """Party before the slotted model."""
+
+    name: str
+    party_type: str
+
+
+@dataclass
+class LegacyProcess:
+    """Process before the slotted model."""
+
+    formatted_number: str
+    number: str
+    class_: str
+    topic: str
+    cd_doc_process: str
+    cd_instance: str
+    parties: List[LegacyParty]
+    movements: List[LegacyMovement] = field(default_factory=list)
+    jurisdiction: str = ""
+    competence: str = ""
+    instance: str = ""
+    situation: str = ""
+    court: str = ""
+    police_inquiry: str = ""
+    cause_value: str = ""
+    citation_date: str = ""
+    justice_secret: str = ""
+    distribution_date: str = ""
+
+
+def measure(factory, count: int) -> float:
+    """Return the bytes allocated per object created by ``factory``."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return (after - before) / count
+
+
+def main(argv=None):
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--count", type=int, default=200_000)
+    args = parser.parse_args(argv)
+
+    # Values are shared across instances so only the objects are measured
+    dates = [f"{d % 28 + 1:02d}/01/2026" for d in range(28)]
+    description = "Juntada de petição"
+    numbers = [f"{i:020d}" for i in range(args.count)]
+
+    cases = [
+        (
+            "Movement",
+            lambda i: LegacyMovement(dates[i % 28], description),
+            lambda i: Movement(dates[i % 28], description),
+        ),
+        (
+            "Party",
+            lambda i: LegacyParty(description, "Autor"),
+            lambda i: Party(description, "Autor"),
+        ),
+        (
+            "Process",
+            lambda i: LegacyProcess(
+                numbers[i], numbers[i], "", "", "1", "1", []
+            ),
+            lambda i: Process(
+                numbers[i], numbers[i], "", "", "1", "1", [], []
+            ),
+        ),
+    ]
+
+    print(f"Bytes per instance ({args.count} instances)")
+    for name, legacy, slotted in cases:
+        before = measure(legacy, args.count)
+        after = measure(slotted, args.count)
+        print(
+            f"{name:>9}: {before:7.1f} -> {after:7.1f} "
+            f"({100 * (before - after) / before:4.1f}% less)"
+        )
+
+
+if __name__ == "__main__":
+    main()
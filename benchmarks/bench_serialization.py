@@ -0,0 +1,81 @@
+"""
+Benchmark of the memoized Process serialization.
+
+Simulates the calls of an export pipeline on processes with large
+movement lists (JSON export, CSV export, hashing and a downstream
+consumer) and compares the memoized ``to_dict``/``to_csv_export`` with
+rebuilding the serialized forms on every call (the previous behavior).
+
+Usage:
+    python -m benchmarks.bench_serialization [--movements N] [--repeat R]
+"""
+
+import argparse
+import timeit
+
+from models.movement import Movement
+from models.party import Party
+from models.process import Process
+
+
+def make_process(movements: int) -> Process:
+    """Return a process with the given number of movements."""
+    return Process(
+        formatted_number="0801234-56.2026.8.14.0301",
+        number="08012345620268140301",
+        class_="Procedimento Comum Cível",
+        topic="Indenização por Dano Moral",
+        cd_doc_process="1",
+        cd_instance="1",
+        parties=[Party(f"Parte {i}", "Autor") for i in range(10)],
+        movements=[
+            Movement(f"{i % 28 + 1:02d}/01/2026", f"Movimento {i % 200}")
+            for i in range(movements)
+        ],
+    )
+
+
+def pipeline(to_dict, to_csv_export) -> None:
+    """The serialization calls made for one exported process."""
+    to_dict()
+    to_csv_export()
+    to_dict()
+    to_dict()
+
+
+def main(argv=None):
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--movements", type=int, nargs="+", default=[100, 1_000, 10_000]
+    )
+    args = parser.parse_args(argv)
+
+    print(f"Serialization calls per process (best of {args.repeat})")
+    for count in args.movements:
+        process = make_process(count)
+        cases = {
+            "rebuilt": lambda: pipeline(
+                process.__build_dict__, process.__build_csv_export__
+            ),
+            "memoized": lambda: pipeline(
+                process.to_dict, process.to_csv_export
+            ),
+        }
+        rebuilt, memoized = (
+            min(timeit.repeat(case, number=1, repeat=args.repeat))
+            for case in cases.values()
+        )
+        # The first memoized run fills the cache, later runs only check it
+        process._serialized = None
+        cold = timeit.timeit(cases["memoized"], number=1)
+        print(
+            f"{count:>7} movements: rebuilt {rebuilt * 1000:8.2f} ms, "
+            f"memoized {cold * 1000:8.2f} ms first / "
+            f"{memoized * 1000:8.3f} ms cached"
+        )
+
+
+if __name__ == "__main__":
+    main()
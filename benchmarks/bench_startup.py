@@ -0,0 +1,105 @@
+"""
+Startup-time benchmark of the CLI.
+
+Imports ``main`` in fresh interpreters with ``python -X importtime`` and
+reports the cumulative import time of the best run, the slowest modules and
+any module that should only be imported on use (pandas, numpy,
+``multiprocessing`` and the services of the estimate, monitor, queue and
+sharded export modes). With ``--max-ms`` it exits with an error when the
+import takes longer or a deferred module is loaded, so it can guard against
+regressions.
+
+Usage:
+    python -m benchmarks.bench_startup [--runs N] [--top N] [--max-ms MS]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFERRED_MODULES = (
+    "pandas",
+    "numpy",
+    "multiprocessing",
+    "services.estimate_service",
+    "services.monitor_service",
+    "services.queue_worker",
+    "services.sharded_export_service",
+    "storage.work_queue",
+)
+"""Modules only imported by the modes or code paths that use them."""
+
+
+def import_times(module: str = "main") -> Dict[str, Tuple[int, int]]:
+    """
+    Import a module in a fresh interpreter with ``-X importtime``.
+
+    Args:
+        module: The module to import
+
+    Returns:
+        Self and cumulative import time (microseconds) of every module
+        imported, by name
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        own, cumulative, name = line[len("import time:") :].split("|")
+        if not own.strip().isdigit():
+            continue  # the header line
+        times[name.strip()] = (int(own), int(cumulative))
+    return times
+
+
+def slowest(times: Dict[str, Tuple[int, int]], top: int) -> List[str]:
+    """Return the names of the ``top`` modules with the highest self time."""
+    return sorted(times, key=lambda name: times[name][0], reverse=True)[:top]
+
+
+def main(argv=None):
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--module", default="main")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument(
+        "--max-ms",
+        type=float,
+        default=None,
+        help="Fail above this import time or if a deferred module loads",
+    )
+    args = parser.parse_args(argv)
+
+    runs = [import_times(args.module) for _ in range(args.runs)]
+    best = min(runs, key=lambda times: times[args.module][1])
+    total = best[args.module][1] / 1000
+
+    print(f"import {args.module}: best of {args.runs} runs {total:.1f} ms")
+    print(f"{'self ms':>9} {'cumul. ms':>10}  module")
+    for name in slowest(best, args.top):
+        own, cumulative = best[name]
+        print(f"{own / 1000:9.1f} {cumulative / 1000:10.1f}  {name}")
+
+    loaded = [name for name in DEFERRED_MODULES if name in best]
+    if loaded:
+        print(f"Deferred modules imported on startup: {', '.join(loaded)}")
+    if args.max_ms is not None and (loaded or total > args.max_ms):
+        if total > args.max_ms:
+            print(f"Startup above the {args.max_ms:.0f} ms budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,24 +2,75 @@
 
 import json
 import random
+import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 from urllib.error import HTTPError, URLError
 from urllib.request import Request, urlopen
 
+from client.page_size_tuner import RequestInfo
+from client.priority_scheduler import PriorityScheduler
 from config import ScraperConfig
 from exceptions import ApiConnectionError, ApiResponseError
+from utils.rate_limiter import TokenBucket
 from utils.retry import retry
 
 
+@dataclass
+class RequestStats:
+    """
+    Thread-safe counters of the requests answered by the API.
+
+    Attributes:
+        requests: Number of responses received
+        bytes_received: Total size of the response bodies
+        elapsed: Total seconds spent waiting for responses
+    """
+
+    requests: int = 0
+    bytes_received: int = 0
+    elapsed: float = 0.0
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+
+    def record(self, size: int, elapsed: float) -> None:
+        """Account for a response of ``size`` bytes."""
+        with self._lock:
+            self.requests += 1
+            self.bytes_received += size
+            self.elapsed += elapsed
+
+    def snapshot(self) -> "RequestStats":
+        """Return a copy of the current counters."""
+        with self._lock:
+            return RequestStats(
+                requests=self.requests,
+                bytes_received=self.bytes_received,
+                elapsed=self.elapsed,
+            )
+
+
 @dataclass
 class ApiClient:
     """
     Client to handle API requests.
+
+    When a ``budget`` is given, every request (including retries) takes a
+    token from it, which caps the request rate shared by all its users.
+    When a ``scheduler`` is given, each request first waits for a slot in
+    the lane of the calling thread. Every response is accounted in
+    ``stats``.
     """
 
     config: ScraperConfig
+    budget: TokenBucket = None
+    scheduler: PriorityScheduler = None
+    stats: RequestStats = field(default_factory=RequestStats)
+    _local: threading.local = field(
+        default_factory=threading.local, init=False, repr=False
+    )
 
     @retry(
         max_attempts=3,
@@ -32,7 +83,15 @@ class ApiClient:
         Perform a GET request to the specified URL and return the JSON response
         """
         full_url = f"{self.config.base_url}{self.config.base_api_route}{url}"
+        if self.scheduler is None:
+            return self._request(full_url)
+        with self.scheduler.slot():
+            return self._request(full_url)
+
+    def _request(self, full_url: str) -> Any:
+        """Wait for the rate limit and perform the request."""
         self._wait()
+        started = time.monotonic()
         try:
             request = Request(
                 full_url,
@@ -44,8 +103,11 @@ class ApiClient:
                 request, timeout=self.config.request_timeout
             ) as request_response:
                 if request_response.getcode() == 204:
+                    self._track(0, time.monotonic() - started)
                     return []
-                return json.loads(request_response.read().decode("utf-8"))
+                body = request_response.read()
+                self._track(len(body), time.monotonic() - started)
+                return json.loads(body.decode("utf-8"))
         except HTTPError as e:
             raise ApiConnectionError(
                 f"HTTP Error {e.code}: {e.reason}",
@@ -53,6 +115,8 @@ class ApiClient:
                 status_code=e.code,
             ) from e
         except URLError as e:
+            if isinstance(e.reason, TimeoutError):
+                self._request_info().timeouts += 1
             raise ApiConnectionError(
                 f"Connection failed: {e.reason}",
                 url=full_url,
@@ -60,13 +124,39 @@ class ApiClient:
         except json.JSONDecodeError as e:
             raise ApiResponseError(f"Invalid JSON response: {e}") from e
         except TimeoutError:
+            self._request_info().timeouts += 1
             raise ApiConnectionError(
                 f"Request timed out after {self.config.request_timeout}s",
                 url=full_url,
             ) from None
 
+    def take_request_info(self) -> RequestInfo:
+        """
+        Return the cost of the requests made by the calling thread since
+        its previous call, and start counting again.
+        """
+        info = self._request_info()
+        self._local.info = RequestInfo()
+        return info
+
+    def _request_info(self) -> RequestInfo:
+        """Return the request info of the calling thread."""
+        info = getattr(self._local, "info", None)
+        if info is None:
+            info = self._local.info = RequestInfo()
+        return info
+
+    def _track(self, size: int, elapsed: float) -> None:
+        """Account for a response in the global and thread stats."""
+        self.stats.record(size, elapsed)
+        info = self._request_info()
+        info.size = size
+        info.elapsed = elapsed
+
     def _wait(self) -> None:
         """Apply rate limiting with random delay."""
+        if self.budget is not None:
+            self.budget.acquire()
         wait_time = random.uniform(
             self.config.min_wait_time,
             self.config.max_wait_time,
@@ -0,0 +1,164 @@
+"""Per-endpoint page size tuning from observed request cost."""
+
+import threading
+from dataclasses import dataclass, field
+from logging import getLogger
+from typing import Any, Dict
+
+from utils.file_utils import load_json, write_json_atomic
+
+logger = getLogger("tjpa_scraper")
+
+
+@dataclass
+class RequestInfo:
+    """
+    Cost of the requests made by a thread since it last asked for it.
+
+    Attributes:
+        size: Size of the last response body
+        elapsed: Seconds spent waiting for the last response
+        timeouts: Number of requests that timed out
+    """
+
+    size: int = 0
+    elapsed: float = 0.0
+    timeouts: int = 0
+
+
+@dataclass
+class EndpointState:
+    """Tuning state of an endpoint."""
+
+    page_size: int
+    latency: float = None
+    size: float = None
+    samples: int = 0
+    timeouts: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for the tuning file."""
+        return {"page_size": self.page_size, "timeouts": self.timeouts}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "EndpointState":
+        """Create an EndpointState from its stored dictionary."""
+        return cls(
+            page_size=data["page_size"], timeouts=data.get("timeouts", 0)
+        )
+
+
+@dataclass
+class PageSizeTuner:
+    """
+    Chooses the page size of each paginated endpoint.
+
+    Every page request is reported with its page size, number of records,
+    response time, response size and timeouts. A timeout halves the page
+    size of the endpoint. Pages slower than ``target_seconds`` or larger
+    than ``max_bytes`` (on average) shrink it by a quarter, while full
+    pages that are consistently fast and small double it, so large result
+    sets take fewer round-trips. Observations of an outdated page size
+    are ignored. The chosen sizes are written to ``path`` whenever they
+    change and reused by later runs.
+    """
+
+    path: str = None
+    initial: int = 1000
+    min_size: int = 50
+    max_size: int = 5000
+    target_seconds: float = 5.0
+    max_bytes: int = 5_000_000
+    min_samples: int = 3
+    smoothing: float = 0.3
+    _endpoints: Dict[str, EndpointState] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+
+    def __post_init__(self):
+        if self.path:
+            stored = load_json(self.path, default={})
+            for endpoint, data in stored.items():
+                self._endpoints[endpoint] = EndpointState.from_dict(data)
+
+    def page_size(self, endpoint: str) -> int:
+        """Return the page size to use for ``endpoint``."""
+        with self._lock:
+            return self.__state__(endpoint).page_size
+
+    def observe(
+        self,
+        endpoint: str,
+        page_size: int,
+        records: int,
+        info: RequestInfo,
+    ) -> None:
+        """
+        Report the cost of a page request.
+
+        Args:
+            endpoint: The endpoint the page was requested from
+            page_size: Page size of the request
+            records: Number of records returned
+            info: Response time, size and timeouts of the request
+        """
+        with self._lock:
+            state = self.__state__(endpoint)
+            if page_size != state.page_size:
+                return
+            if info.timeouts:
+                state.timeouts += info.timeouts
+                self.__resize__(endpoint, state, state.page_size // 2)
+                return
+            state.latency = self.__smooth__(state.latency, info.elapsed)
+            state.size = self.__smooth__(state.size, info.size)
+            state.samples += 1
+            if state.samples < self.min_samples:
+                return
+            if (
+                state.latency > self.target_seconds
+                or state.size > self.max_bytes
+            ):
+                self.__resize__(endpoint, state, state.page_size * 3 // 4)
+            elif (
+                records >= page_size
+                and state.latency < self.target_seconds / 2
+                and state.size < self.max_bytes / 2
+            ):
+                self.__resize__(endpoint, state, state.page_size * 2)
+
+    def __state__(self, endpoint: str) -> EndpointState:
+        state = self._endpoints.get(endpoint)
+        if state is None:
+            state = EndpointState(page_size=self.initial)
+            self._endpoints[endpoint] = state
+        return state
+
+    def __smooth__(self, average: float, value: float) -> float:
+        if average is None:
+            return value
+        return average + self.smoothing * (value - average)
+
+    def __resize__(
+        self, endpoint: str, state: EndpointState, page_size: int
+    ) -> None:
+        page_size = max(self.min_size, min(self.max_size, page_size))
+        if page_size == state.page_size:
+            return
+        logger.info(
+            "Page size of %s changed from %d to %d",
+            endpoint,
+            state.page_size,
+            page_size,
+        )
+        state.page_size = page_size
+        state.latency = state.size = None
+        state.samples = 0
+        if self.path:
+            write_json_atomic(
+                self.path,
+                {name: s.to_dict() for name, s in self._endpoints.items()},
+            )
@@ -0,0 +1,129 @@
+"""Priority scheduler that shares the request budget between lanes."""
+
+import threading
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Deque, Dict, Iterator
+
+from entities.request_type import RequestType
+
+
+class Lane(Enum):
+    """Scheduling lanes of API requests."""
+
+    INTERACTIVE = "interactive"
+    BULK = "bulk"
+
+    @classmethod
+    def for_request_type(cls, request_type: RequestType) -> "Lane":
+        """Return the default lane of a request type."""
+        if request_type is RequestType.CNJ:
+            return cls.INTERACTIVE
+        return cls.BULK
+
+
+_context = threading.local()
+
+
+def current_lane() -> Lane:
+    """Return the lane of the calling thread (BULK by default)."""
+    return getattr(_context, "lane", Lane.BULK)
+
+
+@contextmanager
+def use_lane(lane: Lane) -> Iterator[None]:
+    """Run the enclosed requests of the calling thread in ``lane``."""
+    previous = getattr(_context, "lane", None)
+    _context.lane = lane
+    try:
+        yield
+    finally:
+        if previous is None:
+            del _context.lane
+        else:
+            _context.lane = previous
+
+
+def default_weights() -> Dict[Lane, int]:
+    """Return the default lane weights."""
+    return {Lane.INTERACTIVE: 4, Lane.BULK: 1}
+
+
+@dataclass
+class PriorityScheduler:
+    """
+    Weighted fair scheduler placed in front of ApiClient requests.
+
+    At most ``max_in_flight`` requests run at once. When several lanes have
+    waiting requests, the next slot goes to the lane with the smallest
+    virtual time, which advances by ``1 / weight`` per request served, so
+    lanes share the request rate in proportion to their weights. Requests
+    inside a lane are served in arrival order.
+    """
+
+    weights: Dict[Lane, int] = field(default_factory=default_weights)
+    max_in_flight: int = 1
+    _waiting: Dict[Lane, Deque[object]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _virtual_time: Dict[Lane, float] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _clock: float = field(default=0.0, init=False, repr=False)
+    _in_flight: int = field(default=0, init=False, repr=False)
+    _condition: threading.Condition = field(
+        default_factory=threading.Condition, init=False, repr=False
+    )
+
+    def __post_init__(self):
+        for lane in Lane:
+            self._waiting[lane] = deque()
+            self._virtual_time[lane] = 0.0
+
+    @contextmanager
+    def slot(self, lane: Lane = None) -> Iterator[None]:
+        """Hold a request slot for the enclosed request."""
+        self.acquire(lane)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def acquire(self, lane: Lane = None) -> None:
+        """Block until a request slot is granted to ``lane``."""
+        lane = lane or current_lane()
+        ticket = object()
+        with self._condition:
+            queue = self._waiting[lane]
+            if not queue:
+                # A lane that was idle must not bank unused share
+                self._virtual_time[lane] = max(
+                    self._virtual_time[lane], self._clock
+                )
+            queue.append(ticket)
+            while not (
+                self._in_flight < self.max_in_flight
+                and self.__next_ticket__() is ticket
+            ):
+                self._condition.wait()
+            queue.popleft()
+            self._in_flight += 1
+            self._clock = self._virtual_time[lane]
+            self._virtual_time[lane] += 1.0 / self.weights.get(lane, 1)
+            self._condition.notify_all()
+
+    def release(self) -> None:
+        """Free a request slot."""
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def __next_ticket__(self) -> object:
+        active = [lane for lane in Lane if self._waiting[lane]]
+        lane = min(
+            active,
+            key=lambda l: (self._virtual_time[l], -self.weights.get(l, 1)),
+        )
+        return self._waiting[lane][0]
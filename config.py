@@ -14,9 +14,43 @@ class ScraperConfig:
     default_page_number: int = 1
     csv_export_path: str = field(default_factory=lambda: "csv_exports")
     json_export_path: str = field(default_factory=lambda: "json_exports")
+    store_descriptions: bool = False
+    description_store_path: str = "descriptions.sqlite3"
     request_timeout: int = 30
+    page_size_path: str = "page_sizes.json"
+    min_page_size: int = 50
+    max_page_size: int = 5000
+    page_target_seconds: float = 5.0
+    columnar_movements_threshold: int = 5000
     min_wait_time: float = 1.0
     max_wait_time: float = 3.0
+    presearch_cache_path: str = "presearch_cache.json"
+    presearch_cache_ttl: float = 86400.0
+    presearch_cache_max_entries: int = 5000
+    batch_max_concurrency: int = 4
+    batch_summary_path: str = "batch_summaries"
+    consolidated_export_path: str = "consolidated_exports"
+    sharded_export_chunk_size: int = 500
+    estimate_sample_size: int = 3
+    estimate_max_presearch_probes: int = 10
+    work_queue_lease_seconds: float = 300.0
+    work_queue_max_attempts: int = 5
+    interactive_lane_weight: int = 4
+    bulk_lane_weight: int = 1
+    scheduler_max_in_flight: int = 2
+    process_state_path: str = "process_state.json"
+    monitor_requests_per_hour: float = 1800.0
+    monitor_activity_tiers: tuple = (
+        (7, 3600.0),
+        (30, 21600.0),
+        (180, 86400.0),
+    )
+    monitor_max_interval: float = 604800.0
+    monitor_archived_interval: float = 2592000.0
+    monitor_search_interval: float = 86400.0
+    monitor_schedule_path: str = "monitor_schedule.json"
+    monitor_output_path: str = "monitor_new_movements.jsonl"
+    monitor_state_path: str = "monitor_state.json"
     user_agent: str = (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
         "AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -0,0 +1,90 @@
+"""
+Module defining the CNJ class.
+
+Unified process number of the Brazilian courts (CNJ Resolution 65/2008),
+in the ``NNNNNNN-DD.AAAA.J.TR.OOOO`` form.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from utils.identifiers import cnj_check_digits, only_digits
+
+
+@dataclass(frozen=True, slots=True, order=True)
+class CNJ:
+    """
+    Parsed CNJ number.
+
+    Instances are immutable, hashable and sort by year, origin and
+    sequence, so processes can be indexed or partitioned by year or origin
+    without slicing the number again.
+
+    Attributes:
+        year: Filing year (``AAAA``)
+        origin: Originating court unit (``OOOO``)
+        sequence: Sequential number of the unit in the year (``NNNNNNN``)
+        segment: Justice segment (``J``), 8 for state courts
+        tribunal: Tribunal of the segment (``TR``), 14 for TJPA
+        check_digits: Mod 97 check digits (``DD``)
+    """
+
+    year: int
+    origin: int
+    sequence: int
+    segment: int
+    tribunal: int
+    check_digits: int
+
+    @classmethod
+    def parse(cls, value: str) -> "CNJ":
+        """
+        Parse a CNJ number, masked or as 20 digits.
+
+        Raises:
+            ValueError: If the value does not have 20 digits
+        """
+        digits = only_digits(value or "")
+        if len(digits) != 20:
+            raise ValueError(f"Invalid CNJ number: '{value}'")
+        return cls(
+            year=int(digits[9:13]),
+            origin=int(digits[16:20]),
+            sequence=int(digits[0:7]),
+            segment=int(digits[13]),
+            tribunal=int(digits[14:16]),
+            check_digits=int(digits[7:9]),
+        )
+
+    @classmethod
+    def try_parse(cls, value: str) -> Optional["CNJ"]:
+        """Parse a CNJ number, returning None if it is malformed."""
+        try:
+            return cls.parse(value)
+        except ValueError:
+            return None
+
+    @property
+    def digits(self) -> str:
+        """The number as 20 digits."""
+        return (
+            f"{self.sequence:07d}{self.check_digits:02d}{self.year:04d}"
+            f"{self.segment}{self.tribunal:02d}{self.origin:04d}"
+        )
+
+    @property
+    def formatted(self) -> str:
+        """The number in the ``NNNNNNN-DD.AAAA.J.TR.OOOO`` form."""
+        return (
+            f"{self.sequence:07d}-{self.check_digits:02d}.{self.year:04d}."
+            f"{self.segment}.{self.tribunal:02d}.{self.origin:04d}"
+        )
+
+    @property
+    def is_valid(self) -> bool:
+        """Whether the check digits match the rest of the number."""
+        digits = self.digits
+        return digits[7:9] == cnj_check_digits(digits)
+
+    def __str__(self):
+        return self.formatted
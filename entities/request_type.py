@@ -6,9 +6,22 @@ Identify and handle different types of legal process requests.
 
 import re
 from enum import Enum
+from typing import Iterable, List, Optional
 from urllib.parse import quote
 
-from exceptions import InvalidRequestError
+from exceptions import InvalidIdentifierError, InvalidRequestError
+from utils.identifiers import (
+    CNJ_CHECK_DIGITS,
+    CNPJ_CHECK_DIGITS,
+    CPF_CHECK_DIGITS,
+    format_cnj,
+    is_valid_cnj,
+    is_valid_cnpj,
+    is_valid_cpf,
+    only_digits,
+)
+
+DEFAULT_PAGE_SIZE = 1000
 
 
 class RequestType(Enum):
@@ -82,13 +95,11 @@ class RequestType(Enum):
         if not request:
             raise InvalidRequestError("A busca não pode estar vazia.")
 
-        patterns = cls._get_patterns()
-
-        for request_type in RequestType:
-            if patterns.get(request_type).match(request):
-                return request_type
+        request_type = _classify(request)
+        if request_type is not None:
+            return request_type
 
-        if patterns.get("SINGLE_NAME").match(request):
+        if _PATTERNS["SINGLE_NAME"].match(request):
             raise InvalidRequestError(
                 "Nome da Parte deve conter ao menos um sobrenome."
             )
@@ -98,6 +109,65 @@ class RequestType(Enum):
             "Formatos aceitos: CNJ, CPF, CNPJ, OAB, Nome da Parte, Inquérito."
         )
 
+    @classmethod
+    def classify_many(
+        cls, requests: Iterable[str]
+    ) -> List[Optional["RequestType"]]:
+        """
+        Identify the type of many requests at once.
+
+        Args:
+            requests: The search query strings
+
+        Returns:
+            The RequestType of each request, or None if it is not valid
+        """
+        result = []
+        cache = {}
+        for request in requests:
+            request = request.strip()
+            if request not in cache:
+                cache[request] = _classify(request) if request else None
+            result.append(cache[request])
+        return result
+
+    def normalize(self, request: str) -> str:
+        """
+        Validate a request of this type and return its canonical form.
+
+        CNJ numbers are checked with their mod 97 check digits and returned
+        as ``NNNNNNN-DD.AAAA.J.TR.OOOO``; CPF and CNPJ numbers are checked
+        with their verifier digits and returned as digits only. Other
+        requests are only stripped.
+
+        Raises:
+            InvalidIdentifierError: If the check digits do not match
+        """
+        request = request.strip()
+        match self:
+            case RequestType.CNJ:
+                if not is_valid_cnj(request):
+                    raise InvalidIdentifierError(
+                        f"Dígito verificador do CNJ inválido: '{request}'.",
+                        reason=CNJ_CHECK_DIGITS,
+                    )
+                return format_cnj(request)
+            case RequestType.CPF:
+                if not is_valid_cpf(request):
+                    raise InvalidIdentifierError(
+                        f"Dígito verificador do CPF inválido: '{request}'.",
+                        reason=CPF_CHECK_DIGITS,
+                    )
+                return only_digits(request)
+            case RequestType.CNPJ:
+                if not is_valid_cnpj(request):
+                    raise InvalidIdentifierError(
+                        f"Dígito verificador do CNPJ inválido: '{request}'.",
+                        reason=CNPJ_CHECK_DIGITS,
+                    )
+                return only_digits(request)
+        return request
+
     def get_route_by_type(self) -> str:
         """Get the API route corresponding to the request type."""
         match self:
@@ -134,8 +204,8 @@ class RequestType(Enum):
         if self in [RequestType.NOME_PARTE, RequestType.NOME_PARTE_EXATO]:
             request_data = quote(request_data)
         if self not in [RequestType.NOME_PARTE, RequestType.CNJ]:
-            page_number = 1
-            page_size = 1000
+            page_number = page_number or 1
+            page_size = page_size or DEFAULT_PAGE_SIZE
         if self in [RequestType.CPF, RequestType.CNPJ]:
             request_data = re.sub(r"[^\d]", "", request_data)
         url = f"{route}{request_data}"
@@ -152,3 +222,48 @@ class RequestType(Enum):
         if page_size:
             url += f"/{page_size}"
         return url
+
+
+_PATTERNS = RequestType._get_patterns()
+_NAME_TYPES = (RequestType.NOME_PARTE,)
+_OAB_TYPES = (RequestType.NOME_PARTE, RequestType.OAB)
+_DIGIT_TYPES = (RequestType.CNJ, RequestType.CPF, RequestType.CNPJ)
+_QUOTED_TYPES = (RequestType.NOME_PARTE_EXATO,)
+_INQ_TYPES = (RequestType.INQ,)
+
+
+def _candidates(request: str) -> tuple:
+    """
+    Return the request types a stripped, non-empty request can match.
+
+    Only CNJ, CPF and CNPJ start with a digit, only exact names start with
+    a quote and OAB and inquiry numbers have fixed prefixes, so a single
+    look at the start of the request leaves one to three patterns to try,
+    in the same order as the full scan.
+    """
+    first = request[0]
+    if "0" <= first <= "9":
+        return _DIGIT_TYPES
+    if first == '"':
+        return _QUOTED_TYPES
+    prefix = request[:4].lower()
+    if prefix == "inq:":
+        return _INQ_TYPES
+    if prefix.startswith("oab"):
+        return _OAB_TYPES
+    return _NAME_TYPES
+
+
+def _classify(request: str) -> Optional[RequestType]:
+    """Return the type of a stripped, non-empty request, if any."""
+    for request_type in _candidates(request):
+        if _PATTERNS[request_type].match(request):
+            return request_type
+    if request[:4].isascii():
+        return None
+    # A non-ASCII start (e.g. "İ" or "ı", which case-fold into "oab" or
+    # "inq:") may still match a pattern outside the candidates
+    for request_type in RequestType:
+        if _PATTERNS[request_type].match(request):
+            return request_type
+    return None
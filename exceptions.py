@@ -9,6 +9,14 @@ class InvalidRequestError(ScraperException):
     """Raised when the request format is invalid."""
 
 
+class InvalidIdentifierError(InvalidRequestError):
+    """Raised when a CNJ, CPF or CNPJ fails its check-digit validation."""
+
+    def __init__(self, message: str, reason: str = None):
+        super().__init__(message)
+        self.reason = reason
+
+
 class ProcessNotFoundError(ScraperException):
     """Raised when no processes are found."""
 
@@ -1,29 +1,415 @@
 """Main scraper script to fetch and export legal process data."""
 
+import argparse
 import os
 import sys
+from datetime import datetime
+from logging import getLogger
 
 from client.api_client import ApiClient
+from client.page_size_tuner import PageSizeTuner
+from client.priority_scheduler import Lane, PriorityScheduler
 from config import ScraperConfig
 from exceptions import (
     InvalidRequestError,
     ProcessNotFoundError,
     ScraperException,
 )
+from services.batch_service import BatchService, read_queries
 from services.export_service import ExportService
 from services.movement_service import MovementService
+from services.process_registry import ProcessRegistry
 from services.process_service import ProcessService
+from storage.journal import Journal
+from storage.presearch_cache import PresearchCache
+from storage.process_state import ProcessStateStore
+from utils.interning import shared_strings
 from utils.logging_config import setup_logging
+from utils.rate_limiter import TokenBucket
 
 base_dir = os.path.dirname(os.path.abspath(__file__))
-logger = setup_logging(base_dir=base_dir)
+logger = getLogger("tjpa_scraper")
 
 
-def main():
-    """Main entry point for the scraper."""
-    if len(sys.argv) > 1:
-        request_data = sys.argv[1]
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Consulta processual do TJPA."
+    )
+    parser.add_argument("query", nargs="?", help="Busca processual")
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Exporta somente os N primeiros processos da busca, exibindo "
+        "cada um assim que fica pronto",
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        help="Arquivo com uma busca por linha (ou CSV); '-' para stdin",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Número máximo de buscas simultâneas no modo batch",
+    )
+    parser.add_argument(
+        "--summary",
+        metavar="FILE",
+        help="Caminho do arquivo de resumo do modo batch",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Exporta os processos do modo batch em N processos, "
+        "particionados pela origem do CNJ",
+    )
+    parser.add_argument(
+        "--store-descriptions",
+        action="store_true",
+        help="Grava cada descrição de movimentação uma única vez em "
+        "data/descriptions.sqlite3 e referencia o id nos JSONs exportados",
+    )
+    parser.add_argument(
+        "--consolidated-csv",
+        action="store_true",
+        help="No modo batch, grava também um único CSV com todos os "
+        "processos exportados",
+    )
+    parser.add_argument(
+        "--journal",
+        metavar="FILE",
+        help="Journal de progresso; reexecutar com o mesmo arquivo retoma "
+        "a execução de onde parou",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Busca somente as movimentações novas de processos já "
+        "exportados",
+    )
+    parser.add_argument(
+        "--monitor",
+        metavar="FILE",
+        help="Monitora continuamente os CNJs do arquivo (um por linha)",
+    )
+    parser.add_argument(
+        "--estimate",
+        action="store_true",
+        help="Estima requisições, bytes e tempo da busca (ou do batch) "
+        "consultando somente a primeira página",
+    )
+    parser.add_argument(
+        "--queue",
+        metavar="DB",
+        help="Fila de trabalho SQLite compartilhada; com --batch apenas "
+        "enfileira as buscas",
+    )
+    parser.add_argument(
+        "--worker",
+        action="store_true",
+        help="Processa as tarefas da fila indicada em --queue",
+    )
+    return parser.parse_args(argv)
+
+
+def build_process_service(
+    config: ScraperConfig,
+    journal: Journal = None,
+    registry: ProcessRegistry = None,
+    state_store: ProcessStateStore = None,
+    refresh: bool = False,
+    budget: TokenBucket = None,
+    scheduler: PriorityScheduler = None,
+    export_service: ExportService = None,
+    presearch_cache: PresearchCache = None,
+) -> ProcessService:
+    """Build the service graph shared by every query of a run."""
+    api_client = ApiClient(config=config, budget=budget, scheduler=scheduler)
+    export_service = export_service or ExportService(
+        config=config, base_dir=base_dir
+    )
+    page_size_tuner = PageSizeTuner(
+        path=os.path.join(base_dir, "data", config.page_size_path),
+        initial=config.default_page_size,
+        min_size=config.min_page_size,
+        max_size=config.max_page_size,
+        target_seconds=config.page_target_seconds,
+    )
+    movement_service = MovementService(
+        api_client=api_client,
+        state_store=state_store,
+        page_size_tuner=page_size_tuner,
+        columnar_threshold=config.columnar_movements_threshold,
+    )
+    presearch_cache = presearch_cache or build_presearch_cache(config)
+    return ProcessService(
+        api_client=api_client,
+        export_service=export_service,
+        movement_service=movement_service,
+        presearch_cache=presearch_cache,
+        journal=journal,
+        registry=registry,
+        refresh=refresh,
+        page_size_tuner=page_size_tuner,
+    )
+
+
+def build_presearch_cache(config: ScraperConfig) -> PresearchCache:
+    """Build the presearch cache of a run (saved by ``main``)."""
+    return PresearchCache(
+        path=os.path.join(base_dir, "data", config.presearch_cache_path),
+        ttl=config.presearch_cache_ttl,
+        max_entries=config.presearch_cache_max_entries,
+    )
+
+
+def read_batch_file(path: str) -> list:
+    """Read the queries of a batch file, or of stdin when path is '-'."""
+    if path == "-":
+        return read_queries(sys.stdin)
+    with open(path, "r", encoding="utf-8-sig") as f:
+        return read_queries(f, csv_format=path.lower().endswith(".csv"))
+
+
+def run_queue(
+    args: argparse.Namespace,
+    config: ScraperConfig,
+    state_store: ProcessStateStore = None,
+    presearch_cache: PresearchCache = None,
+) -> None:
+    """Enqueue batch queries and/or work on a shared SQLite queue."""
+    # The services of a single mode (queue, sharded export, estimate,
+    # monitor) are imported by the function running it, so the other modes
+    # do not pay for them on startup
+    from services.queue_worker import QueueWorker
+    from storage.work_queue import WorkQueue
+
+    queue = WorkQueue(
+        path=args.queue,
+        lease_seconds=config.work_queue_lease_seconds,
+        max_attempts=config.work_queue_max_attempts,
+    )
+    worker = QueueWorker(
+        queue=queue,
+        process_service=build_process_service(
+            config, state_store=state_store, presearch_cache=presearch_cache
+        ),
+    )
+    if args.batch:
+        try:
+            queries = read_batch_file(args.batch)
+        except OSError as e:
+            logger.error("Could not read batch file: %s", e)
+            return
+        added = worker.enqueue_queries(queries)
+        logger.info("Enqueued %d new query task(s)", added)
+    if args.worker:
+        processed = worker.run()
+        logger.info(
+            "Worker %s processed %d task(s). Queue: %s",
+            worker.worker_id,
+            processed,
+            queue.counts(),
+        )
+
+
+def run_batch(
+    args: argparse.Namespace,
+    config: ScraperConfig,
+    journal: Journal = None,
+    state_store: ProcessStateStore = None,
+    presearch_cache: PresearchCache = None,
+) -> None:
+    """Run every query of a batch file through one service graph."""
+    try:
+        queries = read_batch_file(args.batch)
+    except OSError as e:
+        logger.error("Could not read batch file: %s", e)
+        return
+
+    export_service = None
+    sharded = False
+    if args.processes:
+        if journal:
+            # Exports happen later, in worker processes, so the journal would
+            # mark processes as done before their files exist
+            logger.error("--processes cannot be combined with --journal")
+            return
+        from services.sharded_export_service import ShardedExportService
+
+        sharded = True
+        export_service = ShardedExportService(
+            config=config,
+            base_dir=base_dir,
+            shards=args.processes,
+            chunk_size=config.sharded_export_chunk_size,
+        )
+    elif args.consolidated_csv:
+        export_service = ExportService(
+            config=config, base_dir=base_dir, consolidated=True
+        )
+
+    registry = ProcessRegistry()
+    batch_service = BatchService(
+        process_service=build_process_service(
+            config,
+            journal,
+            registry,
+            state_store,
+            args.refresh,
+            scheduler=PriorityScheduler(
+                weights={
+                    Lane.INTERACTIVE: config.interactive_lane_weight,
+                    Lane.BULK: config.bulk_lane_weight,
+                },
+                max_in_flight=config.scheduler_max_in_flight,
+            ),
+            export_service=export_service,
+            presearch_cache=presearch_cache,
+        ),
+        max_concurrency=args.concurrency or config.batch_max_concurrency,
+    )
+    results = batch_service.run(queries)
+    if sharded:
+        csv_path, _ = export_service.close()
+        logger.info("Consolidated export: %s", csv_path)
+    elif export_service:
+        logger.info("Consolidated export: %s", export_service.close())
+
+    summary_path = args.summary or os.path.join(
+        base_dir,
+        "data",
+        config.batch_summary_path,
+        f"batch_{datetime.now():%Y%m%d_%H%M%S}.csv",
+    )
+    batch_service.write_summary(summary_path)
+    failed = sum(1 for result in results if result.status != "ok")
+    logger.info(
+        "Batch finished: %d queries, %d without results, %d process(es) "
+        "shared between queries. Summary: %s",
+        len(results),
+        failed,
+        len(registry.links()),
+        summary_path,
+    )
+    logger.info("Interned strings: %s", shared_strings.stats())
+
+
+def run_estimate(
+    args: argparse.Namespace,
+    config: ScraperConfig,
+    presearch_cache: PresearchCache = None,
+) -> None:
+    """Estimate the cost of the query or batch without running it."""
+    from services.estimate_service import EstimateService
+
+    if args.batch:
+        try:
+            queries = read_batch_file(args.batch)
+        except OSError as e:
+            logger.error("Could not read batch file: %s", e)
+            return
     else:
+        queries = [args.query or input("Digite aqui a sua busca processual: ")]
+
+    estimate_service = EstimateService(
+        process_service=build_process_service(
+            config, presearch_cache=presearch_cache
+        ),
+        config=config,
+    )
+    requests = total_bytes = seconds = 0
+    for query in queries:
+        try:
+            estimate = estimate_service.estimate(query)
+        except (ScraperException, AttributeError) as e:
+            logger.error("Could not estimate %s: %s", query, e)
+            continue
+        logger.info(
+            "Estimate for %s (%s): %d process(es), %d request(s) "
+            "(%d search, %d movement), ~%.1f MB, ~%.1f min",
+            query,
+            estimate.request_type,
+            estimate.processes,
+            estimate.requests,
+            estimate.search_requests,
+            estimate.movement_requests,
+            estimate.expected_bytes / 1e6,
+            estimate.expected_seconds / 60,
+        )
+        requests += estimate.requests
+        total_bytes += estimate.expected_bytes
+        seconds += estimate.expected_seconds
+    if len(queries) > 1:
+        logger.info(
+            "Estimate for %d queries: %d request(s), ~%.1f MB, ~%.1f h",
+            len(queries),
+            requests,
+            total_bytes / 1e6,
+            seconds / 3600,
+        )
+
+
+def run_monitor(
+    args: argparse.Namespace,
+    config: ScraperConfig,
+    presearch_cache: PresearchCache = None,
+) -> None:
+    """
+    Monitor a portfolio of CNJs until interrupted.
+
+    The monitor keeps its movement state in its own file, so polling does
+    not move the baseline of ``--refresh`` exports (and vice versa).
+    """
+    from services.monitor_service import JsonlMovementSink, MonitorService
+
+    try:
+        with open(args.monitor, "r", encoding="utf-8-sig") as f:
+            cnjs = read_queries(f)
+    except OSError as e:
+        logger.error("Could not read portfolio file: %s", e)
+        return
+
+    process_service = build_process_service(
+        config,
+        state_store=ProcessStateStore(
+            path=os.path.join(base_dir, "data", config.monitor_state_path)
+        ),
+        presearch_cache=presearch_cache,
+        budget=TokenBucket.per_hour(config.monitor_requests_per_hour),
+    )
+    monitor_service = MonitorService(
+        process_service=process_service,
+        movement_service=process_service.movement_service,
+        config=config,
+        schedule_path=os.path.join(
+            base_dir, "data", config.monitor_schedule_path
+        ),
+        sink=JsonlMovementSink(
+            os.path.join(base_dir, "data", config.monitor_output_path)
+        ),
+    )
+    count = monitor_service.set_portfolio(cnjs)
+    logger.info("Monitoring %d process(es)", count)
+    monitor_service.run()
+
+
+def run_single(
+    args: argparse.Namespace,
+    config: ScraperConfig,
+    journal: Journal = None,
+    state_store: ProcessStateStore = None,
+    presearch_cache: PresearchCache = None,
+) -> None:
+    """Run a single query given on the command line or typed by the user."""
+    request_data = args.query
+    if request_data is None:
         request_data = input("Digite aqui a sua busca processual: ")
 
     if not request_data:
@@ -31,18 +417,34 @@ def main():
         return
 
     try:
-        config = ScraperConfig()
-        api_client = ApiClient(config=config)
-        export_service = ExportService(config=config, base_dir=base_dir)
-        movement_service = MovementService(api_client=api_client)
-        process_service = ProcessService(
-            api_client=api_client,
-            export_service=export_service,
-            movement_service=movement_service,
+        process_service = build_process_service(
+            config,
+            journal,
+            state_store=state_store,
+            refresh=args.refresh,
+            presearch_cache=presearch_cache,
         )
 
         logger.info("Searching processes for: %s", request_data)
-        process_service.get_processes(request_data)
+        if args.limit:
+            count = 0
+            for count, process in enumerate(
+                process_service.stream_processes(request_data, args.limit),
+                start=1,
+            ):
+                logger.info(
+                    "%d. %s - %s (%d movement(s))",
+                    count,
+                    process.formatted_number,
+                    process.class_,
+                    len(process.movements),
+                )
+            if not count:
+                raise ProcessNotFoundError(
+                    f"No processes found for: {request_data}"
+                )
+        else:
+            process_service.get_processes(request_data)
         logger.info("Export completed successfully!")
 
     except InvalidRequestError as e:
@@ -51,11 +453,40 @@ def main():
         logger.warning(str(e))
     except ScraperException as e:
         logger.error("Scraper error: %s", e)
-    except KeyboardInterrupt:
-        logger.info("Operation cancelled by user")
     except (OSError, RuntimeError, ValueError, TypeError) as e:
         logger.exception("Unexpected error: %s", e)
 
 
+def main(argv=None):
+    """Main entry point for the scraper."""
+    args = parse_args(argv)
+    setup_logging(base_dir=base_dir)
+    config = ScraperConfig(store_descriptions=args.store_descriptions)
+    journal = Journal(path=args.journal) if args.journal else None
+    state_store = ProcessStateStore(
+        path=os.path.join(base_dir, "data", config.process_state_path)
+    )
+    presearch_cache = build_presearch_cache(config)
+
+    try:
+        if args.estimate:
+            run_estimate(args, config, presearch_cache)
+        elif args.queue:
+            run_queue(args, config, state_store, presearch_cache)
+        elif args.monitor:
+            run_monitor(args, config, presearch_cache)
+        elif args.batch:
+            run_batch(args, config, journal, state_store, presearch_cache)
+        else:
+            run_single(args, config, journal, state_store, presearch_cache)
+    except KeyboardInterrupt:
+        logger.info("Operation cancelled by user")
+    finally:
+        state_store.save()
+        presearch_cache.save()
+        if journal:
+            journal.close()
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,119 @@
+"""
+Module defining a lazy view of a Process over the raw API dictionary.
+"""
+
+from dataclasses import fields
+from typing import Any, Callable, Dict
+
+from models.process import API_FIELDS, Process, parse_parties
+from utils.dates import parse_date
+from utils.interning import StringDictionary, shared_strings
+from utils.money import parse_cents
+
+
+class _LazyField:
+    """
+    Process field read from the raw dictionary on first access.
+
+    The value is then stored in the instance ``__dict__``, which takes
+    precedence over this (non-data) descriptor, so later reads and
+    assignments cost the same as on a plain attribute.
+    """
+
+    __slots__ = ("name", "load")
+
+    def __init__(self, name: str, load: Callable[["LazyProcess"], Any]):
+        self.name = name
+        self.load = load
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = instance.__dict__[self.name] = self.load(instance)
+        return value
+
+
+class LazyProcess(Process):
+    """
+    Process that wraps the raw API dictionary and reads fields on access.
+
+    Building it costs a single object, so search results that are only
+    filtered (on ``number`` or ``identity``, for instance) or partially
+    exported never pay for the fields and parties they do not use. Each
+    field is read once and then cached on the instance. It is a ``Process``
+    with the same attributes and methods, and fields can be assigned as
+    usual (``movements`` in particular). Lazy and eager processes with the
+    same values compare equal, and a lazy process is pickled as an eager
+    one (for the sharded exports).
+    """
+
+    __slots__ = ("_data", "_strings", "__dict__")
+
+    def __init__(self, data: Dict[str, Any], strings: StringDictionary = None):
+        """
+        Args:
+            data: Process dictionary of the API response
+            strings: Dictionary interning the repetitive values (the
+                shared dictionary by default)
+        """
+        self._data = data
+        self._strings = shared_strings if strings is None else strings
+        self._cnj = None
+        self._serialized = None
+
+    @property
+    def raw(self) -> Dict[str, Any]:
+        """The wrapped API dictionary."""
+        return self._data
+
+    def materialize(self) -> Process:
+        """Return an eager ``Process`` with the current field values."""
+        return Process(
+            **{attr: getattr(self, attr) for attr, *_ in API_FIELDS},
+            parties=self.parties,
+            movements=self.movements,
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, Process):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name)
+            for name in _COMPARED_FIELDS
+        )
+
+    def __reduce__(self):
+        return Process, tuple(getattr(self, name) for name in _INIT_FIELDS)
+
+
+_COMPARED_FIELDS = tuple(f.name for f in fields(Process) if f.compare)
+_INIT_FIELDS = tuple(f.name for f in fields(Process) if f.init)
+
+
+def _api_value(key: str, default: Any, interned: bool):
+    if interned:
+        return lambda process: process._strings.intern(
+            process._data.get(key, default)
+        )
+    return lambda process: process._data.get(key, default)
+
+
+for _attr, _key, _default, _interned in API_FIELDS:
+    setattr(
+        LazyProcess,
+        _attr,
+        _LazyField(_attr, _api_value(_key, _default, _interned)),
+    )
+LazyProcess.parties = _LazyField(
+    "parties", lambda process: parse_parties(process._data, process._strings)
+)
+LazyProcess.movements = _LazyField("movements", lambda process: [])
+LazyProcess.citation_day = _LazyField(
+    "citation_day", lambda process: parse_date(process.citation_date)
+)
+LazyProcess.distribution_day = _LazyField(
+    "distribution_day", lambda process: parse_date(process.distribution_date)
+)
+LazyProcess.cause_value_cents = _LazyField(
+    "cause_value_cents", lambda process: parse_cents(process.cause_value)
+)
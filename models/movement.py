@@ -2,11 +2,14 @@
 Module defining the Movement data model for legal process movements/events.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Dict
 
+from utils.dates import parse_date
+from utils.interning import StringDictionary, shared_strings
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class Movement:
     """
     Represents a single movement/event in a legal process.
@@ -14,10 +17,16 @@ class Movement:
     Attributes:
         date: The formatted date string (e.g., "01/02/2026")
         description: The movement description
+        day: Ordinal of the date (``date.toordinal``), parsed once when the
+            movement is created, or 0 if the date is not parseable
     """
 
     date: str
     description: str
+    day: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "day", parse_date(self.date))
 
     def __str__(self):
         return f"{self.date}: {self.description}"
@@ -27,17 +36,23 @@ class Movement:
         return {"date": self.date, "description": self.description}
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "Movement":
+    def from_dict(
+        cls, data: Dict[str, Any], strings: StringDictionary = None
+    ) -> "Movement":
         """
         Create a Movement instance from API response data.
 
         Args:
             data: Dictionary with 'dataFormatada' and 'descricao' keys
+            strings: Dictionary interning the description (the shared
+                dictionary by default)
 
         Returns:
             A new Movement instance
         """
+        if strings is None:
+            strings = shared_strings
         return cls(
             date=data.get("dataFormatada"),
-            description=data.get("descricao"),
+            description=strings.intern(data.get("descricao")),
         )
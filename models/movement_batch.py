@@ -0,0 +1,212 @@
+"""
+Module defining the MovementBatch columnar container of process movements.
+"""
+
+import json
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from models.movement import Movement
+from utils.dates import Day, format_date, parse_date, to_day
+from utils.interning import StringDictionary, shared_strings
+
+
+def latest_movement_day(movements: Sequence) -> Optional[int]:
+    """
+    Return the ordinal of the most recent movement date, if any.
+
+    Args:
+        movements: A list of ``Movement`` or a ``MovementBatch``
+    """
+    if isinstance(movements, MovementBatch):
+        return movements.latest_day()
+    return max((movement.day for movement in movements), default=0) or None
+
+
+def _rebuild(days, descriptions, odd_dates) -> "MovementBatch":
+    batch = MovementBatch(odd_dates=odd_dates)
+    batch.days = days
+    encode = batch.strings.encode
+    batch.descriptions.extend(encode(d) for d in descriptions)
+    return batch
+
+
+@dataclass(eq=False)
+class MovementBatch(Sequence):
+    """
+    Columnar, array-backed sequence of the movements of one process.
+
+    Processes with tens of thousands of movements would otherwise hold one
+    ``Movement`` per row. Here dates are stored as day ordinals in an
+    ``array`` and descriptions as codes of a per-batch ``StringDictionary``
+    (whose values are shared through ``shared_strings``), about 8 bytes
+    per movement. It is a ``Sequence`` of ``Movement``, built on the fly,
+    so it can replace the movement list of a ``Process``.
+
+    Attributes:
+        days: Day ordinal of each movement date, 0 for unparseable dates
+        descriptions: Dictionary code of each movement description
+        strings: Dictionary of the distinct descriptions
+        odd_dates: Original value of the dates that are not exactly in the
+            ``dd/mm/yyyy`` form (with a time, for instance), by row
+    """
+
+    days: array = field(default_factory=lambda: array("i"))
+    descriptions: array = field(default_factory=lambda: array("I"))
+    strings: StringDictionary = field(default_factory=StringDictionary)
+    odd_dates: Dict[int, Optional[str]] = field(default_factory=dict)
+
+    @classmethod
+    def from_movements(cls, movements: Iterable[Movement]) -> "MovementBatch":
+        """Create a batch from Movement instances."""
+        batch = cls()
+        for movement in movements:
+            batch.append(movement.date, movement.description)
+        return batch
+
+    def append(self, date: Optional[str], description: str) -> None:
+        """Append a movement."""
+        day = parse_date(date)
+        if not day or format_date(day) != date:
+            self.odd_dates[len(self.days)] = date
+        self.days.append(day)
+        self.descriptions.append(
+            self.strings.encode(shared_strings.intern(description))
+        )
+
+    def append_api(self, data: Dict[str, Any]) -> None:
+        """Append a movement of a ``listaResultado`` page."""
+        self.append(data.get("dataFormatada"), data.get("descricao"))
+
+    def extend_api(self, page: Iterable[Dict[str, Any]]) -> None:
+        """Append every movement of a ``listaResultado`` page."""
+        for data in page:
+            self.append_api(data)
+
+    def dates(self) -> List[Optional[str]]:
+        """Return the formatted date of every movement."""
+        dates = [format_date(day) if day else None for day in self.days]
+        for index, date in self.odd_dates.items():
+            dates[index] = date
+        return dates
+
+    def latest_day(self) -> Optional[int]:
+        """Return the ordinal of the most recent movement date, if any."""
+        return max(self.days, default=0) or None
+
+    def since(self, day: Day) -> "MovementBatch":
+        """
+        Return the movements dated on or after a day, in a new batch.
+
+        Args:
+            day: The first day, as an ordinal, ``date`` or ``dd/mm/yyyy``
+        """
+        first = to_day(day)
+        batch = MovementBatch(strings=self.strings)
+        for index, (row_day, code) in enumerate(
+            zip(self.days, self.descriptions)
+        ):
+            if row_day >= first:
+                if index in self.odd_dates:
+                    batch.odd_dates[len(batch.days)] = self.odd_dates[index]
+                batch.days.append(row_day)
+                batch.descriptions.append(code)
+        return batch
+
+    def map_descriptions(self, function: Callable[[str], Any]) -> List[Any]:
+        """
+        Return ``function`` applied to the description of every movement,
+        calling it once per distinct description.
+        """
+        results = [function(value) for value in self.__values__()]
+        return [results[code] for code in self.descriptions]
+
+    def to_text(self) -> str:
+        """Return one ``date: description`` line per movement."""
+        values = self.__values__()
+        return "\n".join(
+            f"{date}: {values[code]}"
+            for date, code in zip(self.dates(), self.descriptions)
+        )
+
+    def to_json(self, indent: int = 4, level: int = 0) -> str:
+        """
+        Serialize the movements as ``json.dumps`` would serialize the list
+        of ``Movement.to_dict``, without building a dictionary per row.
+
+        Each distinct date and description is encoded once.
+
+        Args:
+            indent: Indentation of ``json.dumps``
+            level: Nesting level of the list in the enclosing document
+        """
+        if not self.days:
+            return "[]"
+        outer = " " * (indent * level)
+        pad = outer + " " * indent
+        inner = pad + " " * indent
+        descriptions = [
+            json.dumps(value, ensure_ascii=False)
+            for value in self.__values__()
+        ]
+        dates: Dict[Optional[str], str] = {}
+        rows = []
+        for date, code in zip(self.dates(), self.descriptions):
+            encoded = dates.get(date)
+            if encoded is None:
+                encoded = dates[date] = json.dumps(date, ensure_ascii=False)
+            rows.append(
+                f'{pad}{{\n{inner}"date": {encoded},\n'
+                f'{inner}"description": {descriptions[code]}\n{pad}}}'
+            )
+        return "[\n" + ",\n".join(rows) + f"\n{outer}]"
+
+    def __values__(self) -> List[str]:
+        decode = self.strings.decode
+        return [decode(code) for code in range(len(self.strings))]
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        day = self.days[index]
+        if index < 0:
+            index += len(self.days)
+        if index in self.odd_dates:
+            date = self.odd_dates[index]
+        else:
+            date = format_date(day)
+        return Movement(
+            date=date,
+            description=self.strings.decode(self.descriptions[index]),
+        )
+
+    def __iter__(self) -> Iterator[Movement]:
+        values = self.__values__()
+        for date, code in zip(self.dates(), self.descriptions):
+            yield Movement(date=date, description=values[code])
+
+    def __eq__(self, other):
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            a == b for a, b in zip(self, other)
+        )
+
+    def __repr__(self):
+        return f"MovementBatch({len(self)} movements)"
+
+    def __reduce__(self):
+        # The dictionary holds a lock; descriptions are pickled as strings
+        # (each distinct one once, through the pickle memo) and encoded
+        # again when loaded
+        values = self.__values__()
+        return _rebuild, (
+            self.days,
+            [values[code] for code in self.descriptions],
+            self.odd_dates,
+        )
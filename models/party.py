@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Any, Dict
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Party:
     """
     Represents a party (person or entity) in a legal process.
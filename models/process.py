@@ -1,16 +1,32 @@
 """Module defining the Process data model for legal processes."""
 
-from dataclasses import dataclass
-from typing import Any, Dict, List
+from dataclasses import dataclass, field, fields
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from entities.cnj import CNJ
 from models.movement import Movement
+from models.movement_batch import MovementBatch
 from models.party import Party
+from utils.dates import parse_date
+from utils.interning import StringDictionary, shared_strings
+from utils.money import parse_cents
 
 
-@dataclass
+@dataclass(slots=True)
 class Process:
     """
     Represents a legal process with all its metadata.
+
+    The dates and the cause value are also parsed once, when the process is
+    created, into ``citation_day``/``distribution_day`` (day ordinals, 0 if
+    unknown) and ``cause_value_cents`` (None if unknown) for sorting and
+    filtering without parsing the display strings again.
+
+    ``to_dict`` and ``to_csv_export`` are memoized: the serialized forms are
+    rebuilt only after a field changes, ``parties`` or ``movements`` are
+    assigned or grow or shrink. Replacing an item of those lists in place
+    is not detected.
     """
 
     formatted_number: str
@@ -31,6 +47,24 @@ class Process:
     citation_date: str = ""
     justice_secret: str = ""
     distribution_date: str = ""
+    citation_day: int = field(default=0, init=False, repr=False, compare=False)
+    distribution_day: int = field(
+        default=0, init=False, repr=False, compare=False
+    )
+    cause_value_cents: Optional[int] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _cnj: Tuple[str, Optional[CNJ]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _serialized: Dict[str, Tuple[tuple, Dict[str, Any]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        self.citation_day = parse_date(self.citation_date)
+        self.distribution_day = parse_date(self.distribution_date)
+        self.cause_value_cents = parse_cents(self.cause_value)
 
     def __str__(self):
         return (
@@ -51,8 +85,61 @@ class Process:
             f"Movimentações: {len(self.movements)}"
         )
 
+    @property
+    def identity(self) -> str:
+        """Identify the process by its number, document and instance."""
+        return f"{self.number}/{self.cd_doc_process}/{self.cd_instance}"
+
+    @property
+    def cnj(self) -> Optional[CNJ]:
+        """The parsed CNJ number, or None if the number is malformed."""
+        cached = self._cnj
+        if cached is None or cached[0] != self.number:
+            cached = self._cnj = (self.number, CNJ.try_parse(self.number))
+        return cached[1]
+
     def to_csv_export(self) -> Dict[str, Any]:
-        """Convert to dictionary for CSV export."""
+        """
+        Convert to dictionary for CSV export.
+
+        Returns:
+            A new dictionary; its values are shared with the cached form
+        """
+        return dict(self.__cached__("csv", self.__build_csv_export__))
+
+    def to_dict(self, include_movements: bool = True) -> Dict[str, Any]:
+        """
+        Convert to dictionary for JSON serialization.
+
+        Args:
+            include_movements: Whether to include the ``movements`` list
+                (exporters serialize a ``MovementBatch`` separately)
+
+        Returns:
+            A new dictionary; its ``parties`` and ``movements`` lists are
+            shared with the cached form and must not be modified
+        """
+        if not include_movements:
+            return self.__build_dict__(include_movements=False)
+        return dict(self.__cached__("dict", self.__build_dict__))
+
+    def __cached__(
+        self, name: str, build: Callable[[], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        key = (
+            _serialized_fields(self),
+            len(self.parties),
+            len(self.movements),
+        )
+        cache = self._serialized
+        if cache is None:
+            cache = self._serialized = {}
+        entry = cache.get(name)
+        if entry is None or entry[0] != key:
+            entry = cache[name] = (key, build())
+        return entry[1]
+
+    def __build_csv_export__(self) -> Dict[str, Any]:
         return {
             "Número do Processo": self.formatted_number,
             "Classe": self.class_,
@@ -68,12 +155,11 @@ class Process:
             "Segredo de Justiça": self.justice_secret,
             "Data de Distribuição": self.distribution_date,
             "Partes": "\n".join([str(party) for party in self.parties]),
-            "Movimentações": "\n".join([str(m) for m in self.movements]),
+            "Movimentações": self.__movements_text__(),
         }
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
-        return {
+    def __build_dict__(self, include_movements: bool = True) -> Dict[str, Any]:
+        data = {
             "number": self.number,
             "formatted_number": self.formatted_number,
             "class": self.class_,
@@ -91,28 +177,47 @@ class Process:
             "justice_secret": self.justice_secret,
             "distribution_date": self.distribution_date,
             "parties": [party.to_dict() for party in self.parties],
-            "movements": [m.to_dict() for m in self.movements],
         }
+        if include_movements:
+            data["movements"] = [m.to_dict() for m in self.movements]
+        return data
+
+    def __movements_text__(self) -> str:
+        if isinstance(self.movements, MovementBatch):
+            return self.movements.to_text()
+        return "\n".join([str(m) for m in self.movements])
+
+    def __getstate__(self):
+        # The serialization cache is not pickled, it is rebuilt on demand
+        state, slots = object.__getstate__(self)
+        slots["_serialized"] = None
+        return state, slots
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "Process":
+    def from_dict(
+        cls, data: Dict[str, Any], strings: StringDictionary = None
+    ) -> "Process":
         """
         Create a Process instance from API response data.
+
+        The low-cardinality values that repeat across processes (class,
+        topic, court and the like) are interned in ``strings`` (the shared
+        dictionary by default). Numbers, dates and party names are not, as
+        the dictionary would keep every distinct one alive.
         """
-        parties = [
-            Party(name=party["nome"], party_type=party["tipo"])
-            for party in data.get("partes", [])
-        ]
+        if strings is None:
+            strings = shared_strings
+        intern = strings.intern
         return cls(
             number=data.get("numero"),
             formatted_number=data.get("numeroFormatado"),
-            class_=data.get("classe"),
-            topic=data.get("assunto"),
-            jurisdiction=data.get("comarca", ""),
-            competence=data.get("competencia", ""),
+            class_=intern(data.get("classe")),
+            topic=intern(data.get("assunto")),
+            jurisdiction=intern(data.get("comarca", "")),
+            competence=intern(data.get("competencia", "")),
             instance=data.get("instancia", ""),
-            situation=data.get("situacao", ""),
-            court=data.get("vara", ""),
+            situation=intern(data.get("situacao", "")),
+            court=intern(data.get("vara", "")),
             police_inquiry=data.get("numeroInqueritoPolicial", ""),
             cause_value=data.get("valorCausaFormatado", ""),
             citation_date=data.get("dataAutuacaoFormatada", ""),
@@ -120,6 +225,50 @@ class Process:
             cd_doc_process=data.get("cdDocProcesso"),
             cd_instance=data.get("cdInstancia"),
             distribution_date=data.get("dataDistribuicaoFormatada"),
-            parties=parties,
+            parties=parse_parties(data, strings),
             movements=[],
         )
+
+
+_serialized_fields = attrgetter(*(f.name for f in fields(Process) if f.init))
+"""Values a cached serialization depends on (the lists by identity)."""
+
+
+API_FIELDS: Tuple[Tuple[str, str, Optional[str], bool], ...] = (
+    ("number", "numero", None, False),
+    ("formatted_number", "numeroFormatado", None, False),
+    ("class_", "classe", None, True),
+    ("topic", "assunto", None, True),
+    ("jurisdiction", "comarca", "", True),
+    ("competence", "competencia", "", True),
+    ("instance", "instancia", "", False),
+    ("situation", "situacao", "", True),
+    ("court", "vara", "", True),
+    ("police_inquiry", "numeroInqueritoPolicial", "", False),
+    ("cause_value", "valorCausaFormatado", "", False),
+    ("citation_date", "dataAutuacaoFormatada", "", False),
+    ("justice_secret", "segredoJustica", "", False),
+    ("cd_doc_process", "cdDocProcesso", None, False),
+    ("cd_instance", "cdInstancia", None, False),
+    ("distribution_date", "dataDistribuicaoFormatada", None, False),
+)
+"""
+Process attribute, API key, default value and whether the value is interned,
+for every scalar field read by ``Process.from_dict`` (which spells them out
+for speed).
+"""
+
+
+def parse_parties(
+    data: Dict[str, Any], strings: StringDictionary
+) -> List[Party]:
+    """
+    Build the parties of an API process dictionary.
+
+    Only the party type is interned; names are mostly distinct.
+    """
+    intern = strings.intern
+    return [
+        Party(name=party["nome"], party_type=intern(party["tipo"]))
+        for party in data.get("partes", [])
+    ]
@@ -0,0 +1,177 @@
+"""Service to run many search queries in a single process."""
+
+import csv
+import os
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from logging import getLogger
+from typing import Any, Dict, Iterable, List, TextIO
+
+from entities.request_type import RequestType
+from exceptions import (
+    InvalidIdentifierError,
+    InvalidRequestError,
+    ProcessNotFoundError,
+    ScraperException,
+)
+from services.process_service import ProcessService
+
+logger = getLogger("tjpa_scraper")
+
+UNRECOGNIZED = "unrecognized"
+
+
+def read_queries(stream: TextIO, csv_format: bool = False) -> List[str]:
+    """
+    Read search queries from a text stream.
+
+    Plain text input has one query per line; blank lines and lines starting
+    with ``#`` are ignored. CSV input uses the ``query`` column when the
+    header has one, otherwise the first column of every row.
+
+    Args:
+        stream: Open text stream (file or stdin)
+        csv_format: Whether the stream is CSV
+
+    Returns:
+        The list of queries in input order
+    """
+    if not csv_format:
+        queries = (line.strip() for line in stream)
+        return [q for q in queries if q and not q.startswith("#")]
+
+    rows = list(csv.reader(stream))
+    if not rows:
+        return []
+    header = [column.strip().lower() for column in rows[0]]
+    if "query" in header:
+        column = header.index("query")
+        rows = rows[1:]
+    else:
+        column = 0
+    queries = (row[column].strip() for row in rows if len(row) > column)
+    return [q for q in queries if q]
+
+
+@dataclass
+class BatchResult:
+    """Outcome of a single query of a batch."""
+
+    query: str
+    normalized_query: str = ""
+    request_type: str = ""
+    status: str = "pending"
+    processes: int = 0
+    error: str = ""
+    elapsed: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for the summary file."""
+        return asdict(self)
+
+
+@dataclass
+class BatchService:
+    """
+    Service to run a batch of queries through one shared service graph,
+    with at most ``max_concurrency`` queries in flight.
+    """
+
+    process_service: ProcessService
+    max_concurrency: int = 4
+    results: List[BatchResult] = field(default_factory=list, init=False)
+    rejections: Counter = field(default_factory=Counter, init=False)
+
+    def run(self, queries: Iterable[str]) -> List[BatchResult]:
+        """
+        Classify, validate and run every query of the batch.
+
+        Queries that cannot be classified, and CNJ, CPF or CNPJ numbers with
+        wrong check digits, are reported as ``invalid`` without any network
+        call and counted per reason in ``rejections``. Valid queries run in
+        their canonical form.
+
+        Returns:
+            One BatchResult per query, in input order
+        """
+        self.results = []
+        self.rejections = Counter()
+        pending = []
+        for query in queries:
+            result = BatchResult(query=query)
+            self.results.append(result)
+            try:
+                request_type = RequestType.get_type(query)
+                result.request_type = request_type.name
+                result.normalized_query = request_type.normalize(query)
+            except InvalidIdentifierError as e:
+                self.__reject__(result, e, e.reason)
+                continue
+            except InvalidRequestError as e:
+                self.__reject__(result, e, UNRECOGNIZED)
+                continue
+            pending.append(result)
+        if self.rejections:
+            logger.warning(
+                "Rejected %d invalid queries: %s",
+                sum(self.rejections.values()),
+                ", ".join(f"{k}={v}" for k, v in self.rejections.items()),
+            )
+
+        logger.info(
+            "Running %d of %d queries with concurrency %d",
+            len(pending),
+            len(self.results),
+            self.max_concurrency,
+        )
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            list(executor.map(self.__run_query__, pending))
+        return self.results
+
+    def write_summary(self, path: str) -> None:
+        """Write the per-query summary of the last run as a CSV file."""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        fields = list(BatchResult.__dataclass_fields__)
+        with open(path, "w", newline="", encoding="utf-8-sig") as f:
+            writer = csv.DictWriter(f, fieldnames=fields, lineterminator="\n")
+            writer.writeheader()
+            for result in self.results:
+                writer.writerow(result.to_dict())
+
+    def __reject__(
+        self, result: BatchResult, error: InvalidRequestError, reason: str
+    ) -> None:
+        result.status = "invalid"
+        result.error = str(error)
+        self.rejections[reason] += 1
+
+    def __run_query__(self, result: BatchResult) -> None:
+        start = time.monotonic()
+        try:
+            result.processes = self.process_service.get_processes(
+                result.normalized_query
+            )
+            result.status = "ok"
+        except ProcessNotFoundError as e:
+            result.status = "not_found"
+            result.error = str(e)
+        except ScraperException as e:
+            result.status = "error"
+            result.error = str(e)
+        except (
+            AttributeError,
+            OSError,
+            RuntimeError,
+            ValueError,
+            TypeError,
+        ) as e:
+            logger.exception("Unexpected error for %s: %s", result.query, e)
+            result.status = "error"
+            result.error = str(e)
+        finally:
+            result.elapsed = round(time.monotonic() - start, 3)
+        logger.info(
+            "Query %s finished with status %s", result.query, result.status
+        )
@@ -0,0 +1,183 @@
+"""Service to estimate the cost of a query without running it."""
+
+import math
+from dataclasses import dataclass
+from logging import getLogger
+from typing import Any, Dict, List
+
+from config import ScraperConfig
+from entities.request_type import RequestType
+from models.process import Process
+from services.process_service import ProcessService, SearchPage
+
+logger = getLogger("tjpa_scraper")
+
+
+@dataclass
+class CostEstimate:
+    """
+    Expected cost of running a query.
+
+    Attributes:
+        query: The estimated query
+        request_type: Name of the query's RequestType
+        processes: Expected number of processes
+        search_requests: Expected search requests (presearch and pages)
+        movement_requests: Expected movement requests
+        sampled_processes: Processes whose movements were counted
+        avg_movements: Average movements of the sampled processes
+        bytes_per_request: Average response size seen while estimating
+        seconds_per_request: Average rate-limit wait plus response time
+        probe_requests: Requests made to compute the estimate
+    """
+
+    query: str
+    request_type: str
+    processes: int = 0
+    search_requests: int = 0
+    movement_requests: int = 0
+    sampled_processes: int = 0
+    avg_movements: float = 0.0
+    bytes_per_request: float = 0.0
+    seconds_per_request: float = 0.0
+    probe_requests: int = 0
+
+    @property
+    def requests(self) -> int:
+        """Expected total number of requests."""
+        return self.search_requests + self.movement_requests
+
+    @property
+    def expected_bytes(self) -> int:
+        """Expected total size of the responses."""
+        return round(self.requests * self.bytes_per_request)
+
+    @property
+    def expected_seconds(self) -> float:
+        """Expected wall time of a sequential run."""
+        return self.requests * self.seconds_per_request
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for reporting."""
+        return {
+            "query": self.query,
+            "request_type": self.request_type,
+            "processes": self.processes,
+            "requests": self.requests,
+            "search_requests": self.search_requests,
+            "movement_requests": self.movement_requests,
+            "sampled_processes": self.sampled_processes,
+            "avg_movements": round(self.avg_movements, 1),
+            "expected_bytes": self.expected_bytes,
+            "expected_seconds": round(self.expected_seconds, 1),
+            "probe_requests": self.probe_requests,
+        }
+
+
+@dataclass
+class EstimateService:
+    """
+    Service to estimate the requests, bytes and wall time of a query.
+
+    Only the first search page is fetched (for party names, the presearch
+    and the first page of up to ``estimate_max_presearch_probes`` of its
+    entries). The total comes from ``qtdRegistrosTotal`` and the movement
+    cost from the movement count of ``estimate_sample_size`` processes.
+    """
+
+    process_service: ProcessService
+    config: ScraperConfig
+
+    def estimate(self, request_data: str) -> CostEstimate:
+        """
+        Estimate the cost of running a query.
+
+        Args:
+            request_data: The search query string
+
+        Returns:
+            The CostEstimate of the query
+        """
+        request_type = RequestType.get_type(request_data)
+        api_client = self.process_service.api_client
+        before = api_client.stats.snapshot()
+        estimate = CostEstimate(
+            query=request_data, request_type=request_type.name
+        )
+
+        page = self.process_service.fetch_search_page(request_data)
+        estimate.search_requests = 1
+        if page.presearch:
+            samples = self.__estimate_presearch__(estimate, page.presearch)
+        else:
+            samples = page.processes
+            estimate.processes = max(page.total_records, len(samples))
+            estimate.search_requests = self.__count_pages__(page)
+
+        self.__estimate_movements__(estimate, samples)
+
+        after = api_client.stats.snapshot()
+        estimate.probe_requests = after.requests - before.requests
+        if estimate.probe_requests:
+            estimate.bytes_per_request = (
+                after.bytes_received - before.bytes_received
+            ) / estimate.probe_requests
+            latency = (after.elapsed - before.elapsed) / (
+                estimate.probe_requests
+            )
+        else:
+            latency = 0.0
+        estimate.seconds_per_request = latency + (
+            (self.config.min_wait_time + self.config.max_wait_time) / 2
+        )
+        return estimate
+
+    def __estimate_presearch__(
+        self, estimate: CostEstimate, presearch: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        probes = presearch[: self.config.estimate_max_presearch_probes]
+        processes = 0
+        pages = 0
+        samples = []
+        for item in probes:
+            page = self.process_service.fetch_search_page(
+                item["nome"],
+                item["sistema"],
+                1,
+            )
+            processes += max(page.total_records, len(page.processes))
+            pages += self.__count_pages__(page)
+            samples.extend(page.processes)
+        scale = len(presearch) / len(probes)
+        estimate.processes = round(processes * scale)
+        estimate.search_requests += math.ceil(pages * scale)
+        return samples
+
+    def __estimate_movements__(
+        self, estimate: CostEstimate, processes: List[Dict[str, Any]]
+    ) -> None:
+        sample_size = min(self.config.estimate_sample_size, len(processes))
+        if not sample_size or not estimate.processes:
+            return
+        step = len(processes) / sample_size
+        counts = []
+        movement_service = self.process_service.movement_service
+        page_size = movement_service.get_page_size()
+        for i in range(sample_size):
+            process = Process.from_dict(processes[int(i * step)])
+            counts.append(movement_service.count_movements(process))
+        estimate.sampled_processes = sample_size
+        estimate.avg_movements = sum(counts) / sample_size
+        pages_per_process = (
+            sum(max(1, math.ceil(count / page_size)) for count in counts)
+            / sample_size
+        )
+        estimate.movement_requests = math.ceil(
+            estimate.processes * pages_per_process
+        )
+
+    @staticmethod
+    def __count_pages__(page: SearchPage) -> int:
+        if not page.paginated or not page.processes:
+            return 1
+        return max(1, math.ceil(page.total_records / len(page.processes)))
@@ -1,42 +1,160 @@
 """Service to handle exporting process data to various formats."""
 
+import json
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Iterable, Iterator, List, Optional
 
 from config import ScraperConfig
+from models.movement import Movement
 from models.process import Process
-from services.exporters.csv_exporter import CSVExporter
+from services.exporters.csv_exporter import (
+    CSVExporter,
+    ConsolidatedCSVExporter,
+)
 from services.exporters.json_exporter import JSONExporter
+from storage.description_store import DescriptionStore
+from utils.interning import shared_strings
 
 
 @dataclass
 class ExportService:
     """
     Service to handle exporting process data to various formats.
+
+    When ``config.store_descriptions`` is set, the JSON exports reference
+    movement descriptions kept once in a ``DescriptionStore``. With
+    ``consolidated``, every process is also appended to a single CSV file
+    in the consolidated export directory, written on ``close``.
     """
 
     config: ScraperConfig
     base_dir: str
+    consolidated: bool = False
+    description_store: DescriptionStore = field(default=None, init=False)
+    consolidated_csv: ConsolidatedCSVExporter = field(default=None, init=False)
 
-    def export(self, process: Process) -> None:
-        """Export a list of Process instances to CSV and JSON files."""
-        csv_exporter = CSVExporter(
-            export_path=os.path.join(
-                self.base_dir,
-                "data",
-                self.config.csv_export_path,
+    def __post_init__(self):
+        if self.config.store_descriptions:
+            os.makedirs(os.path.join(self.base_dir, "data"), exist_ok=True)
+            self.description_store = DescriptionStore(
+                path=os.path.join(
+                    self.base_dir, "data", self.config.description_store_path
+                )
             )
-        )
+        if self.consolidated:
+            self.consolidated_csv = ConsolidatedCSVExporter(
+                path=os.path.join(
+                    self.base_dir,
+                    "data",
+                    self.config.consolidated_export_path,
+                    f"processes_{datetime.now():%Y%m%d_%H%M%S}.csv",
+                )
+            )
+
+    def export(self, process: Process) -> str:
+        """
+        Export a Process instance to CSV and JSON files.
+
+        Returns:
+            The base name (without extension) of the exported files
+        """
+        csv_exporter = CSVExporter(export_path=self.csv_export_dir)
         json_exporter = JSONExporter(
-            export_path=os.path.join(
-                self.base_dir, "data", self.config.json_export_path
+            export_path=self.json_export_dir,
+            description_store=self.description_store,
+        )
+
+        file_name = self.get_file_name(process)
+        csv_exporter.export(process, file_name)
+        json_exporter.export(process, file_name)
+        if self.consolidated_csv is not None:
+            self.consolidated_csv.export(process)
+        return file_name
+
+    def close(self) -> Optional[str]:
+        """
+        Write the pending rows of the consolidated CSV.
+
+        Returns:
+            The consolidated CSV path, or None without a consolidated export
+        """
+        if self.consolidated_csv is None:
+            return None
+        self.consolidated_csv.close()
+        return self.consolidated_csv.path
+
+    def export_each(self, processes: Iterable[Process]) -> Iterator[Process]:
+        """
+        Export every process of an iterable, yielding each once written.
+
+        Returns:
+            An iterator over the exported processes
+        """
+        for process in processes:
+            self.export(process)
+            yield process
+
+    def load_movements(self, process: Process) -> Optional[List[Movement]]:
+        """
+        Load the movements of a previous JSON export of the process.
+
+        Returns:
+            The exported movements, or None if there is no readable export
+        """
+        file_path = os.path.join(
+            self.json_export_dir, f"{self.get_file_name(process)}.json"
+        )
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        movements = data.get("movements", [])
+        if movements and "description_id" in movements[0]:
+            descriptions = self.__resolve_descriptions__(movements)
+            if descriptions is None:
+                return None
+        else:
+            descriptions = [m["description"] for m in movements]
+        intern = shared_strings.intern
+        return [
+            Movement(date=m["date"], description=intern(description))
+            for m, description in zip(movements, descriptions)
+        ]
+
+    def __resolve_descriptions__(
+        self, movements: List[dict]
+    ) -> Optional[List[str]]:
+        if self.description_store is None:
+            return None
+        ids = [m["description_id"] for m in movements]
+        try:
+            texts = self.description_store.get_many(
+                key for key in ids if key is not None
             )
+        except KeyError:
+            return None
+        return [None if key is None else texts[key] for key in ids]
+
+    @property
+    def csv_export_dir(self) -> str:
+        """Directory of the CSV exports."""
+        return os.path.join(self.base_dir, "data", self.config.csv_export_path)
+
+    @property
+    def json_export_dir(self) -> str:
+        """Directory of the JSON exports."""
+        return os.path.join(
+            self.base_dir, "data", self.config.json_export_path
         )
 
-        file_name = (
+    @staticmethod
+    def get_file_name(process: Process) -> str:
+        """Return the base file name used for a process' exports."""
+        return (
             f"process_{process.number}_"
             f"doc_{process.cd_doc_process}_"
             f"instance_{process.cd_instance}"
         )
-        csv_exporter.export(process, file_name)
-        json_exporter.export(process, file_name)
@@ -1,16 +1,37 @@
-"""CSV exporter implementation."""
+"""CSV exporter implementations."""
 
+import csv
 import os
-from dataclasses import dataclass
-
-import pandas as pd
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, TextIO
 
 from models.process import Process
 
+CSV_FIELDS = list(
+    Process(
+        formatted_number="",
+        number="",
+        class_="",
+        topic="",
+        cd_doc_process="",
+        cd_instance="",
+        parties=[],
+        movements=[],
+    ).to_csv_export()
+)
+"""Header of the CSV exports, in the order of ``Process.to_csv_export``."""
+
 
 @dataclass
 class CSVExporter:
-    """Exports process data to CSV format."""
+    """
+    Exports process data to CSV format, one file per process.
+
+    Rows are written with the ``csv`` module straight from
+    ``Process.to_csv_export``, in the same format pandas produced (UTF-8
+    with BOM, minimal quoting, platform line endings).
+    """
 
     export_path: str
 
@@ -19,6 +40,95 @@ class CSVExporter:
 
     def export(self, process: Process, file_name: str) -> None:
         """Export a single process to CSV."""
-        df = pd.DataFrame([process.to_csv_export()])
         file_path = os.path.join(self.export_path, f"{file_name}.csv")
-        df.to_csv(file_path, index=False, encoding="utf-8-sig")
+        with open(file_path, "w", newline="", encoding="utf-8-sig") as f:
+            writer = csv.writer(f, lineterminator=os.linesep)
+            writer.writerow(CSV_FIELDS)
+            writer.writerow(process.to_csv_export().values())
+
+
+@dataclass
+class ConsolidatedCSVExporter:
+    """
+    Exports many processes to a single CSV file with one header.
+
+    The file is opened on the first export and rows are buffered and
+    written ``buffer_rows`` at a time. Exports may come from several
+    threads. Call ``close`` (or use the exporter as a context manager) to
+    write the remaining rows.
+    """
+
+    path: str
+    buffer_rows: int = 1000
+    encoding: str = "utf-8-sig"
+    lineterminator: str = os.linesep
+    rows: int = field(default=0, init=False)
+    _opened: bool = field(default=False, init=False, repr=False)
+    _file: Optional[TextIO] = field(default=None, init=False, repr=False)
+    _writer: Any = field(default=None, init=False, repr=False)
+    _buffer: List[List[Any]] = field(
+        default_factory=list, init=False, repr=False
+    )
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+
+    def export(self, process: Process, file_name: str = None) -> None:
+        """
+        Append a process to the consolidated file.
+
+        Args:
+            process: The process to export
+            file_name: Ignored; accepted for the ``Exporter`` protocol
+        """
+        self.write_row(process.to_csv_export())
+
+    def write_row(self, row: Dict[str, Any]) -> None:
+        """Append a ``to_csv_export`` row to the consolidated file."""
+        with self._lock:
+            self._buffer.append(list(row.values()))
+            self.rows += 1
+            if len(self._buffer) >= self.buffer_rows:
+                self.__flush__()
+
+    def flush(self) -> None:
+        """Write the buffered rows."""
+        with self._lock:
+            self.__flush__()
+
+    def close(self) -> None:
+        """Write the buffered rows and close the file."""
+        with self._lock:
+            self.__flush__()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __flush__(self) -> None:
+        if self._file is None:
+            # Exports after ``close`` are appended below the same header
+            if not self._opened:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+            self._file = open(
+                self.path,
+                "a" if self._opened else "w",
+                newline="",
+                encoding=self.encoding,
+            )
+            self._writer = csv.writer(
+                self._file, lineterminator=self.lineterminator
+            )
+            if not self._opened:
+                self._writer.writerow(CSV_FIELDS)
+                self._opened = True
+        self._writer.writerows(self._buffer)
+        self._buffer.clear()
+        self._file.flush()
+
+    def __enter__(self) -> "ConsolidatedCSVExporter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
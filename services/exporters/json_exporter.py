@@ -3,15 +3,25 @@
 import json
 import os
 from dataclasses import dataclass
+from typing import Any, Dict, List
 
+from models.movement_batch import MovementBatch
 from models.process import Process
+from storage.description_store import DescriptionStore
 
 
 @dataclass
 class JSONExporter:
-    """Exports process data to JSON format."""
+    """
+    Exports process data to JSON format.
+
+    With a ``description_store``, movements reference their description by
+    its content address (``{"date": ..., "description_id": ...}``) instead
+    of repeating the text, which is kept once in the store.
+    """
 
     export_path: str
+    description_store: DescriptionStore = None
 
     def __post_init__(self):
         os.makedirs(self.export_path, exist_ok=True)
@@ -19,5 +29,44 @@ class JSONExporter:
     def export(self, process: Process, file_name: str) -> None:
         """Export a single process to JSON."""
         file_path = os.path.join(self.export_path, f"{file_name}.json")
+        if self.description_store is not None:
+            data = process.to_dict(include_movements=False)
+            data["movements"] = self.__movement_refs__(process.movements)
+            # Descriptions are stored before the export references them
+            self.description_store.flush()
+            with open(file_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=4)
+            return
         with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(process.to_dict(), f, ensure_ascii=False, indent=4)
+            if isinstance(process.movements, MovementBatch):
+                self.__write_batch__(process, f)
+            else:
+                json.dump(process.to_dict(), f, ensure_ascii=False, indent=4)
+
+    def __movement_refs__(self, movements) -> List[Dict[str, Any]]:
+        put = self.description_store.put
+        if isinstance(movements, MovementBatch):
+            ids = movements.map_descriptions(put)
+            dates = movements.dates()
+        else:
+            ids = [put(m.description) for m in movements]
+            dates = [m.date for m in movements]
+        return [
+            {"date": date, "description_id": key}
+            for date, key in zip(dates, ids)
+        ]
+
+    @staticmethod
+    def __write_batch__(process: Process, f) -> None:
+        # Same output as json.dump, with the movements serialized by the
+        # batch: the document is closed after the movements list, which is
+        # its last key
+        data = json.dumps(
+            process.to_dict(include_movements=False),
+            ensure_ascii=False,
+            indent=4,
+        )
+        f.write(data[: -len("\n}")])
+        f.write(',\n    "movements": ')
+        f.write(process.movements.to_json(indent=4, level=1))
+        f.write("\n}")
@@ -0,0 +1,237 @@
+"""Service to monitor a portfolio of processes for new movements."""
+
+import heapq
+import json
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from logging import getLogger
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from config import ScraperConfig
+from exceptions import ScraperException
+from models.movement import Movement
+from models.movement_batch import latest_movement_day
+from models.process import Process
+from services.movement_service import MovementService
+from services.process_service import ProcessService
+from storage.presearch_cache import normalize_name
+from utils.file_utils import load_json, write_json_atomic
+
+logger = getLogger("tjpa_scraper")
+
+ARCHIVED_SITUATIONS = ("arquivado", "baixado", "extinto", "encerrado")
+
+
+def is_archived(situation: str) -> bool:
+    """Check whether a ``situacao`` value means the process is archived."""
+    normalized = normalize_name(situation or "")
+    return any(word in normalized for word in ARCHIVED_SITUATIONS)
+
+
+@dataclass
+class MonitoredEntry:
+    """Scheduling state of a monitored CNJ."""
+
+    cnj: str
+    next_poll: float = 0.0
+    last_activity: Optional[int] = None
+    archived: bool = False
+    last_search: float = 0.0
+    processes: List[Process] = field(default_factory=list, repr=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for the schedule file."""
+        return {
+            "next_poll": self.next_poll,
+            "last_activity": self.last_activity,
+            "archived": self.archived,
+        }
+
+    @classmethod
+    def from_dict(cls, cnj: str, data: Dict[str, Any]) -> "MonitoredEntry":
+        """Create an entry from its stored dictionary."""
+        return cls(
+            cnj=cnj,
+            next_poll=data.get("next_poll", 0.0),
+            last_activity=data.get("last_activity"),
+            archived=data.get("archived", False),
+        )
+
+
+@dataclass
+class JsonlMovementSink:
+    """Appends newly seen movements to a JSON-lines file."""
+
+    path: str
+
+    def __post_init__(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+
+    def __call__(self, process: Process, movements: List[Movement]) -> None:
+        detected_at = datetime.now().isoformat(timespec="seconds")
+        with open(self.path, "a", encoding="utf-8") as f:
+            for movement in movements:
+                record = {
+                    "number": process.number,
+                    "formatted_number": process.formatted_number,
+                    "cd_instance": process.cd_instance,
+                    "detected_at": detected_at,
+                    **movement.to_dict(),
+                }
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+@dataclass
+class MonitorService:
+    """
+    Long-running monitor of a portfolio of CNJs.
+
+    Each CNJ is polled through the existing services: the process search is
+    repeated only every ``monitor_search_interval`` seconds and, in between,
+    a poll costs one movement page per process instance. The next poll of a
+    CNJ is scheduled from its last movement date, so recently active
+    processes are polled often and dormant or archived ones rarely. Only
+    movements not seen before are passed to ``sink``; the first poll of a
+    process just records its baseline.
+
+    The global request budget is enforced by the ApiClient's TokenBucket.
+    """
+
+    process_service: ProcessService
+    movement_service: MovementService
+    config: ScraperConfig
+    schedule_path: str
+    sink: Callable[[Process, List[Movement]], None]
+    save_every: int = 50
+    _entries: Dict[str, MonitoredEntry] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _queue: List[Tuple[float, str]] = field(
+        default_factory=list, init=False, repr=False
+    )
+    _stop: threading.Event = field(
+        default_factory=threading.Event, init=False, repr=False
+    )
+
+    def __post_init__(self):
+        if self.movement_service.state_store is None:
+            raise ValueError("MonitorService requires a ProcessStateStore")
+        stored = load_json(self.schedule_path, default={})
+        for cnj, data in stored.items():
+            self._entries[cnj] = MonitoredEntry.from_dict(cnj, data)
+
+    def set_portfolio(self, cnjs: Iterable[str]) -> int:
+        """
+        Define the monitored CNJs, keeping the schedule of known ones.
+
+        Returns:
+            The number of monitored CNJs
+        """
+        entries = {}
+        for cnj in cnjs:
+            digits = re.sub(r"\D", "", cnj)
+            entries[digits] = self._entries.get(digits) or MonitoredEntry(
+                cnj=digits
+            )
+        self._entries = entries
+        self._queue = [(e.next_poll, e.cnj) for e in entries.values()]
+        heapq.heapify(self._queue)
+        return len(entries)
+
+    def run(self, max_polls: int = None) -> None:
+        """Poll due processes until stopped or ``max_polls`` is reached."""
+        polls = 0
+        try:
+            while self._queue and not self._stop.is_set():
+                next_poll, cnj = heapq.heappop(self._queue)
+                entry = self._entries[cnj]
+                delay = next_poll - time.time()
+                if delay > 0 and self._stop.wait(delay):
+                    heapq.heappush(self._queue, (next_poll, cnj))
+                    break
+                self.__safe_poll__(entry)
+                entry.next_poll = time.time() + self.get_interval(entry)
+                heapq.heappush(self._queue, (entry.next_poll, cnj))
+                polls += 1
+                if polls % self.save_every == 0:
+                    self.save()
+                if max_polls and polls >= max_polls:
+                    break
+        finally:
+            self.save()
+
+    def stop(self) -> None:
+        """Ask the run loop to stop."""
+        self._stop.set()
+
+    def poll(self, entry: MonitoredEntry) -> int:
+        """
+        Poll a single CNJ and emit its new movements.
+
+        Returns:
+            The number of new movements emitted
+        """
+        now = time.time()
+        if (
+            not entry.processes
+            or now - entry.last_search >= self.config.monitor_search_interval
+        ):
+            entry.processes = self.process_service.search(entry.cnj)
+            entry.last_search = now
+            entry.archived = bool(entry.processes) and all(
+                is_archived(process.situation) for process in entry.processes
+            )
+
+        emitted = 0
+        state_store = self.movement_service.state_store
+        for process in entry.processes:
+            had_state = state_store.get(process.identity) is not None
+            update = self.movement_service.get_new_movements(process)
+            if update is None:
+                continue
+            day = latest_movement_day(update.movements)
+            if day and (entry.last_activity or 0) < day:
+                entry.last_activity = day
+            if update.full:
+                if had_state:
+                    logger.warning(
+                        "Movement history of %s changed, new baseline stored",
+                        process.number,
+                    )
+            elif update.movements:
+                self.sink(process, update.movements)
+                emitted += len(update.movements)
+            self.movement_service.save_state(process)
+        if emitted:
+            logger.info("%d new movement(s) for %s", emitted, entry.cnj)
+        return emitted
+
+    def get_interval(self, entry: MonitoredEntry) -> float:
+        """Return the seconds until the next poll of a CNJ."""
+        if entry.archived:
+            return self.config.monitor_archived_interval
+        if entry.last_activity is None:
+            return self.config.monitor_max_interval
+        age_days = date.today().toordinal() - entry.last_activity
+        for max_age_days, interval in self.config.monitor_activity_tiers:
+            if age_days <= max_age_days:
+                return interval
+        return self.config.monitor_max_interval
+
+    def save(self) -> None:
+        """Persist the schedule and the movement state."""
+        write_json_atomic(
+            self.schedule_path,
+            {cnj: entry.to_dict() for cnj, entry in self._entries.items()},
+        )
+        self.movement_service.state_store.save()
+
+    def __safe_poll__(self, entry: MonitoredEntry) -> None:
+        try:
+            self.poll(entry)
+        except (ScraperException, AttributeError, OSError) as e:
+            logger.error("Failed to poll %s: %s", entry.cnj, e)
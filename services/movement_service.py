@@ -1,58 +1,326 @@
 """ "Service to handle fetching and processing movement data from the API."""
 
-from dataclasses import dataclass
-from typing import Any, Dict, List
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from client.api_client import ApiClient
+from client.page_size_tuner import PageSizeTuner
 from models.movement import Movement
+from models.movement_batch import MovementBatch
 from models.process import Process
+from storage.process_state import (
+    ProcessState,
+    ProcessStateStore,
+    movement_fingerprint,
+)
+
+MOVEMENTS_PAGE_SIZE = 1000
+
+
+@dataclass
+class MovementUpdate:
+    """
+    Movements returned by an incremental fetch.
+
+    Attributes:
+        movements: The new movements, or every movement when ``full``
+        full: Whether the whole history had to be fetched again
+    """
+
+    movements: List[Movement]
+    full: bool = False
 
 
 @dataclass
 class MovementService:
     """
     Service to handle fetching and processing movement data from the API.
+
+    With a ``columnar_threshold``, processes with at least that many
+    movements get a ``MovementBatch`` instead of a list of movements.
+
+    With a ``state_store``, each fetch stages the movement state of the
+    process (count and last movement fingerprint), which ``save_state``
+    stores once the movements were exported, so a failed export does not
+    move the refresh baseline forward.
     """
 
     api_client: ApiClient
+    state_store: ProcessStateStore = None
+    page_size_tuner: PageSizeTuner = None
+    columnar_threshold: int = None
+    _staged: Dict[str, ProcessState] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+
+    def get_page_size(self) -> int:
+        """Return the page size of the next movement fetch."""
+        if self.page_size_tuner is None:
+            return MOVEMENTS_PAGE_SIZE
+        return self.page_size_tuner.page_size(
+            self.api_client.config.movements_api_route
+        )
 
     def get_movements(
         self,
         process: Process,
         page_number: int = 1,
     ) -> List[Movement]:
-        """Fetch movements for a given process."""
-        movements_result = []
-        movements = self.__fetch_movements__(process, page_number)
-        for movement in movements:
-            movements_result.append(Movement.from_dict(movement))
-        return movements_result
+        """
+        Fetch movements for a given process.
 
-    def __fetch_movements__(
+        With a ``columnar_threshold``, the ``qtdRegistrosTotal`` of the
+        first page decides whether the movements are collected into a
+        ``MovementBatch`` or built as ``Movement`` instances.
+        """
+        page_size = self.get_page_size()
+        first_page = self.__fetch_page__(process, page_number, page_size)
+        if (
+            self.columnar_threshold is not None
+            and first_page[0] >= self.columnar_threshold
+        ):
+            batch = MovementBatch()
+            self.__collect_all__(
+                process, page_number, page_size, batch.append_api, first_page
+            )
+            return batch
+        movements = []
+
+        def add(movement: Dict[str, Any]) -> None:
+            movements.append(Movement.from_dict(movement))
+
+        self.__collect_all__(process, page_number, page_size, add, first_page)
+        return movements
+
+    def get_movement_batch(
+        self, process: Process, page_number: int = 1
+    ) -> MovementBatch:
+        """
+        Fetch the movements of a process into a columnar batch.
+
+        Each ``listaResultado`` page is appended to the batch as it
+        arrives, so no ``Movement`` or raw dictionary is kept per row.
+        """
+        batch = MovementBatch()
+        self.__collect_all__(
+            process, page_number, self.get_page_size(), batch.append_api
+        )
+        return batch
+
+    def save_state(self, process: Process) -> None:
+        """
+        Store the movement state staged by the last fetch of a process.
+
+        Call it once the fetched movements were exported (or otherwise
+        handled); until then a refresh still compares against the previous
+        state.
+        """
+        with self._lock:
+            state = self._staged.pop(process.identity, None)
+        if state is not None:
+            self.state_store.put(process.identity, state)
+
+    def count_movements(self, process: Process) -> int:
+        """
+        Return the number of movements of a process.
+
+        Only the first movement page is requested.
+        """
+        return self.__fetch_page__(process, 1, self.get_page_size())[0]
+
+    def refresh_movements(
         self,
         process: Process,
-        page_number: int = 1,
-        result: List[Dict[str, Any]] = None,
-        total_records: int = 0,
-    ) -> List[Dict[str, Any]]:
-        result = result or []
+        known_movements: Optional[List[Movement]],
+    ) -> Optional[List[Movement]]:
+        """
+        Refresh the movements of a previously fetched process.
+
+        New movements, as found by ``get_new_movements``, are appended to
+        ``known_movements``. Without known movements every movement is
+        fetched again.
+
+        Returns:
+            None if the process did not change, otherwise the full,
+            up to date list of movements
+        """
+        if known_movements is None:
+            return self.get_movements(process)
+        update = self.get_new_movements(process)
+        if update is None:
+            return None
+        if update.full:
+            return update.movements
+        return known_movements + update.movements
+
+    def get_new_movements(self, process: Process) -> Optional[MovementUpdate]:
+        """
+        Fetch only the movements added since the stored state of a process.
+
+        The first page is fetched to compare ``qtdRegistrosTotal`` with the
+        stored state. Unchanged processes cost that single request. When new
+        movements exist, only the pages from the last known movement onwards
+        are fetched. If the stored fingerprint no longer matches the
+        movement at its position, or there is no stored state, every
+        movement is fetched again and the update is marked as ``full``.
+
+        Returns:
+            None if the process did not change, otherwise a MovementUpdate
+        """
+        state = self.state_store.get(process.identity)
+        if state is None:
+            return MovementUpdate(self.get_movements(process), full=True)
+
+        page_size = self.get_page_size()
+        total_records, first_page = self.__fetch_page__(process, 1, page_size)
+        if first_page is None or total_records == state.total:
+            return None
+        if total_records < state.total or state.total == 0:
+            return MovementUpdate(self.get_movements(process), full=True)
+
+        last_index = state.total - 1
+        page_number = last_index // page_size + 1
+        if page_number == 1:
+            tail_start = first_page
+        else:
+            tail_start = (
+                self.__fetch_page__(process, page_number, page_size)[1] or []
+            )
+        offset = last_index % page_size
+        if (
+            len(tail_start) <= offset
+            or movement_fingerprint(tail_start[offset]) != state.fingerprint
+        ):
+            return MovementUpdate(self.get_movements(process), full=True)
+
+        new_movements = tail_start[offset + 1 :]
+        missing = total_records - state.total
+        if len(new_movements) < missing:
+            new_movements, _ = self.__fetch_movements__(
+                process,
+                page_number + 1,
+                page_size,
+                result=new_movements,
+                total_records=missing,
+            )
+        self.__stage_state__(
+            process,
+            new_movements[-1] if new_movements else None,
+            min(state.total + len(new_movements), total_records),
+        )
+        return MovementUpdate(
+            [Movement.from_dict(movement) for movement in new_movements],
+            full=False,
+        )
+
+    def __collect_all__(
+        self,
+        process: Process,
+        page_number: int,
+        page_size: int,
+        add: Callable[[Dict[str, Any]], None],
+        first_page: Tuple[int, Optional[List[Dict[str, Any]]]] = None,
+    ) -> None:
+        seen: Set[frozenset] = set()
+        total_records, last = self.__collect_movements__(
+            process, page_number, page_size, add, seen, 0, first_page
+        )
+        # A page that failed (and came back empty) ends the fetch early; the
+        # state then only covers the movements actually collected
+        self.__stage_state__(process, last, min(len(seen), total_records))
+
+    def __stage_state__(
+        self,
+        process: Process,
+        last: Optional[Dict[str, Any]],
+        total: int,
+    ) -> None:
+        if self.state_store is None:
+            return
+        with self._lock:
+            if last is None:
+                self._staged.pop(process.identity, None)
+            else:
+                self._staged[process.identity] = ProcessState(
+                    total=total, fingerprint=movement_fingerprint(last)
+                )
+
+    def __fetch_page__(
+        self, process: Process, page_number: int, page_size: int
+    ) -> Tuple[int, Optional[List[Dict[str, Any]]]]:
+        route = self.api_client.config.movements_api_route
+        if self.page_size_tuner:
+            self.api_client.take_request_info()
         response = self.api_client.get(
-            f"{self.api_client.config.movements_api_route}"
+            f"{route}"
             f"{process.number}/"
             f"{process.cd_doc_process}/"
             f"{process.cd_instance}/"
-            f"{page_number}/1000"
+            f"{page_number}/{page_size}"
         )
         if isinstance(response, list) and len(response) == 0:
-            return result
-        total_records = total_records or response.get("qtdRegistrosTotal", 0)
-        page_result = response.get("listaResultado", [])
-        if not page_result or len(page_result) == 0:
-            return result
-        result.extend(page_result)
-        result = list({frozenset(i.items()): i for i in result}.values())
-        if len(result) < total_records:
-            result = self.__fetch_movements__(
-                process, page_number + 1, result, total_records
+            page_result = None
+            total_records = 0
+        else:
+            page_result = response.get("listaResultado", []) or None
+            total_records = response.get("qtdRegistrosTotal", 0)
+        if self.page_size_tuner:
+            self.page_size_tuner.observe(
+                route,
+                page_size,
+                len(page_result or []),
+                self.api_client.take_request_info(),
             )
-        return result
+        if page_result is None:
+            return 0, None
+        return total_records, page_result
+
+    def __fetch_movements__(
+        self,
+        process: Process,
+        page_number: int = 1,
+        page_size: int = MOVEMENTS_PAGE_SIZE,
+        result: List[Dict[str, Any]] = None,
+        total_records: int = 0,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        result = result or []
+        seen = {frozenset(movement.items()) for movement in result}
+        total_records, _ = self.__collect_movements__(
+            process, page_number, page_size, result.append, seen, total_records
+        )
+        return result, total_records
+
+    def __collect_movements__(
+        self,
+        process: Process,
+        page_number: int,
+        page_size: int,
+        add: Callable[[Dict[str, Any]], None],
+        seen: Set[frozenset],
+        total_records: int,
+        page: Tuple[int, Optional[List[Dict[str, Any]]]] = None,
+    ) -> Tuple[int, Optional[Dict[str, Any]]]:
+        # Pages are read until ``total_records`` distinct movements were
+        # passed to ``add``, starting with ``page`` when ``page_number`` was
+        # already fetched; returns the total and the last movement added
+        last = None
+        while True:
+            if page is None:
+                page = self.__fetch_page__(process, page_number, page_size)
+            (page_total, page_result), page = page, None
+            if page_result is None:
+                return total_records, last
+            total_records = total_records or page_total
+            for movement in page_result:
+                key = frozenset(movement.items())
+                if key not in seen:
+                    seen.add(key)
+                    add(movement)
+                    last = movement
+            if len(seen) >= total_records:
+                return total_records, last
+            page_number += 1
@@ -0,0 +1,85 @@
+"""Run-wide registry of processes already fetched in a batch."""
+
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+
+@dataclass
+class RegistryEntry:
+    """State of a process known to the registry."""
+
+    owner: str
+    queries: List[str] = field(default_factory=list)
+    file_name: Optional[str] = None
+    done: threading.Event = field(default_factory=threading.Event)
+    failed: bool = False
+
+
+@dataclass
+class ProcessRegistry:
+    """
+    Registry keyed by process identity (number, document and instance), so
+    a process found by several queries of the same run has its movements
+    fetched and its files exported only once.
+    """
+
+    _entries: Dict[str, RegistryEntry] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+
+    def claim(self, identity: str, query: str) -> bool:
+        """
+        Claim a process for the given query.
+
+        If another query is already fetching the process, this waits until it
+        finishes. When it failed, the claim is transferred to the caller.
+
+        Returns:
+            True if the caller must fetch and export the process, False if it
+            was already handled and the query was linked to it
+        """
+        while True:
+            with self._lock:
+                entry = self._entries.get(identity)
+                if entry is None or entry.failed:
+                    self._entries[identity] = RegistryEntry(
+                        owner=query, queries=[query]
+                    )
+                    return True
+                if query not in entry.queries:
+                    entry.queries.append(query)
+                if entry.done.is_set():
+                    return False
+            entry.done.wait()
+
+    def complete(self, identity: str, file_name: Optional[str]) -> None:
+        """Mark a claimed process as fetched and exported."""
+        with self._lock:
+            entry = self._entries[identity]
+            entry.file_name = file_name
+        entry.done.set()
+
+    def release(self, identity: str) -> None:
+        """Give up a claim after a failure so another query can retry it."""
+        with self._lock:
+            entry = self._entries[identity]
+            entry.failed = True
+        entry.done.set()
+
+    def get_file_name(self, identity: str) -> Optional[str]:
+        """Return the export file name of a completed process."""
+        entry = self._entries.get(identity)
+        return entry.file_name if entry else None
+
+    def links(self) -> Dict[str, List[str]]:
+        """Return the queries linked to each process found more than once."""
+        with self._lock:
+            return {
+                identity: list(entry.queries)
+                for identity, entry in self._entries.items()
+                if len(entry.queries) > 1
+            }
@@ -2,20 +2,46 @@
 Service to handle fetching and processing legal process data from the API.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from logging import getLogger
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Iterator, List, Optional
 
 from client.api_client import ApiClient
+from client.page_size_tuner import PageSizeTuner
+from client.priority_scheduler import Lane, use_lane
 from entities.request_type import RequestType
 from exceptions import ProcessNotFoundError
+from models.lazy_process import LazyProcess
 from models.process import Process
 from services.export_service import ExportService
 from services.movement_service import MovementService
+from services.process_registry import ProcessRegistry
+from storage.journal import PAGE, PAGE_SIZE, PROCESS, QUERY, Journal
+from storage.presearch_cache import PresearchCache
 
 logger = getLogger("tjpa_scraper")
 
 
+@dataclass
+class SearchPage:
+    """
+    Parsed response of a single search request.
+
+    Attributes:
+        processes: Raw process dictionaries of the page
+        presearch: ``nome``/``sistema`` entries of a party-name presearch
+        total_records: ``qtdRegistrosTotal`` of a paginated search
+        paginated: Whether the response is a page of a paginated search
+        page_size: Page size of the request, if it was paginated
+    """
+
+    processes: List[Dict[str, Any]] = field(default_factory=list)
+    presearch: List[Dict[str, Any]] = field(default_factory=list)
+    total_records: int = 0
+    paginated: bool = False
+    page_size: int = None
+
+
 @dataclass
 class ProcessService:
     """
@@ -25,6 +51,11 @@ class ProcessService:
     api_client: ApiClient
     export_service: ExportService
     movement_service: MovementService
+    presearch_cache: PresearchCache = None
+    journal: Journal = None
+    registry: ProcessRegistry = None
+    refresh: bool = False
+    page_size_tuner: PageSizeTuner = None
 
     def get_processes(
         self,
@@ -32,8 +63,36 @@ class ProcessService:
         system_name: str = None,
         page_number: int = None,
         page_size: int = None,
-    ) -> None:
-        """Fetch processes based on request data and system name."""
+    ) -> int:
+        """
+        Fetch processes based on request data and system name, then fetch
+        their movements and export them.
+
+        When a journal is configured, completed search pages and exported
+        processes are recorded so an interrupted run resumes where it
+        stopped. Requests run in the default lane of the request type, so
+        CNJ lookups go ahead of bulk searches when a scheduler is in use.
+
+        Returns:
+            The number of processes found
+        """
+        lane = Lane.for_request_type(RequestType.get_type(request_data))
+        with use_lane(lane):
+            return self.__get_processes__(
+                request_data, system_name, page_number, page_size
+            )
+
+    def __get_processes__(
+        self,
+        request_data: str,
+        system_name: str = None,
+        page_number: int = None,
+        page_size: int = None,
+    ) -> int:
+        if self.journal and self.journal.is_done(request_data, QUERY):
+            count = self.journal.get(request_data, QUERY)
+            logger.info("Skipping %s: already completed", request_data)
+            return count
         processes = self.__fetch_processes__(
             request_data, system_name, page_number, page_size
         )
@@ -42,85 +101,376 @@ class ProcessService:
                 f"No processes found for: {request_data}"
             )
         logger.info("Found %d process(es)", len(processes))
-        for process in processes:
-            logger.info(
-                "Exporting %d/%d: %s",
-                processes.index(process) + 1,
-                len(processes),
-                process.get("numero"),
-            )
+        for index, process in enumerate(processes, start=1):
             process_instance = Process.from_dict(process)
-            process_instance.movements = self.movement_service.get_movements(
-                process_instance
+            if self.journal and self.journal.is_done(
+                request_data, PROCESS, process_instance.identity
+            ):
+                logger.info(
+                    "Skipping %d/%d: %s already exported",
+                    index,
+                    len(processes),
+                    process.get("numero"),
+                )
+                continue
+            if self.registry and not self.registry.claim(
+                process_instance.identity, request_data
+            ):
+                logger.info(
+                    "Linking %d/%d: %s already fetched in this run",
+                    index,
+                    len(processes),
+                    process.get("numero"),
+                )
+                file_name = self.registry.get_file_name(
+                    process_instance.identity
+                )
+            else:
+                logger.info(
+                    "Exporting %d/%d: %s",
+                    index,
+                    len(processes),
+                    process.get("numero"),
+                )
+                file_name = self.__fetch_and_export__(process_instance)
+            if self.journal:
+                self.journal.record(
+                    request_data,
+                    PROCESS,
+                    process_instance.identity,
+                    {"file": file_name},
+                )
+        if self.journal:
+            self.journal.record(request_data, QUERY, data=len(processes))
+            self.journal.flush()
+        return len(processes)
+
+    def search(self, request_data: str) -> List[Process]:
+        """
+        Search processes without fetching their movements or exporting them.
+
+        Returns:
+            The processes found, with empty movement lists
+        """
+        processes = self.__fetch_processes__(request_data)
+        return [Process.from_dict(process) for process in processes]
+
+    def iter_processes(
+        self,
+        request_data: str,
+        fetch_movements: bool = True,
+        limit: Optional[int] = None,
+        lazy: bool = False,
+    ) -> Iterator[Process]:
+        """
+        Yield the processes of a search without exporting them.
+
+        Search pages are requested lazily, so pagination stops once
+        ``limit`` processes were yielded or the caller stops iterating.
+        Pass the iterator to ``ExportService.export_each`` to also write
+        the exports. The refresh state of the movements is not updated; call
+        ``movement_service.save_state`` once a process was exported.
+
+        Args:
+            request_data: The search query string
+            fetch_movements: Whether to fetch the movements of each process
+            limit: Maximum number of processes to yield
+            lazy: Yield ``LazyProcess`` views that only read the fields the
+                caller accesses, for searches that are mostly filtered
+
+        Returns:
+            An iterator over the processes found
+        """
+
+        def fetch_movements_of(process: Process) -> None:
+            process.movements = self.movement_service.get_movements(process)
+
+        return self.__iter_processes__(
+            request_data,
+            limit,
+            fetch_movements_of if fetch_movements else None,
+            LazyProcess if lazy else Process.from_dict,
+        )
+
+    def stream_processes(
+        self, request_data: str, limit: Optional[int] = None
+    ) -> Iterator[Process]:
+        """
+        Yield processes as soon as their movements are fetched and they are
+        exported.
+
+        Like ``iter_processes``, but every process is exported (or only
+        refreshed, in refresh mode) before it is yielded.
+
+        Args:
+            request_data: The search query string
+            limit: Maximum number of processes to yield
+
+        Returns:
+            An iterator over the exported processes
+        """
+        return self.__iter_processes__(
+            request_data, limit, self.__update_and_export__
+        )
+
+    def __iter_processes__(
+        self,
+        request_data: str,
+        limit: Optional[int],
+        prepare: Optional[Callable[[Process], Any]],
+        build: Callable[[Dict[str, Any]], Process] = Process.from_dict,
+    ) -> Iterator[Process]:
+        lane = Lane.for_request_type(RequestType.get_type(request_data))
+        results = self.__iter_search__(request_data)
+        count = 0
+        try:
+            while limit is None or count < limit:
+                # The lane only applies while this generator runs, not
+                # while the caller holds a yielded process
+                with use_lane(lane):
+                    data = next(results, None)
+                    if data is None:
+                        return
+                    process = build(data)
+                    if prepare:
+                        prepare(process)
+                count += 1
+                yield process
+        finally:
+            results.close()
+
+    def __fetch_and_export__(self, process: Process) -> str:
+        try:
+            file_name = self.__update_and_export__(process)
+        except BaseException:
+            if self.registry:
+                self.registry.release(process.identity)
+            raise
+        if self.registry:
+            self.registry.complete(process.identity, file_name)
+        return file_name
+
+    def __update_and_export__(self, process: Process) -> str:
+        if not self.refresh:
+            process.movements = self.movement_service.get_movements(process)
+        else:
+            movements = self.movement_service.refresh_movements(
+                process, self.export_service.load_movements(process)
             )
-            self.export_service.export(process_instance)
+            if movements is None:
+                logger.info("No new movements for: %s", process.number)
+                return self.export_service.get_file_name(process)
+            process.movements = movements
+        file_name = self.export_service.export(process)
+        self.movement_service.save_state(process)
+        return file_name
 
-    def __fetch_processes__(
+    def fetch_search_page(
         self,
         request_data: str,
         system_name: str = None,
         page_number: int = None,
         page_size: int = None,
-        result: List[Dict[str, Any]] = None,
-        total_records: int = 0,
-    ) -> List[Dict[str, Any]]:
-        result = result or []
+    ) -> SearchPage:
+        """
+        Fetch and parse a single search request.
+
+        Depending on the request, the API answers with the presearch list
+        of names and systems, with a plain list of processes or with a page
+        of a paginated search. Without an explicit ``page_size``, paginated
+        searches use the size chosen by the page size tuner.
+        """
         request_type = RequestType.get_type(request_data)
+        endpoint = request_type.get_route_by_type()
+        if page_size is None and self.__is_tunable__(
+            request_type, system_name
+        ):
+            page_size = self.__get_page_size__(
+                endpoint, request_data, system_name
+            )
         url = request_type.get_request_url(
             request_data,
             system_name=system_name,
             page_number=page_number,
             page_size=page_size,
         )
-        response = self.api_client.get(url)
+        if self.page_size_tuner:
+            self.api_client.take_request_info()
+        response = self.__get_page__(
+            request_type, request_data, system_name, url
+        )
+        page = self.__parse_search_page__(response)
+        page.page_size = page_size
+        if self.page_size_tuner and page_size:
+            info = self.api_client.take_request_info()
+            if info.elapsed or info.timeouts:
+                self.page_size_tuner.observe(
+                    endpoint, page_size, len(page.processes), info
+                )
+        return page
+
+    def __parse_search_page__(self, response: Any) -> SearchPage:
         if isinstance(response, list):
             if len(response) == 0:
-                return result or []
-            return self.__handle_list_data__(response)
+                return SearchPage()
+            first = response[0]
+            if not first["nome"] and not first["sistema"]:
+                if not first.get("numero"):
+                    raise AttributeError(
+                        "No processes found for the given request."
+                    )
+                return SearchPage(processes=response)
+            return SearchPage(
+                presearch=[
+                    item
+                    for item in response
+                    if item.get("nome") and item.get("sistema")
+                ]
+            )
         processes = response.get("listaProcessos")
-        if not processes:
-            search_results = response.get("listaResultado")
-            if not search_results or len(search_results) == 0:
-                return result or []
-            total_records = total_records or response.get(
-                "qtdRegistrosTotal", 0
+        if processes:
+            return SearchPage(processes=processes)
+        search_results = response.get("listaResultado")
+        if not search_results:
+            return SearchPage()
+        page = SearchPage(
+            total_records=response.get("qtdRegistrosTotal", 0),
+            paginated=True,
+        )
+        for result_item in search_results:
+            result_processes = result_item.get("listaProcessos")
+            if result_processes:
+                page.processes.extend(result_processes)
+        return page
+
+    def __fetch_processes__(
+        self,
+        request_data: str,
+        system_name: str = None,
+        page_number: int = None,
+        page_size: int = None,
+    ) -> List[Dict[str, Any]]:
+        return list(
+            self.__iter_search__(
+                request_data, system_name, page_number, page_size
             )
-            for result_item in search_results:
-                result_processes = result_item.get("listaProcessos")
-                if result_processes:
-                    result.extend(result_processes)
-            result = self.__deduplicate_processes__(result)
-            if len(result) < total_records:
-                result = self.__fetch_processes__(
-                    request_data,
-                    system_name,
-                    page_number + 1,
-                    page_size,
-                    result,
-                    total_records,
-                )
-            return result
-        result.extend(processes)
-        return result
-
-    def __handle_list_data__(self, request_data):
-        if not request_data[0]["nome"] and not request_data[0]["sistema"]:
-            if not request_data[0].get("numero"):
-                raise AttributeError(
-                    "No processes found for the given request."
-                )
-            return request_data
-        return self.__handle_party_name_presearch__(request_data)
-
-    def __handle_party_name_presearch__(self, request_data):
-        processes_result = []
-        for item in request_data:
-            if item.get("nome") and item.get("sistema"):
-                processes_data = self.__fetch_processes__(
-                    item["nome"], item["sistema"], 1, 1000
-                )
-                processes_result.extend(processes_data)
-        return processes_result
+        )
+
+    def __iter_search__(
+        self,
+        request_data: str,
+        system_name: str = None,
+        page_number: int = None,
+        page_size: int = None,
+        seen: set = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the raw processes of a search, one page at a time.
+
+        Pages are only requested when the consumer asks for more processes
+        than the previous pages returned. A search is paginated until a page
+        comes back empty or its own distinct processes reach
+        ``total_records``; ``seen`` (shared by the presearch sub-searches)
+        only keeps processes already yielded from being yielded again.
+        """
+        seen = set() if seen is None else seen
+        found = set()
+        while True:
+            page = self.fetch_search_page(
+                request_data, system_name, page_number, page_size
+            )
+            if page.presearch:
+                for item in page.presearch:
+                    yield from self.__iter_search__(
+                        item["nome"], item["sistema"], 1, seen=seen
+                    )
+                return
+            for process in page.processes:
+                key = self.__make_hashable__(process)
+                found.add(key)
+                if key in seen:
+                    continue
+                seen.add(key)
+                yield process
+            if (
+                not page.paginated
+                or not page.processes
+                or len(found) >= page.total_records
+            ):
+                return
+            page_number = (page_number or 1) + 1
+            page_size = page.page_size
+
+    def __get_page__(
+        self,
+        request_type: RequestType,
+        request_data: str,
+        system_name: str,
+        url: str,
+    ) -> Any:
+        if self.journal:
+            response = self.journal.get(request_data, PAGE, url)
+            if response is not None:
+                return response
+        if self.__is_presearch__(request_type, system_name):
+            response = self.__get_presearch__(request_type, request_data, url)
+        else:
+            response = self.api_client.get(url)
+        if self.journal and response:
+            self.journal.record(request_data, PAGE, url, response)
+        return response
+
+    def __is_tunable__(
+        self, request_type: RequestType, system_name: str
+    ) -> bool:
+        return request_type is not RequestType.CNJ and not (
+            self.__is_presearch__(request_type, system_name)
+        )
+
+    def __get_page_size__(
+        self, endpoint: str, request_data: str, system_name: str
+    ) -> int:
+        # The page size is part of the URLs keying the journaled pages, so a
+        # resumed search keeps the size it started with even if the tuner
+        # has changed it since
+        key = system_name or ""
+        if self.journal:
+            page_size = self.journal.get(request_data, PAGE_SIZE, key)
+            if page_size:
+                return page_size
+        if self.page_size_tuner is None:
+            page_size = self.api_client.config.default_page_size
+        else:
+            page_size = self.page_size_tuner.page_size(endpoint)
+        if self.journal:
+            self.journal.record(request_data, PAGE_SIZE, key, page_size)
+        return page_size
+
+    def __is_presearch__(
+        self, request_type: RequestType, system_name: str
+    ) -> bool:
+        return system_name is None and request_type in [
+            RequestType.NOME_PARTE,
+            RequestType.NOME_PARTE_EXATO,
+        ]
+
+    def __get_presearch__(
+        self, request_type: RequestType, request_data: str, url: str
+    ) -> Any:
+        if self.presearch_cache is None:
+            return self.api_client.get(url)
+        cached = self.presearch_cache.get(request_type.name, request_data)
+        if cached is not None:
+            logger.debug("Presearch cache hit for: %s", request_data)
+            return cached
+        response = self.api_client.get(url)
+        if (
+            isinstance(response, list)
+            and response
+            and all(item.get("sistema") for item in response)
+        ):
+            self.presearch_cache.put(request_type.name, request_data, response)
+        return response
 
     def __make_hashable__(self, obj):
         if isinstance(obj, dict):
@@ -130,13 +480,3 @@ class ProcessService:
         if isinstance(obj, list):
             return tuple(self.__make_hashable__(i) for i in obj)
         return obj
-
-    def __deduplicate_processes__(self, processes):
-        seen = set()
-        unique_processes = []
-        for process in processes:
-            hashable_process = self.__make_hashable__(process)
-            if hashable_process not in seen:
-                seen.add(hashable_process)
-                unique_processes.append(process)
-        return unique_processes
@@ -0,0 +1,193 @@
+"""Worker that processes search and movement tasks from a WorkQueue."""
+
+import os
+import socket
+import time
+from dataclasses import dataclass, field
+from logging import getLogger
+from typing import Dict, Iterable, List
+
+from client.priority_scheduler import Lane
+from entities.request_type import RequestType
+from exceptions import InvalidRequestError, ScraperException
+from models.lazy_process import LazyProcess
+from models.process import Process
+from services.process_service import ProcessService, SearchPage
+from storage.work_queue import LEASED, PENDING, Task, WorkQueue
+
+logger = getLogger("tjpa_scraper")
+
+QUERY = "query"
+PAGE = "page"
+PROCESS = "process"
+
+LANE_PRIORITIES = {Lane.INTERACTIVE: 0, Lane.BULK: 1}
+"""Queue priority of the tasks of each lane (lower ones are leased first)."""
+
+
+def default_worker_id() -> str:
+    """Return an identifier unique to this host and process."""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+@dataclass
+class QueueWorker:
+    """
+    Worker pulling tasks from a shared WorkQueue.
+
+    A ``query`` task fetches the first search page of a query. Presearch
+    results and further pages become ``page`` tasks and every process found
+    becomes a ``process`` task, deduplicated by process identity, which
+    fetches the movements and exports the process. Exports are only
+    written while the worker still holds the task lease.
+
+    Query tasks are queued with the priority of their request type's lane,
+    and their page and process tasks inherit it, so a CNJ lookup queued
+    behind a large OAB crawl is still leased first.
+    """
+
+    queue: WorkQueue
+    process_service: ProcessService
+    worker_id: str = field(default_factory=default_worker_id)
+    poll_interval: float = 1.0
+
+    def enqueue_queries(self, queries: Iterable[str]) -> int:
+        """
+        Add query tasks for every valid query, in its canonical form.
+
+        Returns:
+            The number of queries added
+        """
+        items: Dict[int, List[tuple]] = {}
+        for query in queries:
+            try:
+                request_type = RequestType.get_type(query)
+                query = request_type.normalize(query)
+            except InvalidRequestError as e:
+                logger.warning("Skipping invalid query %s: %s", query, e)
+                continue
+            priority = LANE_PRIORITIES[Lane.for_request_type(request_type)]
+            items.setdefault(priority, []).append(({"query": query}, query))
+        return sum(
+            self.queue.put_many(QUERY, group, priority)
+            for priority, group in sorted(items.items())
+        )
+
+    def run(self, stop_when_empty: bool = True, max_tasks: int = None) -> int:
+        """
+        Process tasks until the queue is drained or ``max_tasks`` is reached.
+
+        Returns:
+            The number of tasks processed
+        """
+        processed = 0
+        while max_tasks is None or processed < max_tasks:
+            task = self.queue.lease(self.worker_id)
+            if task is None:
+                counts = self.queue.counts()
+                if stop_when_empty and not counts[PENDING] + counts[LEASED]:
+                    break
+                time.sleep(self.poll_interval)
+                continue
+            self.handle(task)
+            processed += 1
+        return processed
+
+    def handle(self, task: Task) -> None:
+        """Run a leased task and report its outcome to the queue."""
+        try:
+            if task.kind == PROCESS:
+                self.__handle_process__(task)
+            else:
+                self.__handle_search__(task)
+        except (
+            ScraperException,
+            AttributeError,
+            OSError,
+            ValueError,
+            TypeError,
+        ) as e:
+            logger.error("Task %d (%s) failed: %s", task.id, task.kind, e)
+            self.queue.fail(task, self.worker_id, str(e))
+            return
+        if not self.queue.complete(task, self.worker_id):
+            logger.warning("Lease of task %d was lost", task.id)
+
+    def __handle_search__(self, task: Task) -> None:
+        payload = task.payload
+        request_data = payload.get("request_data", payload["query"])
+        page = self.process_service.fetch_search_page(
+            request_data,
+            payload.get("system_name"),
+            payload.get("page_number"),
+            payload.get("page_size"),
+        )
+        self.__expand__(payload, request_data, page, task.priority)
+
+    def __expand__(
+        self,
+        payload: dict,
+        request_data: str,
+        page: SearchPage,
+        priority: int,
+    ) -> None:
+        query = payload["query"]
+        pages = [
+            (
+                {
+                    "query": query,
+                    "request_data": item["nome"],
+                    "system_name": item["sistema"],
+                    "page_number": 1,
+                },
+                None,
+            )
+            for item in page.presearch
+        ]
+        page_number = payload.get("page_number") or 1
+        page_size = (
+            page.page_size or payload.get("page_size") or len(page.processes)
+        )
+        if (
+            page.paginated
+            and page.processes
+            and page_number * page_size < page.total_records
+        ):
+            pages.append(
+                (
+                    {
+                        **payload,
+                        "request_data": request_data,
+                        "page_number": page_number + 1,
+                        "page_size": page.page_size
+                        or payload.get("page_size"),
+                    },
+                    None,
+                )
+            )
+        if pages:
+            self.queue.put_many(PAGE, pages, priority)
+        processes = [
+            (
+                {"query": query, "process": process},
+                LazyProcess(process).identity,
+            )
+            for process in page.processes
+        ]
+        if processes:
+            added = self.queue.put_many(PROCESS, processes, priority)
+            logger.info(
+                "Queued %d new process(es) for %s", added, request_data
+            )
+
+    def __handle_process__(self, task: Task) -> None:
+        process = Process.from_dict(task.payload["process"])
+        movement_service = self.process_service.movement_service
+        process.movements = movement_service.get_movements(process)
+        if not self.queue.renew(task, self.worker_id):
+            logger.warning(
+                "Lease of %s was lost, skipping export", process.number
+            )
+            return
+        self.process_service.export_service.export(process)
+        movement_service.save_state(process)
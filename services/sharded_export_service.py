@@ -0,0 +1,224 @@
+"""Export service that shards CPU-bound export work across processes."""
+
+import csv
+import json
+import os
+import shutil
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass, field
+from datetime import datetime
+from logging import getLogger
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from config import ScraperConfig
+from models.movement import Movement
+from models.process import Process
+from services.export_service import ExportService
+from services.exporters.csv_exporter import CSV_FIELDS, ConsolidatedCSVExporter
+
+logger = getLogger("tjpa_scraper")
+
+
+def shard_for(process: Process, shards: int) -> int:
+    """
+    Return the shard owning a process.
+
+    Processes are partitioned by the origin segment (``OOOO``) of their
+    CNJ number; malformed numbers fall in shard 0.
+    """
+    cnj = process.cnj
+    return cnj.origin % shards if cnj else 0
+
+
+def export_shard(
+    config: ScraperConfig,
+    base_dir: str,
+    shard_dir: str,
+    processes: List[Process],
+) -> Tuple[str, str, int]:
+    """
+    Export every process of a shard.
+
+    Runs in a worker process. Besides the usual per-process files, the
+    worker writes a consolidated CSV and JSON-lines file that only it owns.
+    Processes are deduplicated by identity; since shards are split by
+    origin, a process always falls in the same shard.
+
+    Returns:
+        The consolidated CSV path, JSON-lines path and number of processes
+    """
+    os.makedirs(shard_dir, exist_ok=True)
+    unique = {process.identity: process for process in processes}
+    export_service = ExportService(config=config, base_dir=base_dir)
+    csv_path = os.path.join(shard_dir, "processes.csv")
+    jsonl_path = os.path.join(shard_dir, "processes.jsonl")
+    consolidated = ConsolidatedCSVExporter(
+        path=csv_path, encoding="utf-8", lineterminator="\n"
+    )
+    with consolidated, open(jsonl_path, "w", encoding="utf-8") as jsonl_file:
+        for process in unique.values():
+            export_service.export(process)
+            consolidated.export(process)
+            jsonl_file.write(
+                json.dumps(process.to_dict(), ensure_ascii=False) + "\n"
+            )
+    return csv_path, jsonl_path, len(unique)
+
+
+def merge_shards(
+    shard_results: List[Tuple[str, str, int]], output_dir: str
+) -> Tuple[str, str]:
+    """
+    Combine the consolidated shard files into a single CSV (one header)
+    and a single JSON-lines file.
+
+    Returns:
+        The merged CSV and JSON-lines paths
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    stamp = f"{datetime.now():%Y%m%d_%H%M%S}"
+    csv_path = os.path.join(output_dir, f"processes_{stamp}.csv")
+    jsonl_path = os.path.join(output_dir, f"processes_{stamp}.jsonl")
+    with open(csv_path, "w", newline="", encoding="utf-8-sig") as csv_out:
+        csv.writer(csv_out, lineterminator="\n").writerow(CSV_FIELDS)
+        for shard_csv, _, _ in shard_results:
+            with open(shard_csv, "r", newline="", encoding="utf-8") as f:
+                f.readline()
+                shutil.copyfileobj(f, csv_out)
+    with open(jsonl_path, "w", encoding="utf-8") as jsonl_out:
+        for _, shard_jsonl, _ in shard_results:
+            with open(shard_jsonl, "r", encoding="utf-8") as f:
+                shutil.copyfileobj(f, jsonl_out)
+    return csv_path, jsonl_path
+
+
+@dataclass
+class ShardedExportService:
+    """
+    Drop-in replacement for ExportService that defers export work to a
+    process pool.
+
+    ``export`` buffers the process in the shard of its CNJ origin segment.
+    Once a shard holds ``chunk_size`` processes, the chunk is handed to a
+    worker process, which writes its files and its own consolidated output,
+    so memory stays bounded and completed chunks survive a crash. At most
+    two chunks per worker wait in the pool; further exports wait for the
+    oldest one. ``close`` exports the remaining chunks and merges every
+    chunk output. Processes are exported once per run, by identity.
+    """
+
+    config: ScraperConfig
+    base_dir: str
+    shards: int = field(default_factory=lambda: os.cpu_count() or 1)
+    chunk_size: int = 500
+    _buffers: Dict[int, List[Process]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _exported: Set[str] = field(default_factory=set, init=False, repr=False)
+    _chunks: List[Tuple[int, int, Future]] = field(
+        default_factory=list, init=False, repr=False
+    )
+    _executor: Any = field(default=None, init=False, repr=False)
+    _export_service: ExportService = field(init=False, repr=False)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+
+    def __post_init__(self):
+        self._export_service = ExportService(
+            config=self.config, base_dir=self.base_dir
+        )
+
+    def export(self, process: Process) -> str:
+        """
+        Buffer a Process instance for export.
+
+        Returns:
+            The base name (without extension) of its exported files
+        """
+        shard = shard_for(process, self.shards)
+        with self._lock:
+            if process.identity not in self._exported:
+                self._exported.add(process.identity)
+                buffer = self._buffers.setdefault(shard, [])
+                buffer.append(process)
+                if len(buffer) >= self.chunk_size:
+                    self.__submit__(shard)
+        return self.get_file_name(process)
+
+    def get_file_name(self, process: Process) -> str:
+        """Return the base name (without extension) of a process' files."""
+        return self._export_service.get_file_name(process)
+
+    def load_movements(self, process: Process) -> Optional[List[Movement]]:
+        """
+        Return the movements of the last JSON export of a process.
+
+        Processes exported in this run are only visible once their chunk
+        has been written by a worker.
+        """
+        return self._export_service.load_movements(process)
+
+    def close(self) -> Tuple[str, str]:
+        """
+        Export every buffered process and merge the chunk outputs.
+
+        Returns:
+            The merged CSV and JSON-lines paths
+        """
+        output_dir = os.path.join(
+            self.base_dir, "data", self.config.consolidated_export_path
+        )
+        with self._lock:
+            for shard in sorted(self._buffers):
+                self.__submit__(shard)
+            chunks, self._chunks = sorted(self._chunks), []
+            executor, self._executor = self._executor, None
+        try:
+            shard_results = [future.result() for *_, future in chunks]
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        merged = merge_shards(shard_results, output_dir)
+        shutil.rmtree(self.__shard_root__(), ignore_errors=True)
+        logger.info(
+            "Exported %d process(es) from %d shard chunk(s) to %s",
+            sum(count for _, _, count in shard_results),
+            len(shard_results),
+            merged[0],
+        )
+        return merged
+
+    def __submit__(self, shard: int) -> None:
+        processes = self._buffers.pop(shard, None)
+        if not processes:
+            return
+        if self._executor is None:
+            # Imported on use: it loads ``multiprocessing``, which the CLI
+            # only needs for sharded exports
+            from concurrent.futures import ProcessPoolExecutor
+
+            self._executor = ProcessPoolExecutor(max_workers=self.shards)
+        pending = [c for c in self._chunks if not c[2].done()]
+        if len(pending) >= 2 * self.shards:
+            wait(
+                [future for *_, future in pending], return_when=FIRST_COMPLETED
+            )
+        chunk = len(self._chunks)
+        future = self._executor.submit(
+            export_shard,
+            self.config,
+            self.base_dir,
+            os.path.join(self.__shard_root__(), f"shard_{shard}_{chunk}"),
+            processes,
+        )
+        self._chunks.append((shard, chunk, future))
+
+    def __shard_root__(self) -> str:
+        return os.path.join(
+            self.base_dir,
+            "data",
+            self.config.consolidated_export_path,
+            "shards",
+        )
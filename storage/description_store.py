@@ -0,0 +1,159 @@
+"""Content-addressed SQLite store of movement descriptions."""
+
+import hashlib
+import sqlite3
+import threading
+from contextlib import closing
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Optional
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS descriptions (
+    id TEXT PRIMARY KEY,
+    text TEXT NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+def description_id(text: str) -> str:
+    """
+    Return the content address of a description.
+
+    The id is derived from the text only (a 64-bit BLAKE2b digest, 16 hex
+    characters), so every process and run computes the same id for the
+    same description without coordinating.
+    """
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+
+
+@dataclass
+class DescriptionStore:
+    """
+    Stores each distinct movement description once, addressed by its id.
+
+    A few hundred boilerplate descriptions make up most of the movement
+    text of a portfolio; exports can reference them by id instead of
+    repeating the text. ``put`` only computes the id and buffers unknown
+    descriptions in memory; ``flush`` writes them in a single transaction.
+    Ids already resolved or stored in this session are answered from
+    memory, so rebuilding the full text is a dictionary lookup for the
+    common descriptions.
+
+    As in the work queue, a new connection is opened per operation, so the
+    store can be shared by threads and processes.
+    """
+
+    path: str
+    timeout: float = 30.0
+    _texts: Dict[str, str] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _ids: Dict[str, str] = field(default_factory=dict, init=False, repr=False)
+    _pending: Dict[str, str] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+
+    def __post_init__(self):
+        with closing(self.__connect__()) as connection:
+            connection.executescript(_SCHEMA)
+
+    def put(self, text: Optional[str]) -> Optional[str]:
+        """
+        Add a description, returning its id (None for a None description).
+
+        The description is only written by the next ``flush``.
+        """
+        if text is None:
+            return None
+        key = self._ids.get(text)
+        if key is None:
+            key = description_id(text)
+            with self._lock:
+                self._ids[text] = key
+                if key not in self._texts:
+                    self._texts[key] = text
+                    self._pending[key] = text
+        return key
+
+    def flush(self) -> int:
+        """
+        Write the descriptions added since the last flush.
+
+        Returns:
+            The number of descriptions written
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+        try:
+            with closing(self.__connect__()) as connection:
+                connection.execute("BEGIN IMMEDIATE")
+                connection.executemany(
+                    "INSERT OR IGNORE INTO descriptions (id, text) "
+                    "VALUES (?, ?)",
+                    pending.items(),
+                )
+                connection.execute("COMMIT")
+        except sqlite3.Error:
+            # Kept for the next flush, the ids are already handed out
+            with self._lock:
+                self._pending.update(pending)
+            raise
+        return len(pending)
+
+    def get(self, key: Optional[str]) -> Optional[str]:
+        """
+        Return the description of an id.
+
+        Raises:
+            KeyError: If the id is not in the store
+        """
+        if key is None:
+            return None
+        return self.get_many([key])[key]
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, str]:
+        """
+        Return the descriptions of several ids, reading the unknown ones in
+        a single query.
+
+        Raises:
+            KeyError: If an id is not in the store
+        """
+        keys = set(keys)
+        texts = self._texts
+        missing = [key for key in keys if key not in texts]
+        if missing:
+            found = {}
+            with closing(self.__connect__()) as connection:
+                for start in range(0, len(missing), 500):
+                    chunk = missing[start : start + 500]
+                    found.update(
+                        connection.execute(
+                            "SELECT id, text FROM descriptions WHERE id IN "
+                            f"({', '.join('?' * len(chunk))})",
+                            chunk,
+                        )
+                    )
+            with self._lock:
+                texts.update(found)
+            unknown = [key for key in missing if key not in found]
+            if unknown:
+                raise KeyError(unknown[0])
+        return {key: texts[key] for key in keys}
+
+    def count(self) -> int:
+        """Return the number of stored descriptions."""
+        with closing(self.__connect__()) as connection:
+            return connection.execute(
+                "SELECT COUNT(*) FROM descriptions"
+            ).fetchone()[0]
+
+    def __connect__(self) -> sqlite3.Connection:
+        return sqlite3.connect(
+            self.path, timeout=self.timeout, isolation_level=None
+        )
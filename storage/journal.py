@@ -0,0 +1,113 @@
+"""Append-only journal used to resume interrupted runs."""
+
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from logging import getLogger
+from typing import Any, Dict, List, Tuple
+
+logger = getLogger("tjpa_scraper")
+
+PAGE = "page"
+PAGE_SIZE = "page_size"
+PROCESS = "process"
+QUERY = "query"
+
+
+@dataclass
+class Journal:
+    """
+    Durable, append-only record of completed work, keyed by query.
+
+    Each entry is a JSON line with the query, the kind of work (``page``,
+    ``process`` or ``query``, plus the ``page_size`` of each search), a key
+    identifying it inside the query and optional data. Entries are buffered
+    and appended in batches, either every ``flush_every`` records or after
+    ``flush_interval`` seconds, so a crash loses at most the last unflushed
+    batch, which is simply redone.
+    """
+
+    path: str
+    flush_every: int = 50
+    flush_interval: float = 5.0
+    _done: Dict[Tuple[str, str, str], Any] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _buffer: List[str] = field(default_factory=list, init=False, repr=False)
+    _last_flush: float = field(default=0.0, init=False, repr=False)
+    _truncated: bool = field(default=False, init=False, repr=False)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+
+    def __post_init__(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._last_flush = time.monotonic()
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                self._truncated = not line.endswith("\n")
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash can leave a truncated last line behind
+                    continue
+                key = (entry["query"], entry["kind"], entry["key"])
+                self._done[key] = entry.get("data")
+        logger.info(
+            "Loaded %d journal entries from %s", len(self._done), self.path
+        )
+
+    def is_done(self, query: str, kind: str, key: str = "") -> bool:
+        """Check whether a unit of work was already completed."""
+        return (query, kind, key) in self._done
+
+    def get(self, query: str, kind: str, key: str = "", default=None) -> Any:
+        """Return the data recorded for a completed unit of work."""
+        return self._done.get((query, kind, key), default)
+
+    def record(self, query: str, kind: str, key: str = "", data=None) -> None:
+        """Mark a unit of work as completed."""
+        line = json.dumps(
+            {"query": query, "kind": kind, "key": key, "data": data},
+            ensure_ascii=False,
+        )
+        with self._lock:
+            self._done[(query, kind, key)] = data
+            self._buffer.append(line)
+            if (
+                len(self._buffer) >= self.flush_every
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            ):
+                self.__flush__()
+
+    def flush(self) -> None:
+        """Append every buffered entry to disk."""
+        with self._lock:
+            self.__flush__()
+
+    def close(self) -> None:
+        """Flush pending entries."""
+        self.flush()
+
+    def __flush__(self) -> None:
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+        with open(self.path, "a", encoding="utf-8") as f:
+            if self._truncated:
+                f.write("\n")
+                self._truncated = False
+            f.write("\n".join(self._buffer) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self._buffer.clear()
+
+    def __enter__(self) -> "Journal":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,102 @@
+"""Persistent cache for party-name presearch results."""
+
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from utils.file_utils import load_json, write_json_atomic
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalize a party name for cache lookups.
+
+    Accents are removed, the text is case-folded, surrounding quotes are
+    dropped and inner whitespace is collapsed, so "José  Antônio" and
+    "jose antonio" share the same key.
+    """
+    decomposed = unicodedata.normalize("NFKD", name.strip().strip('"'))
+    without_accents = "".join(
+        char for char in decomposed if not unicodedata.combining(char)
+    )
+    return re.sub(r"\s+", " ", without_accents.casefold()).strip()
+
+
+@dataclass
+class PresearchCache:
+    """
+    Cache of presearch responses (the list of ``nome``/``sistema`` entries)
+    keyed by request type and normalized party name.
+
+    Entries expire after ``ttl`` seconds and the least recently used ones
+    are evicted once ``max_entries`` is exceeded. The cache is persisted
+    as a JSON file so repeated runs can reuse it. New entries are written
+    every ``save_every`` puts and on ``save()``.
+    """
+
+    path: str
+    ttl: float = 86400.0
+    max_entries: int = 5000
+    save_every: int = 50
+    _entries: "OrderedDict[str, Dict[str, Any]]" = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+    _pending: int = field(default=0, init=False, repr=False)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+
+    def __post_init__(self):
+        stored = load_json(self.path, default={})
+        if isinstance(stored, dict):
+            now = time.time()
+            for key, entry in stored.items():
+                if now - entry.get("stored_at", 0) < self.ttl:
+                    self._entries[key] = entry
+
+    @staticmethod
+    def make_key(request_type: str, name: str) -> str:
+        """Build the cache key for a request type name and party name."""
+        return f"{request_type}:{normalize_name(name)}"
+
+    def get(self, request_type: str, name: str) -> Optional[List[Any]]:
+        """Return the cached presearch result, or None if absent/expired."""
+        key = self.make_key(request_type, name)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.time() - entry["stored_at"] >= self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry["value"]
+
+    def put(self, request_type: str, name: str, value: List[Any]) -> None:
+        """Store a presearch result."""
+        key = self.make_key(request_type, name)
+        with self._lock:
+            self._entries[key] = {"stored_at": time.time(), "value": value}
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._pending += 1
+            if self._pending >= self.save_every:
+                self.__save__()
+
+    def save(self) -> None:
+        """Persist every pending entry."""
+        with self._lock:
+            if self._pending:
+                self.__save__()
+
+    def __save__(self) -> None:
+        write_json_atomic(self.path, dict(self._entries))
+        self._pending = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
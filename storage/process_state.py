@@ -0,0 +1,84 @@
+"""Persistent per-process movement state used by refresh runs."""
+
+import hashlib
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+from utils.file_utils import load_json, write_json_atomic
+
+
+def movement_fingerprint(movement: Dict[str, Any]) -> str:
+    """Return a short fingerprint of a raw movement from the API."""
+    content = f"{movement.get('dataFormatada')}|{movement.get('descricao')}"
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class ProcessState:
+    """Last known movement state of a process."""
+
+    total: int
+    fingerprint: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {"total": self.total, "fingerprint": self.fingerprint}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ProcessState":
+        """Create a ProcessState from its stored dictionary."""
+        return cls(total=data["total"], fingerprint=data["fingerprint"])
+
+
+@dataclass
+class ProcessStateStore:
+    """
+    Store of the last known ``qtdRegistrosTotal`` and last movement
+    fingerprint of each process, keyed by process identity and persisted
+    as a JSON file. Changes are written every ``save_every`` updates and
+    on ``save()``.
+    """
+
+    path: str
+    save_every: int = 100
+    _states: Dict[str, ProcessState] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _pending: int = field(default=0, init=False, repr=False)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+
+    def __post_init__(self):
+        stored = load_json(self.path, default={})
+        for identity, data in stored.items():
+            self._states[identity] = ProcessState.from_dict(data)
+
+    def get(self, identity: str) -> Optional[ProcessState]:
+        """Return the last known state of a process."""
+        return self._states.get(identity)
+
+    def put(self, identity: str, state: ProcessState) -> None:
+        """Update the state of a process."""
+        with self._lock:
+            self._states[identity] = state
+            self._pending += 1
+            if self._pending >= self.save_every:
+                self.__save__()
+
+    def save(self) -> None:
+        """Persist every pending change."""
+        with self._lock:
+            if self._pending:
+                self.__save__()
+
+    def __save__(self) -> None:
+        write_json_atomic(
+            self.path,
+            {identity: s.to_dict() for identity, s in self._states.items()},
+        )
+        self._pending = 0
+
+    def __len__(self) -> int:
+        return len(self._states)
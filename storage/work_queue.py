@@ -0,0 +1,250 @@
+"""SQLite-backed work queue shared by several worker processes."""
+
+import json
+import sqlite3
+import time
+from contextlib import closing
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional
+
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    task_key TEXT NOT NULL UNIQUE,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    lease_owner TEXT,
+    lease_expires REAL NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    updated_at REAL NOT NULL,
+    priority INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status, priority, id);
+"""
+
+
+@dataclass
+class Task:
+    """A unit of work leased from the queue."""
+
+    id: int
+    kind: str
+    payload: Dict[str, Any]
+    attempts: int
+    priority: int = 0
+
+
+@dataclass
+class WorkQueue:
+    """
+    Durable work queue stored in a SQLite file.
+
+    Tasks are leased for ``lease_seconds``: a worker that crashes or stops
+    renewing its lease loses it, and the task becomes available again.
+    Completing or renewing a task only succeeds while the caller still
+    owns the lease, so a worker whose lease expired cannot finish a task
+    that another worker took over. Tasks are deduplicated by key and leased
+    by priority (lowest first), then in the order they were added.
+
+    A new connection is opened per operation, so one instance can be used
+    from several threads and the file can be shared between processes.
+    """
+
+    path: str
+    lease_seconds: float = 300.0
+    max_attempts: int = 5
+    timeout: float = 30.0
+
+    def __post_init__(self):
+        with closing(self.__connect__()) as connection:
+            connection.executescript(_SCHEMA)
+
+    def put(
+        self,
+        kind: str,
+        payload: Dict[str, Any],
+        key: str = None,
+        priority: int = 0,
+    ) -> bool:
+        """
+        Add a task unless a task with the same key already exists.
+
+        Returns:
+            True if the task was added
+        """
+        return self.put_many(kind, [(payload, key)], priority) == 1
+
+    def put_many(
+        self, kind: str, items: Iterable[tuple], priority: int = 0
+    ) -> int:
+        """
+        Add ``(payload, key)`` tasks in a single transaction.
+
+        Pending tasks that already exist are only raised to ``priority`` if
+        it is higher (lower value) than their own.
+
+        Args:
+            kind: Kind of the tasks
+            items: ``(payload, key)`` of each task; tasks without a key are
+                deduplicated by payload
+            priority: Priority of the tasks, lower ones are leased first
+
+        Returns:
+            The number of tasks added
+        """
+        now = time.time()
+        rows = []
+        for payload, key in items:
+            encoded = json.dumps(payload, ensure_ascii=False, sort_keys=True)
+            rows.append(
+                (kind, f"{kind}:{key or encoded}", encoded, priority, now)
+            )
+        with closing(self.__connect__()) as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            before = connection.total_changes
+            connection.executemany(
+                "INSERT OR IGNORE INTO tasks "
+                "(kind, task_key, payload, priority, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            added = connection.total_changes - before
+            if added < len(rows):
+                # A task queued again with a higher priority (a process of
+                # a CNJ lookup already found by a crawl) moves up
+                connection.executemany(
+                    "UPDATE tasks SET priority = ? WHERE task_key = ? "
+                    "AND priority > ? AND status = ?",
+                    [(priority, row[1], priority, PENDING) for row in rows],
+                )
+            connection.execute("COMMIT")
+        return added
+
+    def lease(self, worker_id: str) -> Optional[Task]:
+        """
+        Lease the available task with the lowest priority, oldest first.
+
+        Pending tasks and tasks whose lease expired are available. Expired
+        tasks that already used every attempt are marked as failed.
+
+        Returns:
+            The leased task, or None if no task is available
+        """
+        now = time.time()
+        with closing(self.__connect__()) as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute(
+                "UPDATE tasks SET status = ?, error = ?, updated_at = ? "
+                "WHERE status = ? AND lease_expires < ? AND attempts >= ?",
+                (FAILED, "lease expired", now, LEASED, now, self.max_attempts),
+            )
+            row = connection.execute(
+                "SELECT id, kind, payload, attempts, priority FROM tasks "
+                "WHERE (status = ? OR (status = ? AND lease_expires < ?)) "
+                "AND attempts < ? ORDER BY priority, id LIMIT 1",
+                (PENDING, LEASED, now, self.max_attempts),
+            ).fetchone()
+            if row is None:
+                connection.execute("COMMIT")
+                return None
+            connection.execute(
+                "UPDATE tasks SET status = ?, lease_owner = ?, "
+                "lease_expires = ?, attempts = attempts + 1, updated_at = ? "
+                "WHERE id = ?",
+                (LEASED, worker_id, now + self.lease_seconds, now, row[0]),
+            )
+            connection.execute("COMMIT")
+        return Task(
+            id=row[0],
+            kind=row[1],
+            payload=json.loads(row[2]),
+            attempts=row[3] + 1,
+            priority=row[4],
+        )
+
+    def renew(self, task: Task, worker_id: str) -> bool:
+        """
+        Extend the lease of a task.
+
+        Returns:
+            False if the worker no longer owns the lease
+        """
+        now = time.time()
+        return self.__update_leased__(
+            task,
+            worker_id,
+            "lease_expires = ?, updated_at = ?",
+            (now + self.lease_seconds, now),
+            now,
+        )
+
+    def complete(self, task: Task, worker_id: str) -> bool:
+        """
+        Mark a leased task as done.
+
+        Returns:
+            False if the worker no longer owns the lease
+        """
+        now = time.time()
+        return self.__update_leased__(
+            task, worker_id, "status = ?, updated_at = ?", (DONE, now), now
+        )
+
+    def fail(self, task: Task, worker_id: str, error: str) -> bool:
+        """
+        Release a leased task after an error.
+
+        The task is retried later, until ``max_attempts`` is reached.
+
+        Returns:
+            False if the worker no longer owns the lease
+        """
+        status = FAILED if task.attempts >= self.max_attempts else PENDING
+        now = time.time()
+        return self.__update_leased__(
+            task,
+            worker_id,
+            "status = ?, error = ?, lease_owner = NULL, updated_at = ?",
+            (status, error, now),
+            now,
+        )
+
+    def counts(self) -> Dict[str, int]:
+        """Return the number of tasks per status."""
+        with closing(self.__connect__()) as connection:
+            rows = connection.execute(
+                "SELECT status, COUNT(*) FROM tasks GROUP BY status"
+            ).fetchall()
+        counts = {PENDING: 0, LEASED: 0, DONE: 0, FAILED: 0}
+        counts.update(dict(rows))
+        return counts
+
+    def __update_leased__(
+        self,
+        task: Task,
+        worker_id: str,
+        assignments: str,
+        values: tuple,
+        now: float,
+    ) -> bool:
+        with closing(self.__connect__()) as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            cursor = connection.execute(
+                f"UPDATE tasks SET {assignments} WHERE id = ? AND status = ? "
+                "AND lease_owner = ? AND lease_expires >= ?",
+                (*values, task.id, LEASED, worker_id, now),
+            )
+            connection.execute("COMMIT")
+        return cursor.rowcount == 1
+
+    def __connect__(self) -> sqlite3.Connection:
+        return sqlite3.connect(
+            self.path, timeout=self.timeout, isolation_level=None
+        )
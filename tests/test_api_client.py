@@ -6,6 +6,7 @@ from urllib.error import HTTPError, URLError
 import pytest
 
 from client.api_client import ApiClient
+from utils.rate_limiter import TokenBucket
 
 
 class TestApiClient:
@@ -168,3 +169,36 @@ class TestApiClient:
             request_obj.get_header("User-agent")
             == api_client.config.user_agent
         )
+
+    @patch("client.api_client.urlopen")
+    @patch("client.api_client.time.sleep")
+    def test_budget_is_consumed_per_request(
+        self, mock_sleep, mock_urlopen, api_client
+    ):
+        """Test that each request takes a token from the budget."""
+        mock_response = MagicMock()
+        mock_response.getcode.return_value = 200
+        mock_response.read.return_value = b"{}"
+        mock_response.__enter__ = MagicMock(return_value=mock_response)
+        mock_response.__exit__ = MagicMock(return_value=False)
+        mock_urlopen.return_value = mock_response
+        api_client.budget = MagicMock(spec=TokenBucket)
+
+        api_client.get("/test/endpoint")
+        api_client.get("/test/endpoint")
+
+        assert api_client.budget.acquire.call_count == 2
+
+    @patch("client.api_client.urlopen")
+    @patch("client.api_client.time.sleep")
+    def test_request_info_counts_timeouts(
+        self, mock_sleep, mock_urlopen, api_client
+    ):
+        """Test that the thread's request info reports every timeout."""
+        mock_urlopen.side_effect = TimeoutError()
+
+        api_client.get("/test/endpoint")
+        info = api_client.take_request_info()
+
+        assert info.timeouts == 3
+        assert api_client.take_request_info().timeouts == 0
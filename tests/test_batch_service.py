@@ -0,0 +1,139 @@
+"""Tests for the batch query service."""
+
+import csv
+import io
+import os
+import tempfile
+from unittest.mock import MagicMock
+
+import pytest
+
+from exceptions import ProcessNotFoundError
+from services.batch_service import BatchService, read_queries
+from services.process_service import ProcessService
+
+
+class TestReadQueries:
+    """Tests for read_queries."""
+
+    def test_plain_text_skips_blank_and_comment_lines(self):
+        """Test one query per line input."""
+        stream = io.StringIO("Jose Antonio\n\n# comment\n  OAB:123PA  \n")
+
+        assert read_queries(stream) == ["Jose Antonio", "OAB:123PA"]
+
+    def test_csv_with_query_column(self):
+        """Test CSV input with a named query column."""
+        stream = io.StringIO("id,query\n1,Jose Antonio\n2,OAB:123PA\n")
+
+        assert read_queries(stream, csv_format=True) == [
+            "Jose Antonio",
+            "OAB:123PA",
+        ]
+
+    def test_csv_without_header_uses_first_column(self):
+        """Test CSV input without a query header."""
+        stream = io.StringIO("08012345620268140301,x\nOAB:123PA,y\n")
+
+        assert read_queries(stream, csv_format=True) == [
+            "08012345620268140301",
+            "OAB:123PA",
+        ]
+
+
+class TestBatchService:
+    """Tests for BatchService."""
+
+    @pytest.fixture
+    def process_service(self):
+        """Return a mocked ProcessService."""
+        return MagicMock(spec=ProcessService)
+
+    @pytest.fixture
+    def batch_service(self, process_service):
+        """Return a BatchService instance."""
+        return BatchService(process_service=process_service, max_concurrency=2)
+
+    def test_run_reports_each_query_in_order(
+        self, batch_service, process_service
+    ):
+        """Test statuses and counts of a mixed batch."""
+
+        def get_processes(query):
+            if query == "Maria Silva":
+                raise ProcessNotFoundError("No processes found")
+            return 3
+
+        process_service.get_processes.side_effect = get_processes
+
+        results = batch_service.run(
+            ["08012347920268140301", "Maria Silva", "???"]
+        )
+
+        assert [r.status for r in results] == ["ok", "not_found", "invalid"]
+        assert results[0].request_type == "CNJ"
+        assert results[0].processes == 3
+        assert results[2].request_type == ""
+
+    def test_invalid_queries_are_not_fetched(
+        self, batch_service, process_service
+    ):
+        """Test that unclassifiable queries never reach the service."""
+        batch_service.run(["Maria", ""])
+
+        process_service.get_processes.assert_not_called()
+
+    def test_write_summary(self, batch_service, process_service):
+        """Test that the summary has one row per query."""
+        process_service.get_processes.return_value = 1
+        batch_service.run(["08012347920268140301", "OAB:123PA"])
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "summary", "batch.csv")
+            batch_service.write_summary(path)
+            with open(path, "r", encoding="utf-8-sig") as f:
+                rows = list(csv.DictReader(f))
+
+        assert [row["query"] for row in rows] == [
+            "08012347920268140301",
+            "OAB:123PA",
+        ]
+        assert rows[1]["request_type"] == "OAB"
+        assert rows[1]["status"] == "ok"
+
+    def test_check_digits_are_validated_before_fetching(
+        self, batch_service, process_service
+    ):
+        """Test that typos are rejected per reason and valid queries are
+        run in canonical form."""
+        process_service.get_processes.return_value = 1
+
+        results = batch_service.run(
+            [
+                "08012345620268140301",
+                "529.982.247-26",
+                "11.222.333/0001-81",
+                "08012347920268140301",
+                "???",
+            ]
+        )
+
+        assert [r.status for r in results] == [
+            "invalid",
+            "invalid",
+            "ok",
+            "ok",
+            "invalid",
+        ]
+        assert batch_service.rejections == {
+            "cnj_check_digits": 1,
+            "cpf_check_digits": 1,
+            "unrecognized": 1,
+        }
+        queries = [
+            c[0][0] for c in process_service.get_processes.call_args_list
+        ]
+        assert sorted(queries) == [
+            "0801234-79.2026.8.14.0301",
+            "11222333000181",
+        ]
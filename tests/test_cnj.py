@@ -0,0 +1,75 @@
+"""Tests for the CNJ value type."""
+
+import pytest
+
+from entities.cnj import CNJ
+
+
+class TestCNJ:
+    """Tests for CNJ."""
+
+    def test_parse_segments(self):
+        """Test that every segment is parsed once into integers."""
+        cnj = CNJ.parse("0801234-79.2026.8.14.0301")
+
+        assert cnj.sequence == 801234
+        assert cnj.check_digits == 79
+        assert cnj.year == 2026
+        assert cnj.segment == 8
+        assert cnj.tribunal == 14
+        assert cnj.origin == 301
+        assert cnj.is_valid
+
+    def test_formatting_round_trip(self):
+        """Test the digit and masked forms."""
+        cnj = CNJ.parse("08012345620268140301")
+
+        assert cnj.digits == "08012345620268140301"
+        assert str(cnj) == "0801234-56.2026.8.14.0301"
+        assert not cnj.is_valid
+
+    def test_hashing_and_equality(self):
+        """Test that masked and unmasked numbers are the same value."""
+        assert CNJ.parse("0801234-79.2026.8.14.0301") == CNJ.parse(
+            "08012347920268140301"
+        )
+        assert (
+            len(
+                {CNJ.parse("08012347920268140301")}
+                | {CNJ.parse("0801234-79.2026.8.14.0301")}
+            )
+            == 1
+        )
+
+    def test_sorts_by_year_origin_sequence(self):
+        """Test the ordering of CNJ numbers."""
+        numbers = [
+            "0000002-00.2025.8.14.0001",
+            "0000001-00.2026.8.14.0001",
+            "0000003-00.2025.8.14.0002",
+            "0000001-00.2025.8.14.0001",
+        ]
+
+        ordered = sorted(CNJ.parse(n) for n in numbers)
+
+        assert [str(c) for c in ordered] == [
+            "0000001-00.2025.8.14.0001",
+            "0000002-00.2025.8.14.0001",
+            "0000003-00.2025.8.14.0002",
+            "0000001-00.2026.8.14.0001",
+        ]
+
+    def test_malformed_numbers(self):
+        """Test that malformed numbers are rejected."""
+        with pytest.raises(ValueError):
+            CNJ.parse("123")
+        assert CNJ.try_parse(None) is None
+
+    def test_process_cnj_follows_number(self, sample_process):
+        """Test that Process.cnj is cached until the number changes."""
+        assert sample_process.cnj is sample_process.cnj
+        assert sample_process.cnj.origin == 301
+
+        sample_process.number = "08012347920268140302"
+
+        assert sample_process.cnj.origin == 302
@@ -0,0 +1,98 @@
+"""Tests for the content-addressed movement description store."""
+
+import json
+
+import pytest
+
+from config import ScraperConfig
+from models.movement import Movement
+from models.movement_batch import MovementBatch
+from services.export_service import ExportService
+from storage.description_store import DescriptionStore, description_id
+
+MOVEMENTS = [
+    Movement("01/02/2026", "Juntada de petição"),
+    Movement("02/02/2026", "Conclusos para despacho"),
+    Movement("03/02/2026", "Juntada de petição"),
+]
+
+
+class TestDescriptionStore:
+    """Tests for DescriptionStore."""
+
+    def test_ids_are_short_content_addresses(self):
+        """Test that the id depends only on the text."""
+        key = description_id("Juntada de petição")
+
+        assert len(key) == 16
+        assert key == description_id("Juntada de petição")
+        assert key != description_id("Conclusos para despacho")
+
+    def test_put_flush_and_get(self, tmp_path):
+        """Test that descriptions are written once and read back."""
+        path = str(tmp_path / "descriptions.sqlite3")
+        store = DescriptionStore(path=path)
+        keys = [store.put(m.description) for m in MOVEMENTS]
+
+        assert store.flush() == 2
+        assert store.flush() == 0
+        assert keys[0] == keys[2]
+        other = DescriptionStore(path=path)
+        assert other.count() == 2
+        assert other.get(keys[1]) == "Conclusos para despacho"
+        assert other.get(None) is None
+        assert store.put(None) is None
+
+    def test_unknown_id_raises(self, tmp_path):
+        """Test that an id missing from the store raises KeyError."""
+        store = DescriptionStore(path=str(tmp_path / "descriptions.sqlite3"))
+
+        with pytest.raises(KeyError):
+            store.get("0123456789abcdef")
+
+
+class TestExportWithDescriptionStore:
+    """Tests for the JSON exports referencing stored descriptions."""
+
+    @pytest.fixture
+    def export_service(self, tmp_path):
+        """Return an ExportService with the description store enabled."""
+        return ExportService(
+            config=ScraperConfig(store_descriptions=True),
+            base_dir=str(tmp_path),
+        )
+
+    @pytest.mark.parametrize("batch", [False, True])
+    def test_export_references_descriptions(
+        self, export_service, sample_process, batch
+    ):
+        """Test that exports hold ids and load back the full text."""
+        sample_process.movements = (
+            MovementBatch.from_movements(MOVEMENTS) if batch else MOVEMENTS
+        )
+
+        file_name = export_service.export(sample_process)
+
+        path = f"{export_service.json_export_dir}/{file_name}.json"
+        with open(path, encoding="utf-8") as f:
+            exported = json.load(f)["movements"]
+        assert exported[0] == {
+            "date": "01/02/2026",
+            "description_id": description_id("Juntada de petição"),
+        }
+        assert export_service.description_store.count() == 2
+        reloaded = ExportService(
+            config=export_service.config, base_dir=export_service.base_dir
+        )
+        assert reloaded.load_movements(sample_process) == MOVEMENTS
+
+    def test_export_without_store_cannot_resolve_ids(
+        self, export_service, sample_process, scraper_config
+    ):
+        """Test that exports with ids need the store to be loaded."""
+        export_service.export(sample_process)
+        plain = ExportService(
+            config=scraper_config, base_dir=export_service.base_dir
+        )
+
+        assert plain.load_movements(sample_process) is None
@@ -0,0 +1,116 @@
+"""Tests for the query cost estimator."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from client.api_client import ApiClient, RequestStats
+from services.estimate_service import EstimateService
+from services.export_service import ExportService
+from services.movement_service import MovementService
+from services.process_service import ProcessService
+
+
+def make_page(processes: int, total: int) -> dict:
+    """Return a paginated search response."""
+    return {
+        "qtdRegistrosTotal": total,
+        "listaResultado": [
+            {
+                "listaProcessos": [
+                    {
+                        "numero": f"{i:020d}",
+                        "cdDocProcesso": str(i),
+                        "cdInstancia": "1",
+                    }
+                    for i in range(processes)
+                ]
+            }
+        ],
+    }
+
+
+class TestEstimateService:
+    """Tests for EstimateService."""
+
+    @pytest.fixture
+    def responses(self):
+        """Return the mocked API responses, keyed by URL."""
+        return {}
+
+    @pytest.fixture
+    def estimate_service(self, scraper_config, responses):
+        """Return an EstimateService with mocked API responses."""
+        scraper_config.min_wait_time = 1.0
+        scraper_config.max_wait_time = 3.0
+        client = MagicMock(spec=ApiClient)
+        client.config = scraper_config
+        client.stats = RequestStats()
+
+        def get(url):
+            client.stats.record(100, 0.5)
+            return responses[url]
+
+        client.get.side_effect = get
+        movement_service = MagicMock(spec=MovementService)
+        movement_service.count_movements.side_effect = [10, 1500, 0]
+        movement_service.get_page_size.return_value = 1000
+        process_service = ProcessService(
+            api_client=client,
+            export_service=MagicMock(spec=ExportService),
+            movement_service=movement_service,
+        )
+        return EstimateService(
+            process_service=process_service, config=scraper_config
+        )
+
+    def test_estimate_paginated_search(self, estimate_service, responses):
+        """Test the estimate of a paginated search from its first page."""
+        responses["/processobyoab/12345/OAB-PA/1/1000"] = make_page(10, 25)
+
+        estimate = estimate_service.estimate("OAB12345PA")
+
+        assert estimate.processes == 25
+        assert estimate.search_requests == 3
+        assert estimate.sampled_processes == 3
+        assert estimate.avg_movements == pytest.approx(1510 / 3)
+        # Sampled processes need 1, 2 and 1 movement pages
+        assert estimate.movement_requests == 34
+        assert estimate.probe_requests == 1
+        assert estimate.expected_bytes == 37 * 100
+        assert estimate.expected_seconds == pytest.approx(37 * 2.5)
+
+    def test_estimate_presearch_extrapolates_entries(
+        self, estimate_service, responses, scraper_config
+    ):
+        """Test that presearch entries beyond the probe limit are scaled."""
+        scraper_config.estimate_max_presearch_probes = 2
+        route = "/processobynomeparte/"
+        responses[f"{route}Joao%20Silva"] = [
+            {"nome": f"JOAO SILVA {i}", "sistema": "PJE"} for i in range(3)
+        ]
+        responses[f"{route}JOAO%20SILVA%200/PJE/1/1000"] = make_page(2, 4)
+        responses[f"{route}JOAO%20SILVA%201/PJE/1/1000"] = make_page(2, 2)
+
+        estimate = estimate_service.estimate("Joao Silva")
+
+        assert estimate.processes == 9
+        assert estimate.search_requests == 1 + 5
+        assert estimate.sampled_processes == 3
+        assert estimate.probe_requests == 3
+
+
+class TestRequestStats:
+    """Tests for RequestStats."""
+
+    def test_snapshot_is_a_copy(self):
+        """Test that a snapshot does not follow later requests."""
+        stats = RequestStats()
+        stats.record(10, 0.1)
+        snapshot = stats.snapshot()
+        stats.record(20, 0.2)
+
+        assert snapshot.requests == 1
+        assert snapshot.bytes_received == 10
+        assert stats.requests == 2
+        assert stats.bytes_received == 30
@@ -1,5 +1,6 @@
 """Tests for exporter classes."""
 
+import csv
 import json
 import os
 import tempfile
@@ -9,7 +10,12 @@ import pytest
 from models.movement import Movement
 from models.party import Party
 from models.process import Process
-from services.exporters.csv_exporter import CSVExporter
+from services.export_service import ExportService
+from services.exporters.csv_exporter import (
+    CSV_FIELDS,
+    CSVExporter,
+    ConsolidatedCSVExporter,
+)
 from services.exporters.json_exporter import JSONExporter
 
 
@@ -72,6 +78,75 @@ class TestCSVExporter:
 
         assert "Nova Classe" in content
 
+    def test_output_matches_pandas(
+        self, csv_exporter, sample_process, temp_dir
+    ):
+        """Test that the file is byte for byte what pandas wrote."""
+        pd = pytest.importorskip("pandas")
+        csv_exporter.export(sample_process, "test_process")
+        expected = os.path.join(temp_dir, "expected.csv")
+        pd.DataFrame([sample_process.to_csv_export()]).to_csv(
+            expected, index=False, encoding="utf-8-sig"
+        )
+
+        with open(os.path.join(temp_dir, "test_process.csv"), "rb") as f:
+            content = f.read()
+        with open(expected, "rb") as f:
+            assert content == f.read()
+
+
+class TestConsolidatedCSVExporter:
+    """Tests for ConsolidatedCSVExporter."""
+
+    def read_rows(self, path):
+        """Return the rows of a consolidated file."""
+        with open(path, "r", newline="", encoding="utf-8-sig") as f:
+            return list(csv.reader(f))
+
+    def test_one_header_and_buffered_rows(self, sample_process, tmp_path):
+        """Test that rows are buffered and written under one header."""
+        path = str(tmp_path / "out" / "processes.csv")
+        exporter = ConsolidatedCSVExporter(path=path, buffer_rows=2)
+
+        exporter.export(sample_process)
+        assert not os.path.exists(path)
+        exporter.export(sample_process)
+        exporter.export(sample_process)
+        assert len(self.read_rows(path)) == 3
+        exporter.close()
+
+        rows = self.read_rows(path)
+        assert rows[0] == CSV_FIELDS
+        assert len(rows) == 4
+        assert exporter.rows == 3
+
+    def test_exports_after_close_are_appended(self, sample_process, tmp_path):
+        """Test that closing twice keeps a single header."""
+        path = str(tmp_path / "processes.csv")
+        with ConsolidatedCSVExporter(path=path) as exporter:
+            exporter.export(sample_process)
+        exporter.export(sample_process)
+        exporter.close()
+
+        rows = self.read_rows(path)
+        assert [row[0] for row in rows].count(CSV_FIELDS[0]) == 1
+        assert len(rows) == 3
+
+    def test_export_service_consolidated(
+        self, scraper_config, sample_process, tmp_path
+    ):
+        """Test that ExportService writes the consolidated file on close."""
+        service = ExportService(
+            config=scraper_config, base_dir=str(tmp_path), consolidated=True
+        )
+
+        service.export(sample_process)
+        path = service.close()
+
+        assert path.startswith(str(tmp_path / "data" / "consolidated_exports"))
+        assert len(self.read_rows(path)) == 2
+        assert ExportService(scraper_config, str(tmp_path)).close() is None
+
 
 class TestJSONExporter:
     """Tests for JSONExporter."""
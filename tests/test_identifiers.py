@@ -0,0 +1,76 @@
+"""Tests for the CNJ, CPF and CNPJ validation helpers."""
+
+import pytest
+
+from entities.request_type import RequestType
+from exceptions import InvalidIdentifierError
+from utils.identifiers import (
+    cnj_check_digits,
+    format_cnj,
+    is_valid_cnj,
+    is_valid_cnpj,
+    is_valid_cpf,
+)
+
+
+class TestIdentifiers:
+    """Tests for the check-digit functions."""
+
+    def test_cnj_check_digits(self):
+        """Test the mod 97 check digits of a CNJ number."""
+        assert cnj_check_digits("08012340020268140301") == "79"
+        assert is_valid_cnj("0801234-79.2026.8.14.0301")
+        assert not is_valid_cnj("0801234-56.2026.8.14.0301")
+        assert not is_valid_cnj("0801234792026814030")
+
+    def test_format_cnj(self):
+        """Test the canonical CNJ mask."""
+        assert format_cnj("08012347920268140301") == (
+            "0801234-79.2026.8.14.0301"
+        )
+
+    @pytest.mark.parametrize(
+        "value, valid",
+        [
+            ("529.982.247-25", True),
+            ("52998224725", True),
+            ("52998224726", False),
+            ("111.111.111-11", False),
+            ("5299822472", False),
+        ],
+    )
+    def test_cpf(self, value, valid):
+        """Test the CPF verifier digits."""
+        assert is_valid_cpf(value) is valid
+
+    @pytest.mark.parametrize(
+        "value, valid",
+        [
+            ("11.222.333/0001-81", True),
+            ("11222333000181", True),
+            ("11222333000182", False),
+            ("00000000000000", False),
+        ],
+    )
+    def test_cnpj(self, value, valid):
+        """Test the CNPJ verifier digits."""
+        assert is_valid_cnpj(value) is valid
+
+
+class TestRequestTypeNormalize:
+    """Tests for RequestType.normalize."""
+
+    def test_normalizes_to_canonical_form(self):
+        """Test the canonical form of each identifier type."""
+        assert RequestType.CNJ.normalize("08012347920268140301") == (
+            "0801234-79.2026.8.14.0301"
+        )
+        assert RequestType.CPF.normalize(" 529.982.247-25 ") == "52998224725"
+        assert RequestType.OAB.normalize(" OAB:1PA ") == "OAB:1PA"
+
+    def test_invalid_check_digits_raise_with_reason(self):
+        """Test that the rejection reason is reported."""
+        with pytest.raises(InvalidIdentifierError) as exc_info:
+            RequestType.CNPJ.normalize("11222333000182")
+
+        assert exc_info.value.reason == "cnpj_check_digits"
@@ -0,0 +1,99 @@
+"""Tests for the string dictionary."""
+
+import pytest
+
+from models.movement import Movement
+from models.process import Process
+from utils.interning import StringDictionary
+
+
+class TestStringDictionary:
+    """Tests for StringDictionary."""
+
+    def test_intern_shares_one_object_per_value(self):
+        """Test that equal values become the same object."""
+        strings = StringDictionary()
+        first = "".join(["Cível"])
+        second = "".join(["Cív", "el"])
+
+        assert strings.intern(first) is first
+        assert strings.intern(second) is first
+        assert strings.intern(None) is None
+        assert strings.stats() == {
+            "entries": 1,
+            "hits": 1,
+            "misses": 1,
+            "hit_rate": 0.5,
+        }
+
+    def test_encode_and_decode(self):
+        """Test that codes are dense and reversible."""
+        strings = StringDictionary()
+
+        assert [strings.encode(v) for v in ["a", "b", "a"]] == [0, 1, 0]
+        assert strings.decode(1) == "b"
+        assert len(strings) == 2
+
+    def test_full_dictionary_stops_growing(self):
+        """Test that new values are not stored past max_entries."""
+        strings = StringDictionary(max_entries=1)
+        strings.intern("a")
+
+        assert strings.intern("b") == "b"
+        assert len(strings) == 1
+        with pytest.raises(OverflowError):
+            strings.encode("c")
+
+
+class TestModelInterning:
+    """Tests for interning in the models' from_dict."""
+
+    def test_from_dict_interns_repetitive_values(
+        self, sample_api_process_response
+    ):
+        """Test that processes and movements share repeated values."""
+        strings = StringDictionary()
+        copy = {
+            key: "".join(value) if isinstance(value, str) else value
+            for key, value in sample_api_process_response.items()
+        }
+
+        first = Process.from_dict(sample_api_process_response, strings)
+        second = Process.from_dict(copy, strings)
+        movements = [
+            Movement.from_dict(
+                {"dataFormatada": "01/02/2026", "descricao": "".join(d)},
+                strings,
+            )
+            for d in (["Despacho"], ["Desp", "acho"])
+        ]
+
+        assert second.class_ is first.class_
+        assert second.court is first.court
+        assert second.parties[0].party_type is first.parties[0].party_type
+        assert movements[1].description is movements[0].description
+        assert strings.hits > 0
+
+    def test_high_cardinality_values_are_not_interned(
+        self, sample_api_process_response
+    ):
+        """Test that party names and dates stay out of the dictionary."""
+        strings = StringDictionary()
+
+        process = Process.from_dict(sample_api_process_response, strings)
+        Movement.from_dict(
+            {"dataFormatada": "01/02/2026", "descricao": "Despacho"}, strings
+        )
+
+        assert len(strings) == len(
+            {
+                process.class_,
+                process.topic,
+                process.jurisdiction,
+                process.competence,
+                process.situation,
+                process.court,
+                *(party.party_type for party in process.parties),
+                "Despacho",
+            }
+        )
@@ -0,0 +1,158 @@
+"""Tests for the resume journal."""
+
+import os
+import tempfile
+from unittest.mock import MagicMock
+
+import pytest
+
+from client.api_client import ApiClient
+from client.page_size_tuner import PageSizeTuner, RequestInfo
+from services.export_service import ExportService
+from services.movement_service import MovementService
+from services.process_service import ProcessService
+from storage.journal import PAGE, PAGE_SIZE, PROCESS, QUERY, Journal
+
+
+@pytest.fixture
+def journal_path():
+    """Return a journal path inside a temporary directory."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield os.path.join(tmpdir, "journal.jsonl")
+
+
+class TestJournal:
+    """Tests for Journal."""
+
+    def test_record_and_query(self, journal_path):
+        """Test that recorded work is reported as done."""
+        journal = Journal(path=journal_path)
+        journal.record("OAB:123PA", PROCESS, "1/2/3", {"file": "f"})
+
+        assert journal.is_done("OAB:123PA", PROCESS, "1/2/3")
+        assert journal.get("OAB:123PA", PROCESS, "1/2/3") == {"file": "f"}
+        assert not journal.is_done("OAB:999PA", PROCESS, "1/2/3")
+
+    def test_writes_are_batched(self, journal_path):
+        """Test that entries stay buffered until the batch is full."""
+        journal = Journal(path=journal_path, flush_every=3, flush_interval=60)
+        journal.record("q", PAGE, "a")
+        journal.record("q", PAGE, "b")
+
+        assert not os.path.exists(journal_path)
+
+        journal.record("q", PAGE, "c")
+
+        with open(journal_path, "r", encoding="utf-8") as f:
+            assert len(f.readlines()) == 3
+
+    def test_reload_after_close(self, journal_path):
+        """Test that a new instance sees the flushed entries."""
+        with Journal(path=journal_path, flush_interval=60) as journal:
+            journal.record("q", QUERY, data=2)
+
+        assert Journal(path=journal_path).get("q", QUERY) == 2
+
+    def test_truncated_line_is_ignored(self, journal_path):
+        """Test recovery from a partially written last line."""
+        with Journal(path=journal_path) as journal:
+            journal.record("q", PAGE, "a")
+        with open(journal_path, "a", encoding="utf-8") as f:
+            f.write('{"query": "q", "ki')
+
+        journal = Journal(path=journal_path)
+        journal.record("q", PAGE, "b")
+        journal.close()
+
+        reloaded = Journal(path=journal_path)
+        assert reloaded.is_done("q", PAGE, "a")
+        assert reloaded.is_done("q", PAGE, "b")
+
+
+class TestProcessServiceJournal:
+    """Tests for ProcessService resuming from a journal."""
+
+    def build_service(self, scraper_config, journal, page_size_tuner=None):
+        """Return a ProcessService with mocked dependencies."""
+        client = MagicMock(spec=ApiClient)
+        client.config = scraper_config
+        client.take_request_info.return_value = RequestInfo()
+        movement_service = MagicMock(spec=MovementService)
+        movement_service.get_movements.return_value = []
+        export_service = MagicMock(spec=ExportService)
+        export_service.export.return_value = "file"
+        return ProcessService(
+            api_client=client,
+            export_service=export_service,
+            movement_service=movement_service,
+            journal=journal,
+            page_size_tuner=page_size_tuner,
+        )
+
+    def test_resume_skips_completed_pages_and_processes(
+        self, scraper_config, journal_path, sample_api_process_response
+    ):
+        """Test that a restarted query does not refetch finished work."""
+        other = {
+            **sample_api_process_response,
+            "numero": "2",
+            "cdDocProcesso": "2",
+        }
+        response = {"listaProcessos": [sample_api_process_response, other]}
+        first = self.build_service(scraper_config, Journal(path=journal_path))
+        first.api_client.get.return_value = response
+        first.export_service.export.side_effect = ["file_1", KeyboardInterrupt]
+
+        with pytest.raises(KeyboardInterrupt):
+            first.get_processes("OAB:123PA")
+        first.journal.close()
+
+        second = self.build_service(scraper_config, Journal(path=journal_path))
+        count = second.get_processes("OAB:123PA")
+
+        assert count == 2
+        second.api_client.get.assert_not_called()
+        second.movement_service.get_movements.assert_called_once()
+        assert second.export_service.export.call_count == 1
+
+    def test_completed_query_is_skipped(
+        self, scraper_config, journal_path, sample_api_process_response
+    ):
+        """Test that a finished query returns its recorded count."""
+        first = self.build_service(scraper_config, Journal(path=journal_path))
+        first.api_client.get.return_value = {
+            "listaProcessos": [sample_api_process_response]
+        }
+        first.get_processes("OAB:123PA")
+        first.journal.close()
+
+        second = self.build_service(scraper_config, Journal(path=journal_path))
+
+        assert second.get_processes("OAB:123PA") == 1
+        second.export_service.export.assert_not_called()
+
+    def test_resume_keeps_the_journaled_page_size(
+        self, scraper_config, journal_path, sample_api_process_response
+    ):
+        """Test that a tuner change before a crash does not refetch pages."""
+        response = {"listaProcessos": [sample_api_process_response]}
+        first = self.build_service(
+            scraper_config,
+            Journal(path=journal_path),
+            PageSizeTuner(initial=200),
+        )
+        first.api_client.get.return_value = response
+        first.export_service.export.side_effect = KeyboardInterrupt
+
+        with pytest.raises(KeyboardInterrupt):
+            first.get_processes("OAB:123PA")
+        first.journal.close()
+
+        journal = Journal(path=journal_path)
+        second = self.build_service(
+            scraper_config, journal, PageSizeTuner(initial=500)
+        )
+
+        assert journal.get("OAB:123PA", PAGE_SIZE) == 200
+        assert second.get_processes("OAB:123PA") == 1
+        second.api_client.get.assert_not_called()
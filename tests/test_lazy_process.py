@@ -0,0 +1,88 @@
+"""Tests for the LazyProcess view."""
+
+import pickle
+from unittest.mock import MagicMock
+
+from client.api_client import ApiClient
+from models.lazy_process import LazyProcess
+from models.party import Party
+from models.process import Process
+from services.export_service import ExportService
+from services.movement_service import MovementService
+from services.process_service import ProcessService
+from utils.interning import StringDictionary
+
+
+class TestLazyProcess:
+    """Tests for LazyProcess."""
+
+    def test_fields_are_read_on_access(self, sample_api_process_response):
+        """Test that fields come from the raw dict only when accessed."""
+        strings = StringDictionary()
+        process = LazyProcess(sample_api_process_response, strings)
+
+        assert process.number == "08012345620268140301"
+        assert len(strings) == 0
+        assert process.class_ == "Ação Civil Pública"
+        assert process.parties == [Party("João da Silva", "Autor")]
+        assert process.movements == []
+        assert len(strings) == 2  # class and party type
+
+    def test_same_interface_as_eager_process(
+        self, sample_api_process_response
+    ):
+        """Test that methods and equality match Process.from_dict."""
+        eager = Process.from_dict(sample_api_process_response)
+        lazy = LazyProcess(sample_api_process_response)
+
+        assert isinstance(lazy, Process)
+        assert lazy == eager and eager == lazy
+        assert lazy.identity == eager.identity
+        assert lazy.cnj == eager.cnj
+        assert str(lazy) == str(eager)
+        assert lazy.to_dict() == eager.to_dict()
+        assert lazy.to_csv_export() == eager.to_csv_export()
+
+    def test_assignment_overrides_raw_value(
+        self, sample_api_process_response, sample_movement
+    ):
+        """Test that assigned fields win over the raw dict."""
+        process = LazyProcess(sample_api_process_response)
+
+        process.movements = [sample_movement]
+        process.situation = "Arquivado"
+
+        assert process.movements == [sample_movement]
+        assert process.to_dict()["situation"] == "Arquivado"
+        assert process.materialize().situation == "Arquivado"
+
+    def test_pickles_as_eager_process(
+        self, sample_api_process_response, sample_movement
+    ):
+        """Test that a lazy process is sent to other processes eagerly."""
+        process = LazyProcess(sample_api_process_response)
+        process.movements = [sample_movement]
+
+        restored = pickle.loads(pickle.dumps(process))
+
+        assert type(restored) is Process
+        assert restored == process
+
+
+def test_iter_processes_lazy(scraper_config, sample_api_process_response):
+    """Test that iter_processes can yield lazy processes."""
+    client = MagicMock(spec=ApiClient)
+    client.config = scraper_config
+    client.get.return_value = {"listaProcessos": [sample_api_process_response]}
+    service = ProcessService(
+        api_client=client,
+        export_service=MagicMock(spec=ExportService),
+        movement_service=MagicMock(spec=MovementService),
+    )
+
+    processes = list(
+        service.iter_processes("OAB:1PA", fetch_movements=False, lazy=True)
+    )
+
+    assert [type(p) for p in processes] == [LazyProcess]
+    assert processes[0].raw is sample_api_process_response
@@ -1,5 +1,10 @@
 """Tests for data models."""
 
+import dataclasses
+import pickle
+
+import pytest
+
 from models.movement import Movement
 from models.party import Party
 from models.process import Process
@@ -74,6 +79,15 @@ class TestMovement:
         assert movement.date is None
         assert movement.description is None
 
+    def test_is_immutable_and_hashable(self):
+        """Test that movements are frozen, slotted values."""
+        movement = Movement(date="01/02/2026", description="Despacho")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            movement.description = "Sentença"
+        assert not hasattr(movement, "__dict__")
+        assert len({movement, Movement("01/02/2026", "Despacho")}) == 1
+
 
 class TestProcess:
     """Tests for the Process model."""
@@ -170,3 +184,55 @@ class TestProcess:
         assert process.jurisdiction == ""  # default empty string
         assert process.competence == ""
         assert process.parties == []
+
+    def test_is_slotted(self, sample_process):
+        """Test that processes have no per-instance dictionary."""
+        assert not hasattr(sample_process, "__dict__")
+        with pytest.raises(AttributeError):
+            sample_process.unknown = 1
+
+
+class TestProcessSerializationCache:
+    """Tests for the memoized serialization of Process."""
+
+    def test_repeated_calls_reuse_cached_form(self, sample_process):
+        """Test that the movement list is built once."""
+        first = sample_process.to_dict()
+        second = sample_process.to_dict()
+
+        assert first == second
+        assert first["movements"] is second["movements"]
+        assert sample_process.to_csv_export() == sample_process.to_csv_export()
+
+    def test_returned_dicts_are_copies(self, sample_process):
+        """Test that modifying a result does not change the cache."""
+        sample_process.to_dict()["number"] = "changed"
+        sample_process.to_csv_export()["Classe"] = "changed"
+
+        assert sample_process.to_dict()["number"] == sample_process.number
+        assert (
+            sample_process.to_csv_export()["Classe"] == sample_process.class_
+        )
+
+    def test_changes_invalidate_cache(self, sample_process, sample_party):
+        """Test that assigning or growing the lists rebuilds the forms."""
+        sample_process.to_dict()
+        sample_process.to_csv_export()
+
+        sample_process.movements.append(Movement("02/02/2026", "Conclusos"))
+        assert len(sample_process.to_dict()["movements"]) == 2
+        sample_process.movements = []
+        assert sample_process.to_csv_export()["Movimentações"] == ""
+        sample_process.parties = [sample_party, sample_party]
+        assert len(sample_process.to_dict()["parties"]) == 2
+        sample_process.situation = "Arquivado"
+        assert sample_process.to_dict()["situation"] == "Arquivado"
+
+    def test_cache_is_not_pickled(self, sample_process):
+        """Test that a pickled process rebuilds its forms."""
+        expected = sample_process.to_dict()
+
+        restored = pickle.loads(pickle.dumps(sample_process))
+
+        assert restored._serialized is None
+        assert restored.to_dict() == expected
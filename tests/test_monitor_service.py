@@ -0,0 +1,219 @@
+"""Tests for the portfolio monitor."""
+
+import json
+import os
+import tempfile
+from datetime import date, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+import main
+from config import ScraperConfig
+from models.movement import Movement
+from services.monitor_service import (
+    JsonlMovementSink,
+    MonitoredEntry,
+    MonitorService,
+    is_archived,
+    latest_movement_day,
+)
+from services.movement_service import MovementService, MovementUpdate
+from services.process_service import ProcessService
+from storage.process_state import ProcessState, ProcessStateStore
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory for tests."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+@pytest.fixture
+def monitor(temp_dir, sample_process):
+    """Return a MonitorService with mocked services."""
+    process_service = MagicMock(spec=ProcessService)
+    process_service.search.return_value = [sample_process]
+    movement_service = MagicMock(spec=MovementService)
+    movement_service.state_store = ProcessStateStore(
+        path=os.path.join(temp_dir, "state.json")
+    )
+    return MonitorService(
+        process_service=process_service,
+        movement_service=movement_service,
+        config=ScraperConfig(),
+        schedule_path=os.path.join(temp_dir, "schedule.json"),
+        sink=MagicMock(),
+    )
+
+
+class TestHelpers:
+    """Tests for the monitor helper functions."""
+
+    def test_is_archived(self):
+        """Test detection of archived situations."""
+        assert is_archived("Arquivado Definitivamente")
+        assert is_archived("BAIXADO")
+        assert not is_archived("Em andamento")
+        assert not is_archived(None)
+
+    def test_latest_movement_day(self):
+        """Test that the most recent parseable date is returned."""
+        movements = [
+            Movement(date="01/02/2026", description="a"),
+            Movement(date="15/03/2026 10:00", description="b"),
+            Movement(date="", description="c"),
+        ]
+
+        assert latest_movement_day(movements) == date(2026, 3, 15).toordinal()
+        assert latest_movement_day([]) is None
+
+
+class TestMonitorService:
+    """Tests for MonitorService."""
+
+    def test_requires_state_store(self, monitor):
+        """Test that a movement service without state is rejected."""
+        monitor.movement_service.state_store = None
+
+        with pytest.raises(ValueError):
+            MonitorService(
+                process_service=monitor.process_service,
+                movement_service=monitor.movement_service,
+                config=monitor.config,
+                schedule_path=monitor.schedule_path,
+                sink=monitor.sink,
+            )
+
+    def test_first_poll_records_baseline_only(self, monitor):
+        """Test that the initial history is not emitted."""
+        monitor.movement_service.get_new_movements.return_value = (
+            MovementUpdate([Movement("01/02/2026", "Juntada")], full=True)
+        )
+        entry = MonitoredEntry(cnj="08012345620268140301")
+
+        assert monitor.poll(entry) == 0
+        monitor.sink.assert_not_called()
+        assert entry.last_activity == date(2026, 2, 1).toordinal()
+
+    def test_new_movements_are_emitted(self, monitor, sample_process):
+        """Test that incremental movements reach the sink."""
+        monitor.movement_service.state_store.put(
+            sample_process.identity, ProcessState(1, "x")
+        )
+        new = [Movement("02/02/2026", "Conclusos para despacho")]
+        monitor.movement_service.get_new_movements.return_value = (
+            MovementUpdate(new)
+        )
+        entry = MonitoredEntry(cnj="08012345620268140301")
+
+        assert monitor.poll(entry) == 1
+        monitor.sink.assert_called_once_with(sample_process, new)
+
+    def test_search_is_reused_between_polls(self, monitor):
+        """Test that later polls only cost movement requests."""
+        monitor.movement_service.get_new_movements.return_value = None
+        entry = MonitoredEntry(cnj="08012345620268140301")
+
+        monitor.poll(entry)
+        monitor.poll(entry)
+
+        monitor.process_service.search.assert_called_once()
+        assert monitor.movement_service.get_new_movements.call_count == 2
+
+    def test_interval_follows_activity(self, monitor):
+        """Test that active processes are polled more often."""
+        today = date.today()
+        recent = MonitoredEntry(
+            cnj="1", last_activity=(today - timedelta(days=1)).toordinal()
+        )
+        dormant = MonitoredEntry(
+            cnj="2", last_activity=(today - timedelta(days=400)).toordinal()
+        )
+        archived = MonitoredEntry(
+            cnj="3", last_activity=recent.last_activity, archived=True
+        )
+
+        assert monitor.get_interval(recent) == 3600.0
+        assert (
+            monitor.get_interval(dormant)
+            == monitor.config.monitor_max_interval
+        )
+        assert (
+            monitor.get_interval(archived)
+            == monitor.config.monitor_archived_interval
+        )
+
+    def test_run_polls_due_entries_and_saves_schedule(self, monitor):
+        """Test the scheduling loop and its persistence."""
+        monitor.movement_service.get_new_movements.return_value = None
+        monitor.set_portfolio(
+            ["0801234-56.2026.8.14.0301", "08099999920268140301"]
+        )
+
+        monitor.run(max_polls=2)
+
+        assert monitor.process_service.search.call_count == 2
+        with open(monitor.schedule_path, "r", encoding="utf-8") as f:
+            schedule = json.load(f)
+        assert set(schedule) == {
+            "08012345620268140301",
+            "08099999920268140301",
+        }
+        assert all(e["next_poll"] > 0 for e in schedule.values())
+
+
+class TestRunMonitor:
+    """Tests for the monitor mode of the CLI."""
+
+    def test_monitor_and_refresh_states_are_separate(
+        self, temp_dir, monkeypatch
+    ):
+        """Test that monitor polls do not touch the refresh state file."""
+        config = ScraperConfig()
+        refresh_store = ProcessStateStore(
+            path=os.path.join(temp_dir, "data", config.process_state_path)
+        )
+        refresh_store.put("refresh", ProcessState(total=2, fingerprint="a"))
+        refresh_store.save()
+        portfolio = os.path.join(temp_dir, "carteira.txt")
+        with open(portfolio, "w", encoding="utf-8") as f:
+            f.write("0801234-79.2026.8.14.0301\n")
+
+        def run(self, max_polls=None):
+            self.movement_service.state_store.put(
+                "monitor", ProcessState(total=5, fingerprint="b")
+            )
+            self.save()
+
+        monkeypatch.setattr(main, "base_dir", temp_dir)
+        monkeypatch.setattr(MonitorService, "run", run)
+        main.run_monitor(MagicMock(monitor=portfolio), config)
+
+        refresh_store = ProcessStateStore(path=refresh_store.path)
+        monitor_store = ProcessStateStore(
+            path=os.path.join(temp_dir, "data", config.monitor_state_path)
+        )
+        assert refresh_store.get("monitor") is None
+        assert refresh_store.get("refresh").total == 2
+        assert monitor_store.get("monitor").total == 5
+        assert monitor_store.get("refresh") is None
+
+
+class TestJsonlMovementSink:
+    """Tests for JsonlMovementSink."""
+
+    def test_appends_one_line_per_movement(self, temp_dir, sample_process):
+        """Test the JSON-lines output."""
+        path = os.path.join(temp_dir, "out", "new.jsonl")
+        sink = JsonlMovementSink(path)
+
+        sink(sample_process, sample_process.movements)
+        sink(sample_process, sample_process.movements)
+
+        with open(path, "r", encoding="utf-8") as f:
+            lines = [json.loads(line) for line in f]
+        assert len(lines) == 2
+        assert lines[0]["number"] == sample_process.number
+        assert lines[0]["description"] == "Juntada de petição"
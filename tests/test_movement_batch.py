@@ -0,0 +1,157 @@
+"""Tests for the columnar MovementBatch."""
+
+import json
+import pickle
+from unittest.mock import MagicMock
+
+import pytest
+
+from client.api_client import ApiClient
+from models.movement import Movement
+from models.movement_batch import MovementBatch
+from services.exporters.json_exporter import JSONExporter
+from services.movement_service import MovementService
+
+MOVEMENTS = [
+    Movement("01/02/2026", "Juntada de petição"),
+    Movement("03/02/2026", 'Despacho "mero expediente"'),
+    Movement("03/02/2026 10:30", "Juntada de petição"),
+    Movement(None, "Conclusos"),
+]
+
+
+class TestMovementBatch:
+    """Tests for MovementBatch."""
+
+    def test_is_a_sequence_of_movements(self):
+        """Test that the batch reads back the appended movements."""
+        batch = MovementBatch.from_movements(MOVEMENTS)
+
+        assert len(batch) == 4
+        assert batch == MOVEMENTS
+        assert batch[0] == MOVEMENTS[0]
+        assert batch[-1] == MOVEMENTS[-1]
+        assert batch[1:3] == MOVEMENTS[1:3]
+        assert MOVEMENTS[2] in batch
+
+    def test_columns_are_compact(self):
+        """Test that dates are ordinals and descriptions are codes."""
+        batch = MovementBatch.from_movements(MOVEMENTS)
+
+        assert batch.days.typecode == "i"
+        assert batch.days[1] - batch.days[0] == 2
+        assert list(batch.descriptions) == [0, 1, 0, 2]
+        assert batch.odd_dates == {2: "03/02/2026 10:30", 3: None}
+
+    def test_fills_from_api_pages(self):
+        """Test that listaResultado rows are appended directly."""
+        batch = MovementBatch()
+
+        batch.extend_api(
+            [{"dataFormatada": "01/02/2026", "descricao": "Juntada"}]
+        )
+
+        assert list(batch) == [Movement("01/02/2026", "Juntada")]
+
+    def test_serializes_like_movement_lists(self):
+        """Test that text and JSON match the per-row serialization."""
+        batch = MovementBatch.from_movements(MOVEMENTS)
+
+        assert batch.to_text() == "\n".join(str(m) for m in MOVEMENTS)
+        assert batch.to_json() == json.dumps(
+            [m.to_dict() for m in MOVEMENTS], ensure_ascii=False, indent=4
+        )
+        assert MovementBatch().to_json() == "[]"
+
+    def test_pickle_round_trip(self):
+        """Test that a batch can be sent to worker processes."""
+        batch = MovementBatch.from_movements(MOVEMENTS)
+
+        assert pickle.loads(pickle.dumps(batch)) == MOVEMENTS
+
+
+def test_json_export_of_batch_matches_list(sample_process, tmp_path):
+    """Test that a process with a batch exports the same JSON document."""
+    exporter = JSONExporter(export_path=str(tmp_path))
+    sample_process.movements = MOVEMENTS
+    exporter.export(sample_process, "list")
+    sample_process.movements = MovementBatch.from_movements(MOVEMENTS)
+    exporter.export(sample_process, "batch")
+
+    assert (tmp_path / "batch.json").read_text(encoding="utf-8") == (
+        tmp_path / "list.json"
+    ).read_text(encoding="utf-8")
+    assert sample_process.to_csv_export()["Movimentações"] == "\n".join(
+        str(m) for m in MOVEMENTS
+    )
+
+
+class TestColumnarMovementService:
+    """Tests for the columnar fetch of MovementService."""
+
+    @pytest.fixture
+    def movement_service(self, scraper_config):
+        """Return a MovementService with two pages of movements."""
+        client = MagicMock(spec=ApiClient)
+        client.config = scraper_config
+        rows = [
+            {"dataFormatada": f"{day:02d}/01/2026", "descricao": "Juntada"}
+            for day in range(1, 4)
+        ]
+        client.get.side_effect = [
+            {"qtdRegistrosTotal": 3, "listaResultado": rows[:2]},
+            {"qtdRegistrosTotal": 3, "listaResultado": rows[1:]},
+        ]
+        return MovementService(api_client=client, state_store=MagicMock())
+
+    def test_get_movement_batch(self, movement_service, sample_process):
+        """Test that pages are deduplicated into the batch."""
+        batch = movement_service.get_movement_batch(sample_process)
+
+        assert [m.date for m in batch] == [
+            "01/01/2026",
+            "02/01/2026",
+            "03/01/2026",
+        ]
+        movement_service.state_store.put.assert_not_called()
+        movement_service.save_state(sample_process)
+        state = movement_service.state_store.put.call_args[0][1]
+        assert state.total == 3
+
+    def test_threshold_selects_container(
+        self, movement_service, sample_process
+    ):
+        """Test that only large histories are returned as a batch."""
+        movement_service.columnar_threshold = 3
+
+        movements = movement_service.get_movements(sample_process)
+
+        assert isinstance(movements, MovementBatch)
+        assert len(movements) == 3
+
+    def test_small_histories_stay_lists(
+        self, movement_service, sample_process
+    ):
+        """Test that histories under the threshold are plain lists."""
+        movement_service.columnar_threshold = 10
+
+        movements = movement_service.get_movements(sample_process)
+
+        assert type(movements) is list
+        assert len(movements) == 3
+
+    def test_small_histories_never_build_a_batch(
+        self, movement_service, sample_process, monkeypatch
+    ):
+        """Test that the first page total picks the container up front."""
+        batch_class = MagicMock()
+        monkeypatch.setattr(
+            "services.movement_service.MovementBatch", batch_class
+        )
+        movement_service.columnar_threshold = 10
+
+        movements = movement_service.get_movements(sample_process)
+
+        batch_class.assert_not_called()
+        assert all(isinstance(m, Movement) for m in movements)
+        assert movement_service.api_client.get.call_count == 2
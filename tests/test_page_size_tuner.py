@@ -0,0 +1,102 @@
+"""Tests for the per-endpoint page size tuner."""
+
+from unittest.mock import MagicMock
+
+from client.api_client import ApiClient
+from client.page_size_tuner import PageSizeTuner, RequestInfo
+from services.export_service import ExportService
+from services.movement_service import MovementService
+from services.process_service import ProcessService
+
+FAST = RequestInfo(size=1000, elapsed=0.1)
+SLOW = RequestInfo(size=1000, elapsed=20.0)
+
+
+class TestPageSizeTuner:
+    """Tests for PageSizeTuner."""
+
+    def test_timeout_halves_page_size(self):
+        """Test that a timeout immediately halves the page size."""
+        tuner = PageSizeTuner(initial=1000)
+
+        tuner.observe("/a/", 1000, 0, RequestInfo(timeouts=1))
+
+        assert tuner.page_size("/a/") == 500
+        assert tuner.page_size("/b/") == 1000
+
+    def test_fast_full_pages_grow_page_size(self):
+        """Test that consistently fast full pages double the page size."""
+        tuner = PageSizeTuner(initial=1000, min_samples=3)
+
+        for _ in range(3):
+            tuner.observe("/a/", 1000, 1000, FAST)
+
+        assert tuner.page_size("/a/") == 2000
+
+    def test_partial_pages_do_not_grow_page_size(self):
+        """Test that the last page of a result does not grow the size."""
+        tuner = PageSizeTuner(initial=1000, min_samples=1)
+
+        tuner.observe("/a/", 1000, 10, FAST)
+
+        assert tuner.page_size("/a/") == 1000
+
+    def test_slow_pages_shrink_page_size(self):
+        """Test that slow pages shrink the page size within the bounds."""
+        tuner = PageSizeTuner(initial=100, min_size=80, min_samples=1)
+
+        tuner.observe("/a/", 100, 100, SLOW)
+        tuner.observe("/a/", 80, 80, SLOW)
+
+        assert tuner.page_size("/a/") == 80
+
+    def test_outdated_observations_are_ignored(self):
+        """Test that pages of a previous page size do not count."""
+        tuner = PageSizeTuner(initial=1000, min_samples=1)
+        tuner.observe("/a/", 1000, 0, RequestInfo(timeouts=1))
+
+        tuner.observe("/a/", 1000, 0, RequestInfo(timeouts=1))
+
+        assert tuner.page_size("/a/") == 500
+
+    def test_page_sizes_persist_across_runs(self, tmp_path):
+        """Test that a tuned page size is reused by a new tuner."""
+        path = str(tmp_path / "page_sizes.json")
+        tuner = PageSizeTuner(path=path, initial=1000)
+        tuner.observe("/a/", 1000, 0, RequestInfo(timeouts=2))
+
+        assert PageSizeTuner(path=path, initial=1000).page_size("/a/") == 500
+
+
+class TestTunedRequests:
+    """Tests for the services using the tuned page sizes."""
+
+    def test_search_and_movement_urls_use_tuned_size(
+        self, scraper_config, sample_process
+    ):
+        """Test that the tuned size is used and reported back."""
+        tuner = PageSizeTuner(initial=200, min_samples=1)
+        client = MagicMock(spec=ApiClient)
+        client.config = scraper_config
+        client.take_request_info.return_value = FAST
+        client.get.return_value = {
+            "qtdRegistrosTotal": 1,
+            "listaResultado": [{"listaProcessos": [{"numero": "1"}]}],
+        }
+        movement_service = MovementService(
+            api_client=client, page_size_tuner=tuner
+        )
+        process_service = ProcessService(
+            api_client=client,
+            export_service=MagicMock(spec=ExportService),
+            movement_service=movement_service,
+            page_size_tuner=tuner,
+        )
+
+        page = process_service.fetch_search_page("12345678901")
+        movement_service.count_movements(sample_process)
+
+        urls = [call[0][0] for call in client.get.call_args_list]
+        assert urls[0] == "/processobycpf/12345678901/1/200"
+        assert urls[1].endswith("/1/200")
+        assert page.page_size == 200
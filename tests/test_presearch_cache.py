@@ -0,0 +1,138 @@
+"""Tests for the presearch result cache."""
+
+import os
+import tempfile
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from client.api_client import ApiClient
+from services.export_service import ExportService
+from services.movement_service import MovementService
+from services.process_service import ProcessService
+from storage.presearch_cache import PresearchCache, normalize_name
+
+
+class TestNormalizeName:
+    """Tests for normalize_name."""
+
+    def test_removes_accents_and_case(self):
+        """Test that accents and case are folded."""
+        assert normalize_name("José ANTÔNIO") == "jose antonio"
+
+    def test_collapses_whitespace_and_quotes(self):
+        """Test that quotes and repeated spaces are removed."""
+        assert normalize_name('"Maria   Silva" ') == "maria silva"
+
+
+class TestPresearchCache:
+    """Tests for PresearchCache."""
+
+    @pytest.fixture
+    def cache_path(self):
+        """Return a path for the cache file inside a temporary directory."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield os.path.join(tmpdir, "cache.json")
+
+    def test_get_missing_returns_none(self, cache_path):
+        """Test lookup of an unknown name."""
+        cache = PresearchCache(path=cache_path)
+
+        assert cache.get("NOME_PARTE", "Jose Antonio") is None
+
+    def test_put_and_get_normalized(self, cache_path):
+        """Test that lookups match accent/case variants."""
+        cache = PresearchCache(path=cache_path)
+        value = [{"nome": "JOSE ANTONIO", "sistema": "PROJUDI"}]
+
+        cache.put("NOME_PARTE", "José Antônio", value)
+
+        assert cache.get("NOME_PARTE", "jose antonio") == value
+        assert cache.get("NOME_PARTE_EXATO", "jose antonio") is None
+
+    def test_persists_between_instances(self, cache_path):
+        """Test that entries are reloaded from disk."""
+        value = [{"nome": "JOSE ANTONIO", "sistema": "PROJUDI"}]
+        cache = PresearchCache(path=cache_path)
+        cache.put("NOME_PARTE", "Jose Antonio", value)
+        cache.save()
+
+        assert (
+            PresearchCache(path=cache_path).get("NOME_PARTE", "Jose Antonio")
+            == value
+        )
+
+    def test_writes_are_batched(self, cache_path):
+        """Test that the file is only written every save_every puts."""
+        cache = PresearchCache(path=cache_path, save_every=2)
+
+        cache.put("NOME_PARTE", "Ana Souza", [])
+        assert not os.path.exists(cache_path)
+        cache.put("NOME_PARTE", "Bruno Lima", [])
+        assert len(PresearchCache(path=cache_path)) == 2
+
+        cache.put("NOME_PARTE", "Carla Dias", [])
+        cache.save()
+        assert len(PresearchCache(path=cache_path)) == 3
+
+    def test_expired_entries_are_ignored(self, cache_path):
+        """Test that entries older than the TTL are not returned."""
+        cache = PresearchCache(path=cache_path, ttl=10)
+        with patch("storage.presearch_cache.time.time", return_value=1000):
+            cache.put("NOME_PARTE", "Jose Antonio", [{"sistema": "PROJUDI"}])
+        with patch("storage.presearch_cache.time.time", return_value=1011):
+            assert cache.get("NOME_PARTE", "Jose Antonio") is None
+
+    def test_size_cap_evicts_least_recently_used(self, cache_path):
+        """Test that the oldest entry is evicted past max_entries."""
+        cache = PresearchCache(path=cache_path, max_entries=2)
+        cache.put("NOME_PARTE", "Ana Souza", [])
+        cache.put("NOME_PARTE", "Bruno Lima", [])
+        cache.get("NOME_PARTE", "Ana Souza")
+        cache.put("NOME_PARTE", "Carla Dias", [])
+
+        assert len(cache) == 2
+        assert cache.get("NOME_PARTE", "Bruno Lima") is None
+        assert cache.get("NOME_PARTE", "Ana Souza") == []
+
+
+class TestProcessServicePresearchCache:
+    """Tests for ProcessService using the presearch cache."""
+
+    @pytest.fixture
+    def process_service(self, scraper_config):
+        """Return a ProcessService with a cache and mocked dependencies."""
+        client = MagicMock(spec=ApiClient)
+        client.config = scraper_config
+        movement_service = MagicMock(spec=MovementService)
+        movement_service.get_movements.return_value = []
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield ProcessService(
+                api_client=client,
+                export_service=MagicMock(spec=ExportService),
+                movement_service=movement_service,
+                presearch_cache=PresearchCache(
+                    path=os.path.join(tmpdir, "cache.json")
+                ),
+            )
+
+    def test_second_lookup_skips_presearch(
+        self, process_service, sample_api_process_response
+    ):
+        """Test that a repeated name only pays for the per-system search."""
+        presearch = [
+            {"nome": "JOSE ANTONIO", "quantidade": "1", "sistema": "PROJUDI"}
+        ]
+        processes = {"listaProcessos": [sample_api_process_response]}
+        process_service.api_client.get.side_effect = [
+            presearch,
+            processes,
+            processes,
+        ]
+
+        process_service.get_processes("Jose Antonio")
+        process_service.get_processes("JOSÉ ANTÔNIO")
+
+        assert process_service.api_client.get.call_count == 3
+        last_url = process_service.api_client.get.call_args[0][0]
+        assert "PROJUDI" in last_url
@@ -0,0 +1,136 @@
+"""Tests for the priority scheduler."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+from client.api_client import ApiClient
+from client.priority_scheduler import (
+    Lane,
+    PriorityScheduler,
+    current_lane,
+    use_lane,
+)
+from entities.request_type import RequestType
+from services.export_service import ExportService
+from services.movement_service import MovementService
+from services.process_service import ProcessService
+
+
+def run_contended(scheduler, lanes):
+    """Queue one request per lane while a slot is held; return serve order."""
+    order = []
+    lock = threading.Lock()
+
+    def request(lane):
+        with scheduler.slot(lane):
+            with lock:
+                order.append(lane)
+
+    scheduler.acquire(Lane.BULK)
+    threads = []
+    for lane in lanes:
+        thread = threading.Thread(target=request, args=(lane,))
+        thread.start()
+        threads.append(thread)
+        expected = len(threads)
+        while sum(len(q) for q in scheduler._waiting.values()) < expected:
+            time.sleep(0.001)
+    scheduler.release()
+    for thread in threads:
+        thread.join(timeout=5)
+    return order
+
+
+class TestLanes:
+    """Tests for lane selection."""
+
+    def test_cnj_is_interactive(self):
+        """Test that CNJ lookups default to the interactive lane."""
+        assert Lane.for_request_type(RequestType.CNJ) is Lane.INTERACTIVE
+        assert Lane.for_request_type(RequestType.OAB) is Lane.BULK
+
+    def test_use_lane_is_scoped(self):
+        """Test that the thread lane is restored after the block."""
+        assert current_lane() is Lane.BULK
+        with use_lane(Lane.INTERACTIVE):
+            assert current_lane() is Lane.INTERACTIVE
+            with use_lane(Lane.BULK):
+                assert current_lane() is Lane.BULK
+            assert current_lane() is Lane.INTERACTIVE
+        assert current_lane() is Lane.BULK
+
+
+class TestPriorityScheduler:
+    """Tests for PriorityScheduler."""
+
+    def test_interactive_goes_ahead_of_queued_bulk(self):
+        """Test that a later interactive request is served first."""
+        scheduler = PriorityScheduler()
+
+        order = run_contended(
+            scheduler, [Lane.BULK, Lane.BULK, Lane.BULK, Lane.INTERACTIVE]
+        )
+
+        assert order[0] is Lane.INTERACTIVE
+
+    def test_weighted_sharing(self):
+        """Test that lanes share slots in proportion to their weights."""
+        scheduler = PriorityScheduler(
+            weights={Lane.INTERACTIVE: 2, Lane.BULK: 1}
+        )
+
+        order = run_contended(
+            scheduler, [Lane.BULK] * 6 + [Lane.INTERACTIVE] * 6
+        )
+
+        # The slot held while queueing counts as the first bulk grant
+        served = [Lane.BULK] + order
+        assert served[:9].count(Lane.INTERACTIVE) == 6
+        assert len(order) == 12
+
+    def test_max_in_flight(self):
+        """Test that slots beyond max_in_flight wait."""
+        scheduler = PriorityScheduler(max_in_flight=2)
+        scheduler.acquire(Lane.BULK)
+        scheduler.acquire(Lane.BULK)
+        acquired = threading.Event()
+
+        def request():
+            scheduler.acquire(Lane.INTERACTIVE)
+            acquired.set()
+
+        thread = threading.Thread(target=request)
+        thread.start()
+        assert not acquired.wait(0.05)
+        scheduler.release()
+        assert acquired.wait(5)
+        thread.join()
+
+
+class TestProcessServiceLanes:
+    """Tests for the lane used by ProcessService."""
+
+    def test_requests_run_in_request_type_lane(
+        self, scraper_config, sample_api_process_response
+    ):
+        """Test that CNJ queries run in the interactive lane."""
+        lanes = []
+        client = MagicMock(spec=ApiClient)
+        client.config = scraper_config
+
+        def get(url):
+            lanes.append(current_lane())
+            return {"listaProcessos": [sample_api_process_response]}
+
+        client.get.side_effect = get
+        service = ProcessService(
+            api_client=client,
+            export_service=MagicMock(spec=ExportService),
+            movement_service=MagicMock(spec=MovementService),
+        )
+
+        service.get_processes("08012345620268140301")
+        service.get_processes("OAB:123PA")
+
+        assert lanes == [Lane.INTERACTIVE, Lane.BULK]
@@ -0,0 +1,96 @@
+"""Tests for the run-wide process registry."""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from client.api_client import ApiClient
+from services.export_service import ExportService
+from services.movement_service import MovementService
+from services.process_registry import ProcessRegistry
+from services.process_service import ProcessService
+
+
+class TestProcessRegistry:
+    """Tests for ProcessRegistry."""
+
+    def test_first_claim_wins(self):
+        """Test that only the first query has to fetch a process."""
+        registry = ProcessRegistry()
+
+        assert registry.claim("1/2/3", "CPF") is True
+        registry.complete("1/2/3", "process_1")
+
+        assert registry.claim("1/2/3", "OAB") is False
+        assert registry.get_file_name("1/2/3") == "process_1"
+        assert registry.links() == {"1/2/3": ["CPF", "OAB"]}
+
+    def test_release_lets_next_query_retry(self):
+        """Test that a failed fetch can be retried by another query."""
+        registry = ProcessRegistry()
+        registry.claim("1/2/3", "CPF")
+        registry.release("1/2/3")
+
+        assert registry.claim("1/2/3", "OAB") is True
+
+    def test_claim_waits_for_in_progress_fetch(self):
+        """Test that a concurrent claim waits for the owner to finish."""
+        registry = ProcessRegistry()
+        registry.claim("1/2/3", "CPF")
+        outcome = []
+        waiter = threading.Thread(
+            target=lambda: outcome.append(registry.claim("1/2/3", "OAB"))
+        )
+        waiter.start()
+        registry.complete("1/2/3", "process_1")
+        waiter.join(timeout=5)
+
+        assert outcome == [False]
+
+
+class TestProcessServiceRegistry:
+    """Tests for ProcessService sharing processes across queries."""
+
+    @pytest.fixture
+    def process_service(self, scraper_config):
+        """Return a ProcessService with a registry and mocked dependencies."""
+        client = MagicMock(spec=ApiClient)
+        client.config = scraper_config
+        movement_service = MagicMock(spec=MovementService)
+        movement_service.get_movements.return_value = []
+        return ProcessService(
+            api_client=client,
+            export_service=MagicMock(spec=ExportService),
+            movement_service=movement_service,
+            registry=ProcessRegistry(),
+        )
+
+    def test_second_query_links_instead_of_refetching(
+        self, process_service, sample_api_process_response
+    ):
+        """Test that a process found twice is fetched and exported once."""
+        process_service.api_client.get.return_value = {
+            "listaProcessos": [sample_api_process_response]
+        }
+
+        assert process_service.get_processes("12345678909") == 1
+        assert process_service.get_processes("OAB:123PA") == 1
+
+        process_service.movement_service.get_movements.assert_called_once()
+        process_service.export_service.export.assert_called_once()
+
+    def test_failed_export_releases_claim(
+        self, process_service, sample_api_process_response
+    ):
+        """Test that a failure does not block later queries."""
+        process_service.api_client.get.return_value = {
+            "listaProcessos": [sample_api_process_response]
+        }
+        process_service.export_service.export.side_effect = [OSError, None]
+
+        with pytest.raises(OSError):
+            process_service.get_processes("12345678909")
+        process_service.get_processes("OAB:123PA")
+
+        assert process_service.export_service.export.call_count == 2
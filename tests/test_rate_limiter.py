@@ -0,0 +1,54 @@
+"""Tests for the token bucket rate limiter."""
+
+from unittest.mock import patch
+
+import pytest
+
+from utils.rate_limiter import TokenBucket
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_burst_up_to_capacity(self):
+        """Test that a full bucket allows a burst of capacity tokens."""
+        bucket = TokenBucket(rate=1.0, capacity=3)
+
+        assert [bucket.try_acquire() for _ in range(3)] == [0, 0, 0]
+        assert bucket.try_acquire() > 0
+
+    def test_wait_time_matches_rate(self):
+        """Test the reported wait for an empty bucket."""
+        with patch("utils.rate_limiter.time.monotonic", return_value=100.0):
+            bucket = TokenBucket(rate=0.5, capacity=1)
+            bucket.try_acquire()
+
+            assert bucket.try_acquire() == pytest.approx(2.0)
+
+    def test_refill_over_time(self):
+        """Test that tokens are refilled at the configured rate."""
+        with patch("utils.rate_limiter.time.monotonic") as monotonic:
+            monotonic.return_value = 100.0
+            bucket = TokenBucket(rate=2.0, capacity=1)
+            bucket.try_acquire()
+            monotonic.return_value = 100.5
+
+            assert bucket.try_acquire() == 0
+
+    @patch("utils.rate_limiter.time.sleep")
+    def test_acquire_sleeps_until_available(self, mock_sleep):
+        """Test that acquire sleeps when the bucket is empty."""
+        bucket = TokenBucket(rate=1000.0, capacity=1)
+        bucket.acquire()
+        bucket.acquire()
+
+        mock_sleep.assert_called()
+
+    def test_per_hour(self):
+        """Test creating a bucket from an hourly budget."""
+        assert TokenBucket.per_hour(3600).rate == pytest.approx(1.0)
+
+    def test_invalid_rate(self):
+        """Test that a non-positive rate is rejected."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
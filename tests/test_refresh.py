@@ -0,0 +1,287 @@
+"""Tests for incremental movement refresh."""
+
+import os
+import tempfile
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from client.api_client import ApiClient
+from models.movement import Movement
+from services.export_service import ExportService
+from services.movement_service import MovementService
+from services.process_service import ProcessService
+from storage.process_state import (
+    ProcessState,
+    ProcessStateStore,
+    movement_fingerprint,
+)
+
+
+def raw_movement(index):
+    """Return a raw API movement."""
+    return {
+        "dataFormatada": f"{index:02d}/01/2026",
+        "descricao": f"Mov {index}",
+    }
+
+
+def page(total, indexes):
+    """Return a raw API movement page."""
+    return {
+        "qtdRegistrosTotal": total,
+        "listaResultado": [raw_movement(i) for i in indexes],
+    }
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory for tests."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+class TestProcessStateStore:
+    """Tests for ProcessStateStore."""
+
+    def test_save_and_reload(self, temp_dir):
+        """Test that states survive a reload."""
+        path = os.path.join(temp_dir, "state.json")
+        store = ProcessStateStore(path=path)
+        store.put("1/2/3", ProcessState(total=5, fingerprint="abc"))
+        store.save()
+
+        assert ProcessStateStore(path=path).get("1/2/3") == ProcessState(
+            total=5, fingerprint="abc"
+        )
+
+    def test_autosave(self, temp_dir):
+        """Test that states are written every save_every updates."""
+        path = os.path.join(temp_dir, "state.json")
+        store = ProcessStateStore(path=path, save_every=2)
+        store.put("a", ProcessState(total=1, fingerprint="x"))
+        assert not os.path.exists(path)
+
+        store.put("b", ProcessState(total=1, fingerprint="y"))
+        assert len(ProcessStateStore(path=path)) == 2
+
+
+class TestMovementServiceRefresh:
+    """Tests for MovementService.refresh_movements."""
+
+    @pytest.fixture
+    def movement_service(self, scraper_config, temp_dir):
+        """Return a MovementService with a state store."""
+        client = MagicMock(spec=ApiClient)
+        client.config = scraper_config
+        return MovementService(
+            api_client=client,
+            state_store=ProcessStateStore(
+                path=os.path.join(temp_dir, "state.json")
+            ),
+        )
+
+    @pytest.fixture
+    def known(self):
+        """Return the movements of a previous export."""
+        return [Movement.from_dict(raw_movement(i)) for i in range(3)]
+
+    def test_full_fetch_stores_state(self, movement_service, sample_process):
+        """Test that a regular fetch records total and fingerprint."""
+        movement_service.api_client.get.return_value = page(3, range(3))
+
+        movement_service.get_movements(sample_process)
+        assert (
+            movement_service.state_store.get(sample_process.identity) is None
+        )
+        movement_service.save_state(sample_process)
+
+        state = movement_service.state_store.get(sample_process.identity)
+        assert state.total == 3
+        assert state.fingerprint == movement_fingerprint(raw_movement(2))
+
+    def test_unchanged_process_costs_one_request(
+        self, movement_service, sample_process, known
+    ):
+        """Test that an unchanged total skips the process."""
+        movement_service.state_store.put(
+            sample_process.identity,
+            ProcessState(3, movement_fingerprint(raw_movement(2))),
+        )
+        movement_service.api_client.get.return_value = page(3, range(3))
+
+        result = movement_service.refresh_movements(sample_process, known)
+
+        assert result is None
+        assert movement_service.api_client.get.call_count == 1
+
+    def test_changed_process_fetches_only_tail(
+        self, movement_service, sample_process, known
+    ):
+        """Test that only the missing pages are fetched and merged."""
+        movement_service.state_store.put(
+            sample_process.identity,
+            ProcessState(3, movement_fingerprint(raw_movement(2))),
+        )
+        movement_service.api_client.get.side_effect = [
+            page(5, [0, 1]),
+            page(5, [2, 3]),
+            page(5, [4]),
+        ]
+
+        with patch("services.movement_service.MOVEMENTS_PAGE_SIZE", 2):
+            result = movement_service.refresh_movements(sample_process, known)
+
+        assert [m.description for m in result] == [
+            f"Mov {i}" for i in range(5)
+        ]
+        urls = [
+            c[0][0] for c in movement_service.api_client.get.call_args_list
+        ]
+        assert [url.split("/")[-2] for url in urls] == ["1", "2", "3"]
+        movement_service.save_state(sample_process)
+        state = movement_service.state_store.get(sample_process.identity)
+        assert state.total == 5
+
+    def test_fingerprint_mismatch_refetches_everything(
+        self, movement_service, sample_process, known
+    ):
+        """Test that a rewritten history triggers a full fetch."""
+        movement_service.state_store.put(
+            sample_process.identity, ProcessState(3, "stale")
+        )
+        movement_service.api_client.get.side_effect = [
+            page(4, range(4)),
+            page(4, range(4)),
+        ]
+
+        result = movement_service.refresh_movements(sample_process, known)
+
+        assert len(result) == 4
+        assert movement_service.api_client.get.call_count == 2
+
+    def test_failed_page_stores_collected_count(
+        self, movement_service, sample_process, known
+    ):
+        """Test that a page lost mid-fetch is fetched by the next refresh."""
+        movement_service.api_client.get.side_effect = [
+            page(5, [0, 1]),
+            [],  # what ``retry`` returns for a page that kept failing
+        ]
+        with patch("services.movement_service.MOVEMENTS_PAGE_SIZE", 2):
+            movements = movement_service.get_movements(sample_process)
+        movement_service.save_state(sample_process)
+
+        assert len(movements) == 2
+        state = movement_service.state_store.get(sample_process.identity)
+        assert state == ProcessState(2, movement_fingerprint(raw_movement(1)))
+
+        movement_service.api_client.get.side_effect = [
+            page(5, [0, 1]),
+            page(5, [2, 3]),
+            page(5, [4]),
+        ]
+        with patch("services.movement_service.MOVEMENTS_PAGE_SIZE", 2):
+            update = movement_service.get_new_movements(sample_process)
+
+        assert [m.description for m in update.movements] == [
+            f"Mov {i}" for i in range(2, 5)
+        ]
+        assert not update.full
+
+    def test_state_is_only_stored_by_save_state(
+        self, movement_service, sample_process
+    ):
+        """Test that fetching alone does not move the refresh baseline."""
+        movement_service.api_client.get.return_value = page(3, range(3))
+
+        movement_service.get_movements(sample_process)
+        movement_service.get_movements(sample_process)
+
+        assert (
+            movement_service.state_store.get(sample_process.identity) is None
+        )
+        movement_service.save_state(sample_process)
+        movement_service.save_state(sample_process)
+        assert len(movement_service.state_store) == 1
+
+
+class TestProcessServiceRefresh:
+    """Tests for ProcessService in refresh mode."""
+
+    def test_unchanged_process_is_not_exported(
+        self, scraper_config, temp_dir, sample_api_process_response
+    ):
+        """Test that refresh runs skip exporting unchanged processes."""
+        client = MagicMock(spec=ApiClient)
+        client.config = scraper_config
+        client.get.return_value = {
+            "listaProcessos": [sample_api_process_response]
+        }
+        movement_service = MagicMock(spec=MovementService)
+        movement_service.refresh_movements.return_value = None
+        export_service = ExportService(
+            config=scraper_config, base_dir=temp_dir
+        )
+        service = ProcessService(
+            api_client=client,
+            export_service=export_service,
+            movement_service=movement_service,
+            refresh=True,
+        )
+
+        assert service.get_processes("08012345620268140301") == 1
+        movement_service.refresh_movements.assert_called_once()
+        assert not os.path.exists(export_service.json_export_dir)
+
+    def test_failed_export_keeps_previous_state(
+        self, scraper_config, temp_dir, sample_api_process_response
+    ):
+        """Test that the state is only stored once the export succeeded."""
+        client = MagicMock(spec=ApiClient)
+        client.config = scraper_config
+        client.get.side_effect = [
+            {"listaProcessos": [sample_api_process_response]},
+            page(3, range(3)),
+        ]
+        movement_service = MovementService(
+            api_client=client,
+            state_store=ProcessStateStore(
+                path=os.path.join(temp_dir, "state.json")
+            ),
+        )
+        export_service = MagicMock(spec=ExportService)
+        export_service.export.side_effect = OSError("disk full")
+        service = ProcessService(
+            api_client=client,
+            export_service=export_service,
+            movement_service=movement_service,
+        )
+
+        with pytest.raises(OSError):
+            service.get_processes("08012345620268140301")
+
+        assert len(movement_service.state_store) == 0
+
+
+class TestExportServiceLoadMovements:
+    """Tests for ExportService.load_movements."""
+
+    def test_round_trip(self, scraper_config, temp_dir, sample_process):
+        """Test that exported movements can be read back."""
+        export_service = ExportService(
+            config=scraper_config, base_dir=temp_dir
+        )
+        export_service.export(sample_process)
+
+        assert export_service.load_movements(sample_process) == (
+            sample_process.movements
+        )
+
+    def test_missing_export(self, scraper_config, temp_dir, sample_process):
+        """Test that a process without export returns None."""
+        export_service = ExportService(
+            config=scraper_config, base_dir=temp_dir
+        )
+
+        assert export_service.load_movements(sample_process) is None
@@ -187,3 +187,50 @@ class TestRequestTypeGetRequestUrl:
         """Test CPF URL forces default pagination."""
         url = RequestType.CPF.get_request_url("12345678901")
         assert url == "/processobycpf/12345678901/1/1000"
+
+
+class TestRequestTypeClassifyMany:
+    """Tests for the precompiled bulk classifier."""
+
+    SAMPLES = [
+        "0801234-56.2026.8.14.0301",
+        "08012345620268140301",
+        "123.456.789-01",
+        "12345678901234",
+        "OAB:12345PA",
+        "oab12345pa",
+        "Oab Silva",
+        "INQ:2026.12345",
+        "Jose Antonio",
+        '"Jose Antonio"',
+        "João",
+        "!@#$%",
+        "-Silva Souza",
+        "ınq:2026.12345",
+        "İNQ:2026.12345",
+        "oİb12345pa",
+        "0801234-56.2026.8.14.03O1",
+    ]
+
+    @staticmethod
+    def __full_scan__(request):
+        patterns = RequestType._get_patterns()
+        for request_type in RequestType:
+            if patterns[request_type].match(request):
+                return request_type
+        return None
+
+    def test_matches_full_pattern_scan(self):
+        """Test that prefix dispatch agrees with trying every pattern."""
+        result = RequestType.classify_many(self.SAMPLES)
+
+        assert result == [self.__full_scan__(s) for s in self.SAMPLES]
+
+    def test_invalid_and_empty_requests_are_none(self):
+        """Test that unclassifiable requests do not raise."""
+        assert RequestType.classify_many(["", "  ", "João", " OAB:1PA "]) == [
+            None,
+            None,
+            None,
+            RequestType.OAB,
+        ]
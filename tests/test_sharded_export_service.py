@@ -0,0 +1,106 @@
+"""Tests for the process-pool sharded export service."""
+
+import csv
+import json
+import os
+from dataclasses import replace
+
+from services.export_service import ExportService
+from services.sharded_export_service import ShardedExportService, shard_for
+
+
+class TestSharding:
+    """Tests for the CNJ origin sharding."""
+
+    def test_shard_for_uses_origin(self, sample_process):
+        """Test that a process is sharded by its origin segment."""
+        assert shard_for(sample_process, 4) == 301 % 4
+        assert shard_for(sample_process, 1) == 0
+
+    def test_shard_for_malformed_number(self, sample_process):
+        """Test that malformed numbers fall in the first shard."""
+        assert shard_for(replace(sample_process, number="123"), 4) == 0
+
+
+class TestShardedExportService:
+    """Tests for ShardedExportService."""
+
+    def test_close_exports_and_merges_shards(
+        self, scraper_config, sample_process, tmp_path
+    ):
+        """Test that every shard is exported and merged with one header."""
+        service = ShardedExportService(
+            config=scraper_config, base_dir=str(tmp_path), shards=2
+        )
+        other = replace(
+            sample_process,
+            number="08012345620268140302",
+            formatted_number="0801234-56.2026.8.14.0302",
+        )
+
+        file_name = service.export(sample_process)
+        service.export(other)
+        service.export(sample_process)
+        csv_path, jsonl_path = service.close()
+
+        assert file_name == (
+            "process_08012345620268140301_doc_12345_instance_1"
+        )
+        with open(csv_path, "r", encoding="utf-8-sig") as f:
+            rows = list(csv.DictReader(f))
+        assert sorted(row["Número do Processo"] for row in rows) == [
+            "0801234-56.2026.8.14.0301",
+            "0801234-56.2026.8.14.0302",
+        ]
+        with open(jsonl_path, "r", encoding="utf-8") as f:
+            records = [json.loads(line) for line in f]
+        assert len(records) == 2
+        assert os.path.exists(
+            os.path.join(tmp_path, "data", "json_exports", f"{file_name}.json")
+        )
+        assert not os.path.exists(
+            os.path.join(os.path.dirname(csv_path), "shards")
+        )
+
+    def test_full_chunks_are_exported_before_close(
+        self, scraper_config, sample_process, tmp_path
+    ):
+        """Test that a full shard chunk is sent to a worker right away."""
+        service = ShardedExportService(
+            config=scraper_config,
+            base_dir=str(tmp_path),
+            shards=1,
+            chunk_size=2,
+        )
+        other = replace(
+            sample_process,
+            number="08012345620268140302",
+            formatted_number="0801234-56.2026.8.14.0302",
+        )
+
+        service.export(sample_process)
+        service.export(sample_process)
+        assert service._buffers == {0: [sample_process]}
+        service.export(other)
+        assert service._buffers == {}
+        service._chunks[0][2].result()
+        assert service.load_movements(sample_process) == (
+            sample_process.movements
+        )
+
+        csv_path, _ = service.close()
+        with open(csv_path, "r", encoding="utf-8-sig") as f:
+            assert len(list(csv.DictReader(f))) == 2
+
+    def test_refresh_methods_match_export_service(
+        self, scraper_config, sample_process, tmp_path
+    ):
+        """Test the methods used by ProcessService in refresh mode."""
+        service = ShardedExportService(
+            config=scraper_config, base_dir=str(tmp_path), shards=2
+        )
+
+        assert service.get_file_name(sample_process) == (
+            ExportService.get_file_name(sample_process)
+        )
+        assert service.load_movements(sample_process) is None
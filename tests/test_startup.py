@@ -0,0 +1,68 @@
+"""Tests for the modules imported on CLI startup."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFERRED_MODULES = [
+    "pandas",
+    "numpy",
+    "multiprocessing",
+    "services.estimate_service",
+    "services.monitor_service",
+    "services.queue_worker",
+    "services.sharded_export_service",
+    "storage.work_queue",
+]
+
+
+def imported_modules(module: str) -> set:
+    """Return the modules loaded by importing a module in a new process."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys, {module}; print('\\n'.join(sys.modules))",
+        ],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+class TestStartup:
+    """Tests that heavy modules are only imported on use."""
+
+    def test_import_does_not_set_up_logging(self):
+        """Test that logging (and its log file) is only set up by main()."""
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import logging, main; "
+                "print(len(logging.getLogger('tjpa_scraper').handlers))",
+            ],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert result.stdout.strip() == "0"
+
+    @pytest.mark.parametrize(
+        "module",
+        ["main", "services.export_service"],
+    )
+    def test_heavy_modules_are_not_imported(self, module):
+        """Test that importing the CLI does not load deferred modules."""
+        loaded = imported_modules(module)
+
+        assert module in loaded
+        assert not loaded & set(DEFERRED_MODULES)
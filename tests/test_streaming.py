@@ -0,0 +1,151 @@
+"""Tests for the streaming process APIs."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from client.api_client import ApiClient
+from services.export_service import ExportService
+from services.movement_service import MovementService
+from services.process_service import ProcessService
+
+
+def make_page(start: int, count: int, total: int) -> dict:
+    """Return a paginated search response."""
+    return {
+        "qtdRegistrosTotal": total,
+        "listaResultado": [
+            {
+                "listaProcessos": [
+                    {
+                        "numero": f"{i:020d}",
+                        "cdDocProcesso": str(i),
+                        "cdInstancia": "1",
+                    }
+                    for i in range(start, start + count)
+                ]
+            }
+        ],
+    }
+
+
+class TestStreamProcesses:
+    """Tests for ProcessService.stream_processes."""
+
+    @pytest.fixture
+    def process_service(self, scraper_config):
+        """Return a ProcessService with mocked dependencies."""
+        client = MagicMock(spec=ApiClient)
+        client.config = scraper_config
+        client.get.side_effect = [
+            make_page(0, 2, 6),
+            make_page(2, 2, 6),
+            make_page(4, 2, 6),
+        ]
+        movement_service = MagicMock(spec=MovementService)
+        movement_service.get_movements.return_value = []
+        export_service = MagicMock(spec=ExportService)
+        return ProcessService(
+            api_client=client,
+            export_service=export_service,
+            movement_service=movement_service,
+        )
+
+    def test_limit_stops_pagination(self, process_service):
+        """Test that pages after the limit are never requested."""
+        processes = list(process_service.stream_processes("OAB:1PA", 3))
+
+        assert [p.number for p in processes] == [f"{i:020d}" for i in range(3)]
+        assert process_service.api_client.get.call_count == 2
+        assert process_service.export_service.export.call_count == 3
+
+    def test_processes_are_yielded_before_next_page(self, process_service):
+        """Test that the first process is ready after the first page."""
+        stream = process_service.stream_processes("OAB:1PA")
+
+        first = next(stream)
+
+        assert first.number == f"{0:020d}"
+        assert process_service.api_client.get.call_count == 1
+        process_service.export_service.export.assert_called_once_with(first)
+
+    def test_stream_without_limit_reads_every_page(self, process_service):
+        """Test that every page is read when there is no limit."""
+        assert len(list(process_service.stream_processes("OAB:1PA"))) == 6
+        assert process_service.api_client.get.call_count == 3
+
+    def test_overlapping_presearch_entries_read_every_page(
+        self, process_service
+    ):
+        """Test that a sub-search starting with seen processes goes on."""
+        process_service.api_client.get.side_effect = [
+            [
+                {"nome": "JOSE SILVA", "sistema": "PROJUDI"},
+                {"nome": "JOSÉ SILVA", "sistema": "PROJUDI"},
+            ],
+            make_page(0, 2, 2),
+            make_page(0, 2, 4),
+            make_page(2, 2, 4),
+        ]
+
+        processes = list(process_service.stream_processes("Jose Silva"))
+
+        assert [p.number for p in processes] == [f"{i:020d}" for i in range(4)]
+        assert process_service.api_client.get.call_count == 4
+
+
+class TestIterProcesses:
+    """Tests for ProcessService.iter_processes."""
+
+    @pytest.fixture
+    def process_service(self, scraper_config, sample_movement):
+        """Return a ProcessService with mocked dependencies."""
+        client = MagicMock(spec=ApiClient)
+        client.config = scraper_config
+        client.get.side_effect = [make_page(0, 2, 4), make_page(2, 2, 4)]
+        movement_service = MagicMock(spec=MovementService)
+        movement_service.get_movements.return_value = [sample_movement]
+        return ProcessService(
+            api_client=client,
+            export_service=MagicMock(spec=ExportService),
+            movement_service=movement_service,
+        )
+
+    def test_yields_populated_processes_without_export(
+        self, process_service, sample_movement
+    ):
+        """Test that processes come with movements and nothing is written."""
+        processes = list(process_service.iter_processes("OAB:1PA"))
+
+        assert len(processes) == 4
+        assert all(p.movements == [sample_movement] for p in processes)
+        process_service.export_service.export.assert_not_called()
+
+    def test_movements_are_optional(self, process_service):
+        """Test that movements are only fetched when asked for."""
+        processes = list(
+            process_service.iter_processes(
+                "OAB:1PA", fetch_movements=False, limit=1
+            )
+        )
+
+        assert processes[0].movements == []
+        process_service.movement_service.get_movements.assert_not_called()
+        assert process_service.api_client.get.call_count == 1
+
+    def test_export_each_plugs_export_in(
+        self, process_service, scraper_config, tmp_path
+    ):
+        """Test that the export consumer writes each yielded process."""
+        export_service = ExportService(
+            config=scraper_config, base_dir=str(tmp_path)
+        )
+
+        exported = list(
+            export_service.export_each(
+                process_service.iter_processes("OAB:1PA", limit=2)
+            )
+        )
+
+        assert len(exported) == 2
+        assert len(list(tmp_path.glob("data/json_exports/*.json"))) == 2
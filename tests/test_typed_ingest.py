@@ -0,0 +1,162 @@
+"""Tests for the numeric fields parsed at ingest and their filters."""
+
+from datetime import date
+
+import pytest
+
+from models.lazy_process import LazyProcess
+from models.movement import Movement
+from models.movement_batch import MovementBatch
+from models.process import Process
+from models.process_columns import ProcessColumns
+from utils.dates import format_date, parse_date, to_day
+from utils.money import format_cents, parse_cents
+
+
+class TestParsing:
+    """Tests for the date and money parsers."""
+
+    def test_parse_date(self):
+        """Test dates, dates with a time and invalid values."""
+        assert parse_date("15/03/2026") == date(2026, 3, 15).toordinal()
+        assert parse_date("15/03/2026 10:00") == parse_date("15/03/2026")
+        assert parse_date("31/02/2026") == 0
+        assert parse_date("15/03/20261") == 0
+        assert parse_date("") == 0
+        assert parse_date(None) == 0
+        assert format_date(parse_date("01/02/2026")) == "01/02/2026"
+
+    def test_to_day(self):
+        """Test the accepted forms of a day."""
+        ordinal = date(2026, 3, 15).toordinal()
+
+        assert to_day(ordinal) == to_day(date(2026, 3, 15)) == ordinal
+        assert to_day("15/03/2026") == ordinal
+        with pytest.raises(ValueError):
+            to_day("2026-03-15")
+
+    @pytest.mark.parametrize(
+        "value,cents",
+        [
+            ("R$ 100.000,00", 10_000_000),
+            ("R$ 1.234,5", 123_450),
+            ("R$\xa010,00", 1000),
+            ("R$ -10,00", -1000),
+            ("1234", 123_400),
+            ("", None),
+            (None, None),
+            ("R$ 12.34,00", None),
+            ("não informado", None),
+        ],
+    )
+    def test_parse_cents(self, value, cents):
+        """Test amounts with and without separators."""
+        assert parse_cents(value) == cents
+
+    def test_format_cents(self):
+        """Test that centavos are formatted like the API values."""
+        assert format_cents(10_000_000) == "R$ 100.000,00"
+        assert format_cents(-1050) == "R$ -10,50"
+
+
+class TestIngestFields:
+    """Tests for the fields parsed when the models are created."""
+
+    def test_process_fields(self, sample_process):
+        """Test that the dates and the cause value are parsed."""
+        assert sample_process.citation_day == date(2026, 1, 1).toordinal()
+        assert sample_process.distribution_day == sample_process.citation_day
+        assert sample_process.cause_value_cents == 10_000_000
+
+    def test_lazy_process_fields(self, sample_api_process_response):
+        """Test that lazy processes parse the same fields."""
+        eager = Process.from_dict(sample_api_process_response)
+        lazy = LazyProcess(sample_api_process_response)
+
+        assert lazy.citation_day == eager.citation_day
+        assert lazy.distribution_day == eager.distribution_day
+        assert lazy.cause_value_cents == eager.cause_value_cents
+
+    def test_movement_day(self):
+        """Test that movements keep the ordinal of their date."""
+        movement = Movement("15/03/2026 10:00", "Juntada")
+
+        assert movement.day == date(2026, 3, 15).toordinal()
+        assert movement == Movement("15/03/2026 10:00", "Juntada")
+
+    def test_batch_since(self):
+        """Test the movements since a day of a batch."""
+        batch = MovementBatch.from_movements(
+            [
+                Movement("01/03/2026", "a"),
+                Movement("15/03/2026 10:00", "b"),
+                Movement("20/03/2026", "c"),
+            ]
+        )
+
+        recent = batch.since("15/03/2026")
+
+        assert [m.description for m in recent] == ["b", "c"]
+        assert recent[0].date == "15/03/2026 10:00"
+        assert batch.latest_day() == date(2026, 3, 20).toordinal()
+
+
+def make_process(number, distribution_date, cause_value, movement_date):
+    """Return a process with the given dates and cause value."""
+    movements = [Movement(movement_date, "Juntada")] if movement_date else []
+    return Process(
+        formatted_number=number,
+        number=number,
+        class_="",
+        topic="",
+        cd_doc_process="1",
+        cd_instance="1",
+        parties=[],
+        movements=movements,
+        cause_value=cause_value,
+        distribution_date=distribution_date,
+    )
+
+
+class TestProcessColumns:
+    """Tests for the vectorized process filters."""
+
+    @pytest.fixture
+    def columns(self):
+        """Return the columns of four processes."""
+        return ProcessColumns.from_processes(
+            [
+                make_process("1", "10/01/2026", "R$ 500,00", "01/02/2026"),
+                make_process("2", "20/01/2026", "R$ 5.000,00", None),
+                make_process("3", "", "", "01/03/2026"),
+                make_process("4", "05/02/2026", "R$ 50.000,00", "02/03/2026"),
+            ]
+        )
+
+    def test_date_filters(self, columns):
+        """Test the distribution range and the movements since a day."""
+        distributed = columns.distributed_between("15/01/2026", "28/02/2026")
+
+        assert [p.number for p in columns.select(distributed)] == ["2", "4"]
+        assert [
+            p.number for p in columns.select(columns.moved_since("01/03/2026"))
+        ] == ["3", "4"]
+
+    def test_cause_value_filter_and_combination(self, columns):
+        """Test the cause value range and combined masks."""
+        mask = columns.cause_value_between(minimum="R$ 1.000,00")
+        combined = mask & columns.moved_since(date(2026, 1, 1))
+
+        assert [p.number for p in columns.select(mask)] == ["2", "4"]
+        assert [p.number for p in columns.select(combined)] == ["4"]
+        assert [
+            p.number for p in columns.select(columns.cause_value_between())
+        ] == ["1", "2", "4"]
+
+    def test_sort_by(self, columns):
+        """Test stable sorting in both directions."""
+        ascending = columns.sort_by("distribution_day")
+        descending = columns.sort_by("cause_value_cents", descending=True)
+
+        assert [p.number for p in ascending] == ["3", "1", "2", "4"]
+        assert [p.number for p in descending] == ["4", "2", "1", "3"]
@@ -0,0 +1,222 @@
+"""Tests for the SQLite work queue and its worker."""
+
+import os
+import tempfile
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from services.export_service import ExportService
+from services.movement_service import MovementService
+from services.process_service import ProcessService, SearchPage
+from services.queue_worker import PAGE, PROCESS, QUERY, QueueWorker
+from storage.work_queue import DONE, FAILED, PENDING, WorkQueue
+
+
+@pytest.fixture
+def queue():
+    """Return a WorkQueue stored in a temporary directory."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield WorkQueue(path=os.path.join(tmpdir, "queue.db"), max_attempts=2)
+
+
+class TestWorkQueue:
+    """Tests for WorkQueue."""
+
+    def test_put_deduplicates_by_key(self, queue):
+        """Test that tasks with the same key are added once."""
+        assert queue.put(QUERY, {"query": "a"}, "a") is True
+        assert queue.put(QUERY, {"query": "a"}, "a") is False
+        assert queue.counts()[PENDING] == 1
+
+    def test_lease_by_priority_then_age(self, queue):
+        """Test that lower priorities are leased first, oldest first."""
+        queue.put(PAGE, {"n": 1}, priority=1)
+        queue.put(PAGE, {"n": 2}, priority=1)
+        queue.put(QUERY, {"n": 3}, priority=0)
+
+        assert [queue.lease("w1").payload["n"] for _ in range(3)] == [3, 1, 2]
+
+    def test_requeued_task_moves_up(self, queue):
+        """Test that a duplicate with a higher priority raises the task."""
+        queue.put(PROCESS, {"n": 1}, "p1", priority=1)
+        queue.put(PROCESS, {"n": 2}, "p2", priority=1)
+
+        assert queue.put(PROCESS, {"n": 2}, "p2", priority=0) is False
+        task = queue.lease("w1")
+        assert (task.payload["n"], task.priority) == (2, 0)
+
+    def test_lease_is_exclusive(self, queue):
+        """Test that a leased task is not handed to another worker."""
+        queue.put(QUERY, {"query": "a"})
+
+        task = queue.lease("w1")
+
+        assert task.payload == {"query": "a"}
+        assert queue.lease("w2") is None
+
+    def test_complete(self, queue):
+        """Test that a completed task is not leased again."""
+        queue.put(QUERY, {"query": "a"})
+        task = queue.lease("w1")
+
+        assert queue.complete(task, "w1") is True
+        assert queue.counts()[DONE] == 1
+        assert queue.lease("w1") is None
+
+    def test_expired_lease_is_recovered(self, queue):
+        """Test crash recovery through lease expiry."""
+        queue.put(QUERY, {"query": "a"})
+        task = queue.lease("w1")
+
+        with patch("storage.work_queue.time.time") as mock_time:
+            mock_time.return_value = 10**12
+            recovered = queue.lease("w2")
+            assert recovered.id == task.id
+            assert queue.complete(task, "w1") is False
+            assert queue.complete(recovered, "w2") is True
+
+    def test_fail_retries_until_max_attempts(self, queue):
+        """Test that failed tasks are retried and then given up."""
+        queue.put(QUERY, {"query": "a"})
+
+        queue.fail(queue.lease("w1"), "w1", "boom")
+        assert queue.counts()[PENDING] == 1
+
+        queue.fail(queue.lease("w1"), "w1", "boom")
+        assert queue.counts()[FAILED] == 1
+        assert queue.lease("w1") is None
+
+    def test_shared_between_instances(self, queue):
+        """Test that two instances on the same file see the same tasks."""
+        queue.put(QUERY, {"query": "a"})
+        other = WorkQueue(path=queue.path)
+
+        assert other.lease("w2") is not None
+        assert queue.lease("w1") is None
+
+
+class TestQueueWorker:
+    """Tests for QueueWorker."""
+
+    @pytest.fixture
+    def process_service(self):
+        """Return a mocked ProcessService."""
+        service = MagicMock(spec=ProcessService)
+        service.movement_service = MagicMock(spec=MovementService)
+        service.movement_service.get_movements.return_value = []
+        service.export_service = MagicMock(spec=ExportService)
+        return service
+
+    @pytest.fixture
+    def worker(self, queue, process_service):
+        """Return a QueueWorker."""
+        return QueueWorker(
+            queue=queue, process_service=process_service, worker_id="w1"
+        )
+
+    def test_enqueue_skips_invalid_queries(self, worker, queue):
+        """Test that only classifiable queries are queued."""
+        assert worker.enqueue_queries(["OAB:123PA", "???", "OAB:123PA"]) == 1
+
+    def test_presearch_fans_out_to_pages_and_processes(
+        self, worker, queue, process_service, sample_api_process_response
+    ):
+        """Test the full query -> page -> process flow."""
+        process_service.fetch_search_page.side_effect = [
+            SearchPage(presearch=[{"nome": "JOSE", "sistema": "PROJUDI"}]),
+            SearchPage(
+                processes=[sample_api_process_response],
+                total_records=1,
+                paginated=True,
+            ),
+        ]
+        worker.enqueue_queries(["Jose Antonio"])
+
+        assert worker.run() == 3
+
+        page_call = process_service.fetch_search_page.call_args_list[1]
+        assert page_call[0] == ("JOSE", "PROJUDI", 1, None)
+        process_service.export_service.export.assert_called_once()
+        assert queue.counts()[DONE] == 3
+
+    def test_paginated_search_queues_next_page(
+        self, worker, queue, process_service, sample_api_process_response
+    ):
+        """Test that further pages become page tasks."""
+        other = {**sample_api_process_response, "numero": "2"}
+        process_service.fetch_search_page.side_effect = [
+            SearchPage(
+                processes=[sample_api_process_response],
+                total_records=2,
+                paginated=True,
+            ),
+            SearchPage(processes=[other], total_records=2, paginated=True),
+        ]
+        queue.put(
+            PAGE,
+            {
+                "query": "q",
+                "request_data": "Jose Antonio",
+                "system_name": "PROJUDI",
+                "page_number": 1,
+                "page_size": 1,
+            },
+        )
+
+        worker.run()
+
+        assert process_service.fetch_search_page.call_count == 2
+        assert process_service.export_service.export.call_count == 2
+
+    def test_same_process_from_two_queries_is_exported_once(
+        self, worker, queue, process_service, sample_api_process_response
+    ):
+        """Test that process tasks are deduplicated by identity."""
+        process_service.fetch_search_page.return_value = SearchPage(
+            processes=[sample_api_process_response]
+        )
+        worker.enqueue_queries(["OAB:123PA", "12345678909"])
+
+        worker.run()
+
+        process_service.export_service.export.assert_called_once()
+
+    def test_lost_lease_skips_export(
+        self, worker, queue, process_service, sample_api_process_response
+    ):
+        """Test that a worker without lease does not export."""
+        queue.put(
+            PROCESS, {"query": "q", "process": sample_api_process_response}
+        )
+        task = queue.lease("w1")
+
+        with patch.object(queue, "renew", return_value=False):
+            worker.handle(task)
+
+        process_service.export_service.export.assert_not_called()
+
+    def test_cnj_query_overtakes_queued_crawl(
+        self, worker, queue, process_service, sample_api_process_response
+    ):
+        """Test that interactive tasks are leased before bulk ones."""
+        process_service.fetch_search_page.return_value = SearchPage(
+            processes=[sample_api_process_response]
+        )
+        worker.enqueue_queries(["OAB:123PA"])
+        worker.run(max_tasks=1)
+        worker.enqueue_queries(["0801234-79.2026.8.14.0301"])
+
+        task = queue.lease("w2")
+
+        assert task.kind == QUERY
+        assert task.payload["query"] == "0801234-79.2026.8.14.0301"
+
+    def test_failed_task_is_released(self, worker, queue, process_service):
+        """Test that errors put the task back for a retry."""
+        process_service.fetch_search_page.side_effect = OSError("boom")
+        worker.enqueue_queries(["OAB:123PA"])
+
+        worker.run(max_tasks=1)
+
+        assert queue.counts()[PENDING] == 1
@@ -0,0 +1,60 @@
+"""Conversion of the API ``dd/mm/yyyy`` dates to day ordinals."""
+
+from datetime import date
+from functools import lru_cache
+from typing import Optional, Union
+
+Day = Union[int, date, str]
+"""A day given as an ordinal, a ``date`` or a ``dd/mm/yyyy`` string."""
+
+
+@lru_cache(maxsize=65536)
+def parse_date(value: Optional[str]) -> int:
+    """
+    Return the day ordinal of a value starting with a ``dd/mm/yyyy`` date.
+
+    Ordinals (``date.toordinal``) are small integers that sort and compare
+    like the dates, so they can be stored in compact arrays. A time after
+    the date (``"15/03/2026 10:00"``) is ignored.
+
+    Returns:
+        The ordinal, or 0 if the value does not start with a valid date
+    """
+    if (
+        not value
+        or len(value) < 10
+        or value[2] != "/"
+        or value[5] != "/"
+        or (len(value) > 10 and value[10] != " ")
+    ):
+        return 0
+    try:
+        return date(
+            int(value[6:10]), int(value[3:5]), int(value[:2])
+        ).toordinal()
+    except ValueError:
+        return 0
+
+
+@lru_cache(maxsize=65536)
+def format_date(ordinal: int) -> str:
+    """Return a day ordinal in the ``dd/mm/yyyy`` form."""
+    day = date.fromordinal(ordinal)
+    return f"{day.day:02d}/{day.month:02d}/{day.year:04d}"
+
+
+def to_day(value: Day) -> int:
+    """
+    Return the ordinal of a day given in any of the ``Day`` forms.
+
+    Raises:
+        ValueError: If a string is not a ``dd/mm/yyyy`` date
+    """
+    if isinstance(value, date):
+        return value.toordinal()
+    if isinstance(value, str):
+        day = parse_date(value)
+        if not day:
+            raise ValueError(f"Invalid date: '{value}'")
+        return day
+    return int(value)
@@ -0,0 +1,44 @@
+"""File helpers shared by the persistent stores."""
+
+import json
+import os
+import tempfile
+from typing import Any
+
+
+def load_json(path: str, default: Any = None) -> Any:
+    """
+    Load a JSON document from disk.
+
+    Args:
+        path: File to read
+        default: Value returned when the file is missing or unreadable
+
+    Returns:
+        The decoded document, or ``default``
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return default
+
+
+def write_json_atomic(path: str, data: Any) -> None:
+    """
+    Write a JSON document so readers never observe a partial file.
+
+    The content is written to a temporary file in the same directory and
+    then moved over the destination with ``os.replace``.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
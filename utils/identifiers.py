@@ -0,0 +1,72 @@
+"""Check-digit validation and normalization of CNJ, CPF and CNPJ numbers."""
+
+import re
+
+CNJ_CHECK_DIGITS = "cnj_check_digits"
+CPF_CHECK_DIGITS = "cpf_check_digits"
+CNPJ_CHECK_DIGITS = "cnpj_check_digits"
+
+_NON_DIGITS = re.compile(r"\D")
+_CNPJ_WEIGHTS = (6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+
+
+def only_digits(value: str) -> str:
+    """Return the digits of a value, dropping any mask characters."""
+    return _NON_DIGITS.sub("", value)
+
+
+def cnj_check_digits(digits: str) -> str:
+    """
+    Compute the check digits of a CNJ number (ISO 7064 mod 97-10).
+
+    Args:
+        digits: The 20 digits of the number, check digits included (their
+            value is ignored)
+
+    Returns:
+        The two expected check digits
+    """
+    base = digits[:7] + digits[9:]
+    return f"{98 - int(base + '00') % 97:02d}"
+
+
+def is_valid_cnj(value: str) -> bool:
+    """Check the format and check digits of a CNJ number."""
+    digits = only_digits(value)
+    return len(digits) == 20 and digits[7:9] == cnj_check_digits(digits)
+
+
+def format_cnj(value: str) -> str:
+    """Return a CNJ number in the ``NNNNNNN-DD.AAAA.J.TR.OOOO`` form."""
+    d = only_digits(value)
+    return f"{d[:7]}-{d[7:9]}.{d[9:13]}.{d[13]}.{d[14:16]}.{d[16:]}"
+
+
+def is_valid_cpf(value: str) -> bool:
+    """Check the format and verifier digits of a CPF number."""
+    digits = only_digits(value)
+    if len(digits) != 11 or len(set(digits)) == 1:
+        return False
+    for position in (9, 10):
+        total = sum(
+            int(digit) * weight
+            for digit, weight in zip(digits, range(position + 1, 1, -1))
+        )
+        if (total * 10) % 11 % 10 != int(digits[position]):
+            return False
+    return True
+
+
+def is_valid_cnpj(value: str) -> bool:
+    """Check the format and verifier digits of a CNPJ number."""
+    digits = only_digits(value)
+    if len(digits) != 14 or len(set(digits)) == 1:
+        return False
+    for position in (12, 13):
+        weights = _CNPJ_WEIGHTS[13 - position :]
+        total = sum(int(d) * w for d, w in zip(digits, weights))
+        remainder = total % 11
+        expected = 0 if remainder < 2 else 11 - remainder
+        if expected != int(digits[position]):
+            return False
+    return True
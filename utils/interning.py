@@ -0,0 +1,97 @@
+"""Dictionary encoding of repetitive string values."""
+
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+
+@dataclass
+class StringDictionary:
+    """
+    Shares one string object per distinct value and gives it a code.
+
+    Values repeated across processes (classes, topics, courts, party types,
+    movement descriptions...) are parsed from JSON as separate strings;
+    interning keeps only the first copy. Codes are dense integers, so
+    exporters can dictionary-encode values with ``encode``/``decode``.
+
+    Once ``max_entries`` distinct values are stored, new values are returned
+    as they are, so free-text fields cannot grow the dictionary unbounded.
+    Hit and miss counts are statistics only and are not locked.
+    """
+
+    max_entries: int = 1_000_000
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+    _codes: Dict[str, int] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _values: List[str] = field(default_factory=list, init=False, repr=False)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+
+    def intern(self, value: Optional[str]) -> Optional[str]:
+        """Return the shared copy of ``value``."""
+        if value is None:
+            return None
+        code = self._codes.get(value)
+        if code is not None:
+            self.hits += 1
+            return self._values[code]
+        code = self.__insert__(value)
+        return value if code is None else self._values[code]
+
+    def encode(self, value: str) -> int:
+        """
+        Return the code of a value, adding it if needed.
+
+        Raises:
+            OverflowError: If the dictionary is full and the value is new
+        """
+        code = self._codes.get(value)
+        if code is None:
+            code = self.__insert__(value)
+            if code is None:
+                raise OverflowError("StringDictionary is full")
+        return code
+
+    def decode(self, code: int) -> str:
+        """Return the value of a code."""
+        return self._values[code]
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of interned values that were already known."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        """Return the size and hit statistics of the dictionary."""
+        return {
+            "entries": len(self._values),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+    def __insert__(self, value: str) -> Optional[int]:
+        with self._lock:
+            code = self._codes.get(value)
+            if code is not None:
+                self.hits += 1
+                return code
+            self.misses += 1
+            if len(self._values) >= self.max_entries:
+                return None
+            code = len(self._values)
+            self._values.append(value)
+            self._codes[value] = code
+            return code
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+shared_strings = StringDictionary()
+"""Dictionary used by the models' ``from_dict`` and by exporters."""
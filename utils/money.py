@@ -0,0 +1,37 @@
+"""Conversion of the API ``R$ 100.000,00`` values to integer centavos."""
+
+import re
+from typing import Optional
+
+_MONEY = re.compile(
+    r"\s*(?:R\$)?\s*(-)?\s*(\d{1,3}(?:\.\d{3})*|\d+)(?:,(\d{1,2}))?\s*",
+    re.ASCII,
+)
+
+
+def parse_cents(value: Optional[str]) -> Optional[int]:
+    """
+    Return a ``R$ 1.234,56`` value in centavos.
+
+    Integers keep exact amounts and sort and compare like the values.
+
+    Returns:
+        The value in centavos, or None if the value is not an amount
+    """
+    if not value:
+        return None
+    match = _MONEY.fullmatch(value.replace("\xa0", " "))
+    if match is None:
+        return None
+    sign, reais, cents = match.groups()
+    total = int(reais.replace(".", "")) * 100 + int(
+        (cents or "0").ljust(2, "0")
+    )
+    return -total if sign else total
+
+
+def format_cents(cents: int) -> str:
+    """Return centavos in the ``R$ 1.234,56`` form."""
+    reais = f"{abs(cents) // 100:,}".replace(",", ".")
+    sign = "-" if cents < 0 else ""
+    return f"R$ {sign}{reais},{abs(cents) % 100:02d}"
@@ -0,0 +1,64 @@
+"""Token bucket used to keep requests within a global budget."""
+
+import threading
+import time
+from dataclasses import dataclass, field
+
+
+@dataclass
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Tokens are refilled continuously at ``rate`` tokens per second up to
+    ``capacity``. ``acquire`` blocks until enough tokens are available.
+
+    Attributes:
+        rate: Tokens added per second
+        capacity: Maximum number of tokens (burst size)
+    """
+
+    rate: float
+    capacity: float = 1.0
+    _tokens: float = field(default=None, init=False, repr=False)
+    _updated: float = field(default=0.0, init=False, repr=False)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+
+    def __post_init__(self):
+        if self.rate <= 0:
+            raise ValueError("rate must be positive")
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    @classmethod
+    def per_hour(cls, requests: float, burst: float = 1.0) -> "TokenBucket":
+        """Create a bucket allowing ``requests`` tokens per hour."""
+        return cls(rate=requests / 3600.0, capacity=burst)
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens if available.
+
+        Returns:
+            0 if the tokens were taken, otherwise the seconds to wait
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.rate
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """Block until ``tokens`` tokens are taken from the bucket."""
+        while True:
+            wait_time = self.try_acquire(tokens)
+            if wait_time == 0:
+                return
+            time.sleep(wait_time)